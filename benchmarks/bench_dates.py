@@ -0,0 +1,57 @@
+"""Benchmark du tri d'une saison par coup d'envoi
+
+Compare le tri historique (date et heure reparsées avec strptime à chaque
+comparaison de clé) au tri sur Match.kickoff (conversion en cache) et à
+l'argsort d'une colonne kickoff_array (numpy).
+
+Usage:
+    python benchmarks/bench_dates.py
+"""
+
+import json
+from datetime import datetime
+
+from common import bench, load_match_payloads
+
+from fffdata.dates import kickoff_array, sort_by_kickoff
+from fffdata.models import Match
+
+
+def saison(payloads, n: int):
+    """Génère n matchs répartis sur une saison à partir des réponses enregistrées"""
+    matchs = []
+    for i in range(n):
+        data = json.loads(payloads[i % len(payloads)])
+        data["ma_no"] += i
+        data["date"] = f"2024-{1 + i % 12:02d}-{1 + i % 28:02d}T00:00:00+00:00"
+        data["time"] = ("15H00", "18H30", "20H45")[i % 3]
+        matchs.append(Match.from_dict(data))
+    return matchs
+
+
+def strptime_key(match: Match) -> datetime:
+    return datetime.strptime(f"{match.date[:10]} {match.time}", "%Y-%m-%d %HH%M")
+
+
+def main(n: int = 5000):
+    matchs = saison(load_match_payloads(), n)
+    print(f"{n} matchs\n")
+
+    attendu = [m.ma_no for m in sorted(matchs, key=strptime_key)]
+    assert [m.ma_no for m in sort_by_kickoff(matchs)] == attendu
+
+    print("Tri par coup d'envoi :")
+    reference = bench("sorted(key=strptime)", lambda: sorted(matchs, key=strptime_key), number=10)
+    temps = bench("sort_by_kickoff (Match.kickoff)", lambda: sort_by_kickoff(matchs), number=10)
+    print(f"  {'':<45} x{reference / temps:.1f}")
+
+    def argsort():
+        ordre = kickoff_array([m.date for m in matchs], [m.time for m in matchs]).argsort(kind="stable")
+        return [matchs[i] for i in ordre]
+
+    temps = bench("kickoff_array + argsort", argsort, number=10)
+    print(f"  {'':<45} x{reference / temps:.1f}")
+
+
+if __name__ == "__main__":
+    main()
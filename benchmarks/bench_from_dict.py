@@ -0,0 +1,47 @@
+"""Benchmark des from_dict générés par schéma
+
+Compare les parseurs générés (fffdata.models.schema) aux from_dict écrits à la
+main qu'ils remplacent (copie dans legacy_parsers.py), sur les mêmes réponses
+match_entities déjà décodées, puis la construction d'un Match complet à une
+projection sur quelques champs (fields=... des clients).
+
+Usage:
+    python benchmarks/bench_from_dict.py
+"""
+
+import json
+
+import legacy_parsers
+from common import bench, load_match_payloads
+
+from fffdata.models import Match, MatchMembre, Team, projection
+
+
+def main():
+    payloads = [json.loads(body) for body in load_match_payloads()]
+    for data in payloads:
+        assert Match.from_dict(data) == legacy_parsers.match(data)
+
+    equipes = [data["home"] for data in payloads]
+    membres = [m for data in payloads for m in data.get("match_membres") or []]
+
+    cas = [
+        ("Match", payloads, legacy_parsers.match, Match.from_dict),
+        ("Team", equipes, legacy_parsers.team, Team.from_dict),
+        ("MatchMembre", membres, legacy_parsers.match_membre, MatchMembre.from_dict),
+    ]
+    for nom, donnees, manuel, genere in cas:
+        print(f"{nom} ({len(donnees)} objets par itération) :")
+        reference = bench("from_dict écrit à la main", lambda: [manuel(d) for d in donnees])
+        temps = bench("from_dict généré", lambda: [genere(d) for d in donnees])
+        print(f"  {'':<45} x{reference / temps:.2f}\n")
+
+    ticker = projection(Match, ("ma_no", "home_score", "away_score", "status"))
+    print(f"Match complet ou projection ({len(payloads)} matchs par itération) :")
+    reference = bench("Match.from_dict", lambda: [Match.from_dict(d) for d in payloads])
+    temps = bench("projection (4 champs)", lambda: [ticker(d) for d in payloads])
+    print(f"  {'':<45} x{reference / temps:.2f}")
+
+
+if __name__ == "__main__":
+    main()
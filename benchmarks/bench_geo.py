@@ -0,0 +1,54 @@
+"""Benchmark de l'index spatial
+
+Compare, sur des terrains répartis sur la France métropolitaine, le parcours
+linéaire avec haversine aux recherches par rayon et des k plus proches de
+GeoIndex.
+
+Usage:
+    python benchmarks/bench_geo.py
+"""
+
+import random
+
+from common import bench
+
+from fffdata.geo import GeoIndex, TERRAIN, haversine
+
+
+def main(n: int = 30000):
+    rng = random.Random(0)
+    terrains = [
+        ((TERRAIN, te_no), rng.uniform(42.5, 51.0), rng.uniform(-4.5, 8.0))
+        for te_no in range(1, n + 1)
+    ]
+    index = GeoIndex()
+    for key, lat, lon in terrains:
+        index.add(key, lat, lon)
+    centre = (45.44, 4.39)  # Saint-Étienne
+    print(f"{n} terrains\n")
+
+    def scan_rayon():
+        return sorted(
+            (d, key) for key, lat, lon in terrains
+            if (d := haversine(*centre, lat, lon)) <= 20
+        )
+
+    def scan_knn():
+        return sorted((haversine(*centre, lat, lon), key) for key, lat, lon in terrains)[:10]
+
+    assert index.within(*centre, 20) == scan_rayon()
+    assert index.nearest(*centre, 10) == scan_knn()
+
+    print("Terrains à moins de 20 km :")
+    reference = bench("parcours linéaire", scan_rayon, number=5)
+    temps = bench("GeoIndex.within", lambda: index.within(*centre, 20), number=500)
+    print(f"  {'':<45} x{reference / temps:.0f}\n")
+
+    print("10 terrains les plus proches :")
+    reference = bench("parcours linéaire", scan_knn, number=5)
+    temps = bench("GeoIndex.nearest", lambda: index.nearest(*centre, 10), number=500)
+    print(f"  {'':<45} x{reference / temps:.0f}")
+
+
+if __name__ == "__main__":
+    main()
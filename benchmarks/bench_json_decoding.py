@@ -0,0 +1,52 @@
+"""Benchmark du décodage JSON des réponses match_entities
+
+Compare le chemin historique (texte puis json, comme response.json()) aux
+décodeurs de fffdata.decoders, qui travaillent directement sur les octets.
+
+Usage:
+    python benchmarks/bench_json_decoding.py
+"""
+
+import json
+
+from common import bench, load_match_payloads
+
+from fffdata.decoders import get_decoder, orjson
+from fffdata.models import Match
+
+
+def main():
+    payloads = load_match_payloads()
+    print(f"{len(payloads)} réponses match_entities, {sum(map(len, payloads))} octets au total\n")
+
+    def texte_puis_json():
+        for body in payloads:
+            json.loads(body.decode("utf-8"))
+
+    decodeurs = {"json (octets)": get_decoder("json")}
+    if orjson is not None:
+        decodeurs["orjson (octets)"] = get_decoder("orjson")
+    else:
+        print("  orjson non installé : pip install fffdata[fast]\n")
+
+    print("Décodage seul :")
+    reference = bench("json (texte, comme response.json())", texte_puis_json)
+    for label, decode in decodeurs.items():
+        temps = bench(label, lambda decode=decode: [decode(body) for body in payloads])
+        print(f"  {'':<45} x{reference / temps:.2f}")
+
+    print("\nDécodage + Match.from_dict :")
+    reference = bench(
+        "json (texte)",
+        lambda: [Match.from_dict(json.loads(body.decode("utf-8"))) for body in payloads]
+    )
+    for label, decode in decodeurs.items():
+        temps = bench(
+            label,
+            lambda decode=decode: [Match.from_dict(decode(body)) for body in payloads]
+        )
+        print(f"  {'':<45} x{reference / temps:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Benchmark de l'hydratation paresseuse
+
+Compare le coût d'un parcours qui ne lit que quelques champs (numéro, scores,
+date) avec des Match construits entièrement et avec des LazyMatch.
+
+Ordre de grandeur mesuré : environ x2.5 pour la lecture des seuls scalaires,
+et environ x1 (aucun gain) quand les équipes et la compétition sont lues.
+
+Usage:
+    python benchmarks/bench_lazy.py
+"""
+
+import json
+
+from common import bench, load_match_payloads
+
+from fffdata.models import Match
+
+
+def main():
+    payloads = [json.loads(body) for body in load_match_payloads()]
+
+    def scan(lazy):
+        for data in payloads:
+            match = Match.from_dict(data, lazy=lazy)
+            match.ma_no, match.home_score, match.away_score, match.date
+
+    def scan_complet(lazy):
+        for data in payloads:
+            match = Match.from_dict(data, lazy=lazy)
+            match.home.short_name, match.away.short_name, match.competition.name
+
+    print(f"{len(payloads)} matchs par itération\n")
+    print("Lecture de ma_no, scores et date :")
+    eager = bench("Match.from_dict", lambda: scan(False))
+    lazy = bench("Match.from_dict(lazy=True)", lambda: scan(True))
+    print(f"  {'':<45} x{eager / lazy:.2f}")
+
+    print("\nLecture des équipes et de la compétition :")
+    eager = bench("Match.from_dict", lambda: scan_complet(False))
+    lazy = bench("Match.from_dict(lazy=True)", lambda: scan_complet(True))
+    print(f"  {'':<45} x{eager / lazy:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark de l'empreinte mémoire des modèles
+
+Mesure le nombre d'octets par Match pour des dataclasses classiques (avec
+__dict__ par instance), pour les modèles à __slots__, et pour ces modèles parsés
+avec un IdentityMap (sous-entités partagées, chaînes internées), à partir des
+mêmes réponses enregistrées.
+
+Usage:
+    python benchmarks/bench_memory.py [nombre_de_matchs]
+"""
+
+import json
+import sys
+from dataclasses import fields, is_dataclass, make_dataclass
+
+from common import load_match_payloads
+
+from fffdata.models import IdentityMap, Match
+
+_LEAVES = (str, int, float, bool, type(None))
+
+
+def avec_dict(obj, classes):
+    """Copie un arbre de modèles dans des dataclasses classiques (avec __dict__)"""
+    if isinstance(obj, list):
+        return [avec_dict(o, classes) for o in obj]
+    if not is_dataclass(obj):
+        return obj
+    cls = type(obj)
+    if cls not in classes:
+        classes[cls] = make_dataclass(cls.__name__, [(f.name, f.type) for f in fields(cls)])
+    return classes[cls](*(avec_dict(getattr(obj, f.name), classes) for f in fields(cls)))
+
+
+def taille(racines):
+    """Taille totale en octets des objets atteignables, chaque objet compté une fois
+
+    Returns:
+        Tuple (octets des objets structurels, octets des valeurs feuilles)
+    """
+    vus = set()
+    structure = feuilles = 0
+    pile = list(racines)
+    while pile:
+        obj = pile.pop()
+        if id(obj) in vus:
+            continue
+        vus.add(id(obj))
+        if isinstance(obj, _LEAVES):
+            feuilles += sys.getsizeof(obj)
+            continue
+        structure += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            pile.extend(obj.keys())
+            pile.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            pile.extend(obj)
+        else:
+            if hasattr(obj, "__dict__"):
+                structure += sys.getsizeof(obj.__dict__)
+            pile.extend(getattr(obj, f.name) for f in fields(obj))
+    return structure, feuilles
+
+
+def charger(payloads, n, context=None):
+    """Parse n matchs à partir des réponses enregistrées (ma_no distincts)"""
+    matchs = []
+    for i in range(n):
+        data = json.loads(payloads[i % len(payloads)])
+        data["ma_no"] += i
+        matchs.append(Match.from_dict(data, context=context))
+    return matchs
+
+
+def main(n: int = 10000):
+    payloads = load_match_payloads()
+    matchs = charger(payloads, n)
+    matchs_partages = charger(payloads, n, IdentityMap())
+
+    classes = {}
+    matchs_dict = [avec_dict(m, classes) for m in matchs]
+
+    print(f"{n} matchs\n")
+    print(f"  {'':<28} {'structure':>12} {'total':>12}   (octets / Match)")
+    resultats = {}
+    for label, objets in [
+        ("dataclass (__dict__)", matchs_dict),
+        ("__slots__", matchs),
+        ("__slots__ + IdentityMap", matchs_partages),
+    ]:
+        structure, feuilles = taille(objets)
+        resultats[label] = structure + feuilles
+        print(f"  {label:<28} {structure / n:12.0f} {(structure + feuilles) / n:12.0f}")
+
+    reference = resultats["dataclass (__dict__)"]
+    print()
+    for label in ("__slots__", "__slots__ + IdentityMap"):
+        print(f"  Gain total {label:<28} {1 - resultats[label] / reference:.0%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,71 @@
+"""Benchmark de la recherche de clubs par nom
+
+Compare, sur un annuaire synthétique de la taille de celui des clubs français,
+le parcours de tous les noms avec difflib à SearchIndex, pour une requête
+exacte, un sigle, un préfixe et une requête avec faute de frappe, puis mesure
+les requêtes faites de mots fréquents ("stade", "fc", une seule lettre).
+
+Usage:
+    python benchmarks/bench_search.py
+"""
+
+import difflib
+import random
+
+from common import bench
+
+from fffdata.search import CLUB, SearchIndex, normalize
+
+FORMES = ["AS", "FC", "US", "ES", "AC", "SC", "CS", "JS", "Olympique", "Stade", "Entente", "Racing Club"]
+SYLLABES = ["mont", "ville", "saint", "bourg", "la", "val", "ber", "cha", "teau", "ro", "mar", "sur",
+            "lin", "neuf", "fon", "taine", "pie", "rre", "gen", "nes", "lis", "beau", "ray", "vi"]
+
+
+def annuaire(n: int, rng: random.Random):
+    """n clubs (cl_no, nom, nom court) aux noms plausibles"""
+    clubs = [(500100, "Association Sportive de Saint-Étienne", "AS Saint-Étienne")]
+    for cl_no in range(1, n):
+        ville = "".join(rng.choice(SYLLABES) for _ in range(rng.randint(2, 4))).capitalize()
+        forme = rng.choice(FORMES)
+        clubs.append((cl_no, f"{forme} {ville}", f"{forme} {ville[:12]}"))
+    return clubs
+
+
+def main(n: int = 15000):
+    rng = random.Random(0)
+    clubs = annuaire(n, rng)
+    index = SearchIndex()
+    for cl_no, nom, court in clubs:
+        index.add((CLUB, cl_no), nom, court)
+    print(f"{n} clubs\n")
+
+    noms = [(normalize(nom), cl_no) for cl_no, *libelles in clubs for nom in libelles]
+
+    def difflib_scan(requete):
+        q = normalize(requete)
+        return max(noms, key=lambda n: difflib.SequenceMatcher(None, q, n[0]).ratio())[1]
+
+    requetes = {
+        "exacte": "AS St Etienne",
+        "sigle": "ASSE",
+        "préfixe": "as saint-eti",
+        "faute de frappe": "AS Saint Etiene",
+    }
+    for label, requete in requetes.items():
+        assert index.search(requete)[0][1] == (CLUB, 500100), label
+
+    reference = bench("difflib sur tous les noms", lambda: difflib_scan("AS Saint Etiene"), number=1, repeat=3)
+    print()
+    for label, requete in requetes.items():
+        temps = bench(f"SearchIndex.search ({label})", lambda: index.search(requete), number=200)
+        print(f"  {'':<45} x{reference / temps:.0f}")
+    print()
+    # Mots fréquents : le nombre de noms comparés reste borné (MAX_CANDIDATES)
+    for requete in ("stade", "as", "fc mont", "a"):
+        bench(f"SearchIndex.search (mot fréquent '{requete}')", lambda: index.search(requete), number=200)
+    for requete in ("olymp", "fc", "s"):
+        bench(f"SearchIndex.prefix (autocomplétion '{requete}')", lambda: index.prefix(requete), number=200)
+
+
+if __name__ == "__main__":
+    main()
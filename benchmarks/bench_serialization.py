@@ -0,0 +1,73 @@
+"""Benchmark de la sérialisation des modèles
+
+Compare, pour une liste de Match distincts, l'aller-retour historique
+(dataclasses.asdict + json puis from_dict) à to_dict + json, aux formats
+binaires de fffdata.serialization et à pickle (__reduce__ généré).
+
+Usage:
+    python benchmarks/bench_serialization.py
+"""
+
+import json
+import pickle
+from dataclasses import asdict
+
+from common import bench, load_match_payloads
+
+from fffdata import serialization
+from fffdata.models import Match
+
+
+def main(n: int = 300):
+    payloads = load_match_payloads()
+    matchs = [Match.from_dict(json.loads(payloads[i % len(payloads)])) for i in range(n)]
+    print(f"{n} matchs distincts par itération\n")
+
+    formats = {
+        "asdict + json": (
+            lambda: json.dumps([asdict(m) for m in matchs]).encode(),
+            lambda data: [Match.from_dict(d) for d in json.loads(data)],
+        ),
+        "to_dict + json": (
+            lambda: json.dumps([m.to_dict() for m in matchs]).encode(),
+            lambda data: [Match.from_dict(d) for d in json.loads(data)],
+        ),
+        "pickle": (
+            lambda: pickle.dumps(matchs, pickle.HIGHEST_PROTOCOL),
+            pickle.loads,
+        ),
+        "marshal (dumps_many)": (
+            lambda: serialization.dumps_many(matchs, "marshal"),
+            serialization.loads_many,
+        ),
+    }
+    if serialization.msgpack is not None:
+        formats["msgpack (dumps_many)"] = (
+            lambda: serialization.dumps_many(matchs, "msgpack"),
+            serialization.loads_many,
+        )
+    else:
+        print("  msgpack non installé : pip install fffdata[fast]\n")
+
+    print("Encodage :")
+    reference = None
+    for label, (encode, _) in formats.items():
+        temps = bench(label, encode, number=20)
+        reference = reference or temps
+        print(f"  {'':<45} x{reference / temps:.2f}")
+
+    print("\nAller-retour :")
+    reference = None
+    for label, (encode, decode) in formats.items():
+        assert decode(encode()) == matchs
+        temps = bench(label, lambda encode=encode, decode=decode: decode(encode()), number=20)
+        reference = reference or temps
+        print(f"  {'':<45} x{reference / temps:.2f}")
+
+    print("\nTaille par match :")
+    for label, (encode, _) in formats.items():
+        print(f"  {label:<45} {len(encode()) / n:10.0f} octets")
+
+
+if __name__ == "__main__":
+    main()
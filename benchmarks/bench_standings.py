@@ -0,0 +1,63 @@
+"""Benchmark du classement incrémental
+
+Simule une journée de championnat : les résultats d'une poule arrivent un par
+un et le classement est relu après chacun. Compare le recalcul complet de la
+poule à chaque résultat à la mise à jour incrémentale de Standings.
+
+Usage:
+    python benchmarks/bench_standings.py
+"""
+
+import json
+from itertools import permutations
+
+from common import bench, load_match_payloads
+
+from fffdata.models import Match
+from fffdata.standings import Standings
+
+
+def poule(payload: bytes, equipes: int = 14):
+    """Matchs aller-retour d'une poule de n équipes, tous terminés"""
+    matchs = []
+    for i, (a, b) in enumerate(permutations(range(equipes), 2)):
+        data = json.loads(payload)
+        data["ma_no"] = i + 1
+        data["status"] = "A"
+        data["home"]["club"]["cl_no"] = 1000 + a
+        data["away"]["club"]["cl_no"] = 1000 + b
+        data["home_score"] = (a * 7 + b) % 4
+        data["away_score"] = (b * 5 + a) % 3
+        data["home_nb_point"] = data["away_nb_point"] = None
+        matchs.append(Match.from_dict(data))
+    return matchs
+
+
+def main():
+    matchs = poule(load_match_payloads()[0])
+    print(f"Poule de 14 équipes, {len(matchs)} résultats lus un par un\n")
+
+    def recalcul():
+        for n in range(1, len(matchs) + 1):
+            standings = Standings()
+            standings.add_all(matchs[:n])
+            standings.table()
+        return standings
+
+    def incremental():
+        standings = Standings()
+        for match in matchs:
+            standings.add(match)
+            standings.table()
+        return standings
+
+    attendu = [(s.team, s.total, s.rank) for s in recalcul().table()]
+    assert [(s.team, s.total, s.rank) for s in incremental().table()] == attendu
+
+    reference = bench("recalcul complet à chaque résultat", recalcul, number=3)
+    temps = bench("Standings.add + table()", incremental, number=3)
+    print(f"  {'':<45} x{reference / temps:.1f}")
+
+
+if __name__ == "__main__":
+    main()
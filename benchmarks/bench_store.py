@@ -0,0 +1,74 @@
+"""Benchmark des requêtes de l'EntityStore
+
+Une saison de 20 000 matchs (200 clubs) est enregistrée une fois. Compare la
+recherche des matchs d'un club sur la saison par parcours d'un fichier JSONL
+(décodage de chaque match puis filtre) à la requête indexée de l'EntityStore,
+qui ne reconstruit que les matchs retenus.
+
+Usage:
+    python benchmarks/bench_store.py
+"""
+
+import json
+import os
+import tempfile
+import time
+
+from common import bench, load_match_payloads
+
+from fffdata.models import Match
+from fffdata.store import EntityStore
+
+CLUBS = 200
+MATCHS = 20000
+
+
+def saison(payload: bytes):
+    """Corps JSON de MATCHS matchs répartis entre CLUBS clubs et 20 poules"""
+    corps = []
+    for i in range(MATCHS):
+        data = json.loads(payload)
+        data["ma_no"] = i + 1
+        data["competition"]["cp_no"] = 400000 + i % 20
+        data["poule"]["stage_number"] = 1 + i % 20
+        data["home"]["club"]["cl_no"] = 1000 + i % CLUBS
+        data["away"]["club"]["cl_no"] = 1000 + (i * 7 + 1) % CLUBS
+        data["date"] = f"2024-{9 + i % 4:02d}-{1 + i % 28:02d}T00:00:00+00:00"
+        corps.append(json.dumps(data))
+    return corps
+
+
+def main():
+    corps = saison(load_match_payloads()[0])
+    club = 1042
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin = os.path.join(dossier, "matchs.jsonl")
+        with open(chemin, "w", encoding="utf-8") as f:
+            f.write("\n".join(corps))
+
+        store = EntityStore(os.path.join(dossier, "store.sqlite"))
+        debut = time.perf_counter()
+        store.upsert_matches(Match.from_dict(json.loads(c)) for c in corps)
+        print(f"{MATCHS} matchs enregistrés en {time.perf_counter() - debut:.2f} s\n")
+
+        def parcours():
+            with open(chemin, encoding="utf-8") as f:
+                matchs = (Match.from_dict(json.loads(ligne)) for ligne in f)
+                return [
+                    m for m in matchs
+                    if m.season == 2024 and club in (m.home.club.cl_no, m.away.club.cl_no)
+                ]
+
+        def requete():
+            return store.matches(club=club, season=2024)
+
+        assert sorted(m.ma_no for m in parcours()) == sorted(m.ma_no for m in requete())
+        print(f"Matchs du club {club} sur la saison : {len(requete())}")
+        reference = bench("parcours JSONL + from_dict", parcours, number=1, repeat=3)
+        temps = bench("EntityStore.matches(club, season)", requete, number=20)
+        print(f"  {'':<45} x{reference / temps:.1f}")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
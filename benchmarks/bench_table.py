@@ -0,0 +1,77 @@
+"""Benchmark des agrégations sur MatchTable
+
+Compare une agrégation de saison écrite en boucle Python sur des Match (buts
+marqués à domicile et nombre de matchs par équipe, sur une plage de dates) à la
+même agrégation vectorisée sur une MatchTable.
+
+Usage:
+    python benchmarks/bench_table.py
+"""
+
+import json
+from collections import defaultdict
+from datetime import datetime
+
+from common import bench, load_match_payloads
+
+from fffdata.dates import PARIS
+from fffdata.models import Match
+from fffdata.table import MatchTable
+
+
+def saison(payloads, n: int):
+    """Génère n matchs à partir des réponses enregistrées (numéros, équipes et dates variés)"""
+    matchs = []
+    for i in range(n):
+        data = json.loads(payloads[i % len(payloads)])
+        data["ma_no"] += i
+        data["home"]["club"]["cl_no"] += i % 14
+        data["away"]["club"]["cl_no"] += (i * 7) % 14
+        data["date"] = f"2024-{1 + i % 12:02d}-{1 + i % 28:02d}T00:00:00+00:00"
+        matchs.append(data)
+    return matchs
+
+
+def main(n: int = 20000):
+    payloads = saison(load_match_payloads(), n)
+    matchs = [Match.from_dict(data) for data in payloads]
+    table = MatchTable.from_matches(matchs)
+    debut = datetime(2024, 3, 1, tzinfo=PARIS)
+    fin = datetime(2024, 9, 1, tzinfo=PARIS)
+    print(f"{n} matchs\n")
+
+    def boucle():
+        buts = defaultdict(int)
+        nombre = defaultdict(int)
+        for match in matchs:
+            if not match.is_finished() or match.home_score is None:
+                continue
+            kickoff = match.kickoff
+            if kickoff is None or not debut <= kickoff < fin:
+                continue
+            buts[match.home.club.cl_no] += match.home_score
+            nombre[match.home.club.cl_no] += 1
+        return buts, nombre
+
+    def vectorise():
+        return table.finished().between(debut, fin).groupby(
+            "home_club", buts=("home_score", "sum"), matchs=("ma_no", "count")
+        )
+
+    resultat = vectorise()
+    buts, nombre = boucle()
+    assert dict(zip(resultat["home_club"].tolist(), resultat["buts"].tolist())) == buts
+    assert dict(zip(resultat["home_club"].tolist(), resultat["matchs"].tolist())) == nombre
+
+    print("Construction :")
+    bench("MatchTable.from_payloads", lambda: MatchTable.from_payloads(payloads), number=3)
+    bench("MatchTable.from_matches", lambda: MatchTable.from_matches(matchs), number=3)
+
+    print("\nButs à domicile par club, de mars à août :")
+    reference = bench("boucle Python sur des Match", boucle, number=10)
+    temps = bench("MatchTable (filtres + groupby)", vectorise, number=10)
+    print(f"  {'':<45} x{reference / temps:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""Outils partagés par les benchmarks"""
+
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, List
+
+# Permet de lancer les benchmarks depuis la racine du dépôt sans installation
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+
+
+def load_match_payloads() -> List[bytes]:
+    """Retourne les corps bruts des réponses match_entities enregistrées"""
+    with open(DATA_DIR / "match_entities.jsonl", "rb") as f:
+        return [line.rstrip(b"\n") for line in f if line.strip()]
+
+
+def bench(label: str, fn: Callable[[], object], number: int = 2000, repeat: int = 5) -> float:
+    """Chronomètre fn et affiche le meilleur temps par appel
+
+    Returns:
+        Meilleur temps par appel, en microsecondes
+    """
+    best = min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e6
+    print(f"  {label:<45} {best:10.2f} µs")
+    return best
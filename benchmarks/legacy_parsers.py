@@ -0,0 +1,226 @@
+"""Copie des from_dict écrits à la main, avant leur génération par schéma
+
+Sert de référence à bench_from_dict.py : mêmes classes de modèle, mêmes valeurs
+par défaut, sans contexte d'identité.
+"""
+
+from common import DATA_DIR  # noqa: F401  (configure sys.path)
+
+from fffdata.models import (
+    CDG,
+    Club,
+    ClubInfo,
+    Competition,
+    Contact,
+    District,
+    Match,
+    MatchMembre,
+    Phase,
+    Poule,
+    PouleJournee,
+    Team,
+    Terrain,
+)
+from fffdata.models.match import TerrainMatch
+
+
+def cdg(data: dict) -> CDG:
+    return CDG(
+        cg_no=data.get("cg_no"),
+        name=data.get("name", ""),
+        external_updated_at=data.get("external_updated_at")
+    )
+
+
+def competition(data: dict) -> Competition:
+    return Competition(
+        cp_no=data.get("cp_no"),
+        season=data.get("season"),
+        type=data.get("type", ""),
+        name=data.get("name", ""),
+        level=data.get("level", ""),
+        cdg=cdg(data["cdg"]) if data.get("cdg") else None,
+        external_updated_at=data.get("external_updated_at")
+    )
+
+
+def phase(data: dict) -> Phase:
+    return Phase(
+        number=data.get("number"),
+        type=data.get("type", ""),
+        name=data.get("name", ""),
+        external_updated_at=data.get("external_updated_at")
+    )
+
+
+def poule(data: dict) -> Poule:
+    return Poule(
+        stage_number=data.get("stage_number"),
+        name=data.get("name", ""),
+        poule_unique=data.get("poule_unique", False),
+        at_least_one_match_resultat=data.get("at_least_one_match_resultat", False),
+        external_updated_at=data.get("external_updated_at")
+    )
+
+
+def poule_journee(data: dict) -> PouleJournee:
+    return PouleJournee(
+        number=data.get("number"),
+        name=data.get("name", ""),
+        external_updated_at=data.get("external_updated_at")
+    )
+
+
+def club_info(data: dict) -> ClubInfo:
+    return ClubInfo(
+        cl_no=data.get("cl_no"),
+        logo=data.get("logo"),
+        external_updated_at=data.get("external_updated_at")
+    )
+
+
+def team(data: dict) -> Team:
+    return Team(
+        club=club_info(data["club"]) if data.get("club") else None,
+        category_code=data.get("category_code", ""),
+        category_label=data.get("category_label", ""),
+        category_gender=data.get("category_gender", ""),
+        number=data.get("number"),
+        code=data.get("code"),
+        short_name=data.get("short_name", ""),
+        short_name_ligue=data.get("short_name_ligue", ""),
+        short_name_federation=data.get("short_name_federation", ""),
+        type=data.get("type", ""),
+        engagements=data.get("engagements", []),
+        external_updated_at=data.get("external_updated_at")
+    )
+
+
+def terrain_match(data: dict) -> TerrainMatch:
+    return TerrainMatch(
+        te_no=data.get("te_no"),
+        name=data.get("name", ""),
+        address=data.get("address"),
+        zip_code=data.get("zip_code"),
+        city=data.get("city"),
+        libelle_surface=data.get("libelle_surface"),
+        external_updated_at=data.get("external_updated_at")
+    )
+
+
+def match_membre(data: dict) -> MatchMembre:
+    return MatchMembre(
+        mm_no=data.get("mm_no"),
+        po_cod=data.get("po_cod", ""),
+        prenom=data.get("prenom", ""),
+        nom=data.get("nom", ""),
+        label_position=data.get("label_position", ""),
+        position_ordre=data.get("position_ordre"),
+        external_updated_at=data.get("external_updated_at")
+    )
+
+
+def match(data: dict) -> Match:
+    terrain = None
+    if data.get("terrain"):
+        terrain = terrain_match(data["terrain"])
+
+    match_membres = []
+    if data.get("match_membres"):
+        match_membres = [match_membre(m) for m in data["match_membres"]]
+
+    return Match(
+        ma_no=data.get("ma_no"),
+        competition=competition(data.get("competition", {})),
+        phase=phase(data.get("phase", {})),
+        poule=poule(data.get("poule", {})),
+        poule_journee=poule_journee(data.get("poule_journee", {})),
+        home=team(data.get("home", {})),
+        away=team(data.get("away", {})),
+        season=data.get("season"),
+        status=data.get("status", ""),
+        status_label=data.get("status_label", ""),
+        date=data.get("date", ""),
+        time=data.get("time", ""),
+        home_score=data.get("home_score", 0),
+        away_score=data.get("away_score", 0),
+        home_resu=data.get("home_resu", ""),
+        away_resu=data.get("away_resu", ""),
+        cr_nb_but=data.get("cr_nb_but", 0),
+        terrain=terrain,
+        initial_date=data.get("initial_date"),
+        ma_ar=data.get("ma_ar"),
+        ma_inver=data.get("ma_inver"),
+        ma_arret=data.get("ma_arret"),
+        is_overtime=data.get("is_overtime"),
+        home_but_contre=data.get("home_but_contre"),
+        home_nb_point=data.get("home_nb_point"),
+        home_nb_tir_but=data.get("home_nb_tir_but"),
+        home_nb_point_pena=data.get("home_nb_point_pena", 0),
+        home_is_forfeit=data.get("home_is_forfeit", "N"),
+        away_but_contre=data.get("away_but_contre"),
+        away_nb_point=data.get("away_nb_point"),
+        away_nb_tir_but=data.get("away_nb_tir_but"),
+        away_nb_point_pena=data.get("away_nb_point_pena", 0),
+        away_is_forfeit=data.get("away_is_forfeit", "N"),
+        seems_postponed=data.get("seems_postponed", ""),
+        match_membres=match_membres,
+        match_feuille=data.get("match_feuille"),
+        external_updated_at=data.get("external_updated_at")
+    )
+
+
+def district(data: dict) -> District:
+    return District(
+        cg_no=data.get("cg_no"),
+        name=data.get("name", ""),
+        short_name=data.get("short_name", ""),
+        type_label=data.get("type_label", ""),
+        cp_cod=data.get("cp_cod", [])
+    )
+
+
+def contact(data: dict) -> Contact:
+    return Contact(
+        type=data.get("type", ""),
+        type_label=data.get("type_label", ""),
+        value=data.get("value", "")
+    )
+
+
+def terrain(data: dict) -> Terrain:
+    return Terrain(
+        te_no=data.get("te_no"),
+        name=data.get("name", ""),
+        address=data.get("address"),
+        zip_code=data.get("zip_code"),
+        city=data.get("city"),
+        libelle_surface=data.get("libelle_surface"),
+        latitude=data.get("latitude"),
+        longitude=data.get("longitude"),
+        external_updated_at=data.get("external_updated_at")
+    )
+
+
+def club(data: dict) -> Club:
+    return Club(
+        cl_no=data.get("cl_no"),
+        name=data.get("name", ""),
+        short_name=data.get("short_name", ""),
+        location=data.get("location", ""),
+        affiliation_number=data.get("affiliation_number"),
+        district=district(data["district"]) if data.get("district") else None,
+        department_code=data.get("department_code"),
+        colors=data.get("colors"),
+        logo=data.get("logo"),
+        address1=data.get("address1"),
+        address2=data.get("address2"),
+        address3=data.get("address3"),
+        postal_code=data.get("postal_code"),
+        distributor_office=data.get("distributor_office"),
+        latitude=data.get("latitude"),
+        longitude=data.get("longitude"),
+        contacts=[contact(c) for c in data["contacts"]] if data.get("contacts") else [],
+        terrains=[terrain(t) for t in data["terrains"]] if data.get("terrains") else [],
+        membres=data.get("membres", [])
+    )
@@ -1,6 +1,17 @@
 """Bibliothèque pour interagir avec l'API de la FFF"""
 
 from .client import FFFClient
+from .async_client import AsyncFFFClient
+from .crawler import CompetitionCrawler, SQLiteFrontier
+from .cache import CachePolicy, DiskCache, EntityCache
+from .geo import GeoIndex
+from .ratelimit import RateLimiter
+from .search import SearchIndex
+from .sync import ChangeSet, DeltaSync, SyncState
+from .retry import RetryPolicy
+from .standings import Standings, StandingsBook
+from .store import EntityStore
+from .table import MatchTable
 from .exceptions import (
     FFFAPIError, 
     MatchNotFoundError, 
@@ -11,6 +22,23 @@ from .exceptions import (
 __version__ = "0.1.0"
 __all__ = [
     "FFFClient", 
+    "AsyncFFFClient",
+    "CompetitionCrawler",
+    "SQLiteFrontier",
+    "CachePolicy",
+    "DiskCache",
+    "EntityCache",
+    "GeoIndex",
+    "RateLimiter",
+    "SearchIndex",
+    "ChangeSet",
+    "DeltaSync",
+    "SyncState",
+    "RetryPolicy",
+    "MatchTable",
+    "Standings",
+    "StandingsBook",
+    "EntityStore",
     "FFFAPIError", 
     "MatchNotFoundError",
     "ClubNotFoundError",
@@ -0,0 +1,363 @@
+"""Client asynchrone pour l'API FFF (asyncio)"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    aiohttp = None
+
+from .client import DEFAULT_HEADERS, _check_numero
+from .decoders import JSONDecoder, get_decoder
+from .endpoints import FFFEndpoints
+from .exceptions import FFFAPIError, APIConnectionError
+from .models import Club, IdentityMap, Match, projection
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+
+
+JSONData = Union[Dict[str, Any], List[Any]]
+
+
+class AsyncFFFClient:
+    """Client asynchrone pour interagir avec l'API FFF
+
+    Toutes les méthodes de récupération sont des coroutines. Le nombre de
+    requêtes simultanées est borné par ``max_concurrency`` et les connexions
+    HTTP sont réutilisées (keep-alive) via un connecteur partagé.
+
+    Nécessite la dépendance optionnelle ``aiohttp`` (``pip install fffdata[async]``).
+
+    Args:
+        base_url: URL de base de l'API (par défaut: https://api-dofa.fff.fr)
+        timeout: Timeout en secondes pour les requêtes (par défaut: 30)
+        max_concurrency: Nombre maximum de requêtes en vol simultanément (par défaut: 10)
+        limit_per_host: Nombre maximum de connexions ouvertes vers l'hôte
+            (par défaut: ``max_concurrency``)
+        keepalive_timeout: Durée en secondes pendant laquelle une connexion inactive
+            est conservée dans le pool (par défaut: 30)
+        retry: Politique de nouvelles tentatives (RetryPolicy), par défaut aucune
+        rate_limiter: Limiteur de débit (RateLimiter), éventuellement partagé avec
+            des FFFClient d'autres threads ou processus (par défaut: aucun)
+        json_decoder: Fonction de décodage bytes -> JSON (par défaut: orjson s'il
+            est installé, sinon le module json standard)
+        lazy: Retourne des modèles à hydratation paresseuse (LazyMatch, LazyClub)
+            (par défaut: False)
+        identity_map: Carte d'identité (IdentityMap) partageant les sous-entités
+            répétées entre les modèles parsés (par défaut: aucune)
+
+    Example:
+        >>> async with AsyncFFFClient(max_concurrency=20) as client:
+        >>>     matchs = await asyncio.gather(
+        >>>         *(client.get_match_entities(n) for n in numeros)
+        >>>     )
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://api-dofa.fff.fr",
+        timeout: int = 30,
+        max_concurrency: int = 10,
+        limit_per_host: Optional[int] = None,
+        keepalive_timeout: float = 30,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        json_decoder: Optional[JSONDecoder] = None,
+        lazy: bool = False,
+        identity_map: Optional[IdentityMap] = None
+    ):
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncFFFClient nécessite aiohttp (pip install fffdata[async])"
+            )
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency doit être strictement positif")
+
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.limit_per_host = limit_per_host or max_concurrency
+        self.keepalive_timeout = keepalive_timeout
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.json_decoder = json_decoder or get_decoder()
+        self.lazy = lazy
+        self.identity_map = identity_map
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Crée la session HTTP à la première utilisation
+
+        La session et le sémaphore doivent être créés dans la boucle
+        d'événements qui les utilise, d'où l'initialisation paresseuse.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=DEFAULT_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        retry: Optional[RetryPolicy] = None,
+        **kwargs
+    ) -> Optional[JSONData]:
+        """Effectue une requête HTTP vers l'API
+
+        Les erreurs transitoires sont retentées selon la politique de nouvelles
+        tentatives (retry ou, à défaut, celle du client). Le créneau de
+        concurrence est libéré pendant les attentes.
+
+        Args:
+            method: Méthode HTTP (GET, POST, etc.)
+            endpoint: Endpoint de l'API
+            retry: Politique de nouvelles tentatives pour cet appel
+            **kwargs: Arguments additionnels pour aiohttp
+
+        Returns:
+            Réponse JSON décodée, ou None si ressource non trouvée (404)
+
+        Raises:
+            APIConnectionError: En cas d'erreur de connexion
+            FFFAPIError: Pour toute autre erreur API
+        """
+        url = f"{self.base_url}{endpoint}"
+        session = self._get_session()
+        policy = retry if retry is not None else self.retry
+
+        # Accepter un timeout numérique comme pour FFFClient
+        if 'timeout' in kwargs and not isinstance(kwargs['timeout'], aiohttp.ClientTimeout):
+            kwargs['timeout'] = aiohttp.ClientTimeout(total=kwargs['timeout'])
+
+        debut = time.monotonic()
+        tentative = 0
+        while True:
+            status = None
+            retry_after = None
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(endpoint)
+
+            async with self._semaphore:
+                try:
+                    async with session.request(method, url, **kwargs) as response:
+                        if response.status == 404:
+                            return None  # Ressource non trouvée, on retourne None
+                        if response.status < 400:
+                            body = await response.read()
+                            break
+                        status = response.status
+                        retry_after = response.headers.get('Retry-After')
+                        erreur = FFFAPIError(
+                            f"Erreur HTTP {status}: {response.reason} for url: {url}"
+                        )
+
+                except asyncio.TimeoutError:
+                    erreur = APIConnectionError(f"Timeout lors de la connexion à {url}")
+
+                except aiohttp.ClientConnectionError:
+                    erreur = APIConnectionError(f"Impossible de se connecter à {url}")
+
+                except aiohttp.ClientError as e:
+                    raise FFFAPIError(f"Erreur lors de la requête: {e}")
+
+            if policy is None or not policy.is_retryable(method, status):
+                raise erreur
+
+            delai = policy.next_delay(
+                tentative, time.monotonic() - debut, status, retry_after
+            )
+            if delai is None:
+                raise erreur
+
+            await asyncio.sleep(delai)
+            tentative += 1
+
+        try:
+            return self.json_decoder(body)
+        except ValueError:
+            raise FFFAPIError("La réponse de l'API n'est pas un JSON valide")
+
+    # ==================== MATCHS ====================
+
+    async def get_match_entities(
+        self,
+        numero_match: int,
+        retry: Optional[RetryPolicy] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> Union[Match, tuple, None]:
+        """Récupère les entités d'un match (équipes, joueurs, etc.)
+
+        Args:
+            numero_match: Numéro unique du match (entier)
+            retry: Politique de nouvelles tentatives pour cet appel
+            fields: Champs à extraire ; retourne alors un MatchRecord (namedtuple)
+                au lieu d'un Match (voir FFFClient.get_match_entities)
+
+        Returns:
+            Instance de Match (ou MatchRecord avec fields), ou None si le match n'existe pas
+
+        Raises:
+            InvalidMatchNumberError: Si le numéro de match est invalide
+            FFFAPIError: Pour toute autre erreur API (connexion, timeout, etc.)
+        """
+        _check_numero(numero_match, "de match")
+
+        data = await self._request(
+            'GET', FFFEndpoints.match_entities(numero_match), retry=retry
+        )
+
+        if data is None:
+            return None
+        if fields is not None:
+            return projection(Match, fields)(data)
+
+        return Match.from_dict(data, lazy=self.lazy, context=self.identity_map)
+
+    async def get_match_feuille(self, numero_match: int) -> Optional[JSONData]:
+        """Récupère la feuille de match (JSON brut)"""
+        _check_numero(numero_match, "de match")
+        return await self._request('GET', FFFEndpoints.match_feuille(numero_match))
+
+    # ==================== CLUBS ====================
+
+    async def get_club(
+        self,
+        numero_club: int,
+        retry: Optional[RetryPolicy] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> Union[Club, tuple, None]:
+        """Récupère les informations d'un club
+
+        Args:
+            numero_club: Numéro unique du club (entier)
+            retry: Politique de nouvelles tentatives pour cet appel
+            fields: Champs à extraire ; retourne alors un ClubRecord (namedtuple)
+                au lieu d'un Club
+
+        Returns:
+            Instance de Club (ou ClubRecord avec fields), ou None si le club n'existe pas
+
+        Raises:
+            InvalidMatchNumberError: Si le numéro de club est invalide
+            FFFAPIError: Pour toute autre erreur API (connexion, timeout, etc.)
+        """
+        _check_numero(numero_club, "de club")
+
+        data = await self._request('GET', FFFEndpoints.club(numero_club), retry=retry)
+
+        if data is None:
+            return None
+        if fields is not None:
+            return projection(Club, fields)(data)
+
+        return Club.from_dict(data, lazy=self.lazy, context=self.identity_map)
+
+    async def get_club_equipes(self, numero_club: int) -> Optional[JSONData]:
+        """Récupère toutes les équipes d'un club (JSON brut)"""
+        _check_numero(numero_club, "de club")
+        return await self._request('GET', FFFEndpoints.club_equipes(numero_club))
+
+    # ==================== COMPÉTITIONS ====================
+
+    async def get_competition(self, numero_competition: int) -> Optional[JSONData]:
+        """Récupère les informations d'une compétition (JSON brut)"""
+        _check_numero(numero_competition, "de compétition")
+        return await self._request('GET', FFFEndpoints.competition(numero_competition))
+
+    async def get_competition_poules(
+        self,
+        numero_competition: int,
+        phase: int = 1
+    ) -> Optional[JSONData]:
+        """Récupère les poules d'une phase de compétition (JSON brut)"""
+        _check_numero(numero_competition, "de compétition")
+        return await self._request(
+            'GET', FFFEndpoints.competition_poules(numero_competition, phase)
+        )
+
+    async def get_competition_classement(
+        self,
+        numero_competition: int,
+        phase: int = 1,
+        poule: int = 1
+    ) -> Optional[JSONData]:
+        """Récupère le classement d'une poule (JSON brut)"""
+        _check_numero(numero_competition, "de compétition")
+        return await self._request(
+            'GET', FFFEndpoints.competition_classement(numero_competition, phase, poule)
+        )
+
+    async def get_competition_calendrier(
+        self,
+        numero_competition: int,
+        phase: int = 1,
+        poule: int = 1
+    ) -> Optional[JSONData]:
+        """Récupère le calendrier d'une poule (JSON brut)"""
+        _check_numero(numero_competition, "de compétition")
+        return await self._request(
+            'GET', FFFEndpoints.competition_calendrier(numero_competition, phase, poule)
+        )
+
+    # ==================== ÉQUIPES ====================
+
+    async def get_equipe(self, numero_equipe: int) -> Optional[JSONData]:
+        """Récupère les informations d'une équipe (JSON brut)"""
+        _check_numero(numero_equipe, "d'équipe")
+        return await self._request('GET', FFFEndpoints.equipe(numero_equipe))
+
+    async def get_equipe_effectif(self, numero_equipe: int) -> Optional[JSONData]:
+        """Récupère l'effectif d'une équipe (JSON brut)"""
+        _check_numero(numero_equipe, "d'équipe")
+        return await self._request('GET', FFFEndpoints.equipe_effectif(numero_equipe))
+
+    async def get_equipe_matchs(self, numero_equipe: int) -> Optional[JSONData]:
+        """Récupère tous les matchs d'une équipe (JSON brut)"""
+        _check_numero(numero_equipe, "d'équipe")
+        return await self._request('GET', FFFEndpoints.equipe_matchs(numero_equipe))
+
+    # ==================== JOUEURS / ARBITRES ====================
+
+    async def get_joueur(self, numero_licence: int) -> Optional[JSONData]:
+        """Récupère les informations d'un joueur (JSON brut)"""
+        _check_numero(numero_licence, "de licence")
+        return await self._request('GET', FFFEndpoints.joueur(numero_licence))
+
+    async def get_arbitre(self, numero_arbitre: int) -> Optional[JSONData]:
+        """Récupère les informations d'un arbitre (JSON brut)"""
+        _check_numero(numero_arbitre, "d'arbitre")
+        return await self._request('GET', FFFEndpoints.arbitre(numero_arbitre))
+
+    # ==================== TERRAINS ====================
+
+    async def get_terrain(self, numero_terrain: int) -> Optional[JSONData]:
+        """Récupère les informations d'un terrain (JSON brut)"""
+        _check_numero(numero_terrain, "de terrain")
+        return await self._request('GET', FFFEndpoints.terrain(numero_terrain))
+
+    async def close(self):
+        """Ferme la session HTTP et libère les connexions du pool"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        """Support du context manager asynchrone"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Fermeture automatique avec context manager"""
+        await self.close()
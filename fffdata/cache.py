@@ -0,0 +1,428 @@
+"""Caches utilisés par le client FFF"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from .endpoints import FFFEndpoints
+from .models.match import STATUT_TERMINE
+
+
+JOUR = 24 * 3600
+
+
+@dataclass
+class Validators:
+    """Validateurs HTTP d'une ressource et modèle déjà parsé associé"""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    value: Any
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Retourne les en-têtes de requête conditionnelle"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ValidatorCache:
+    """Mémorise par URL les validateurs ETag / Last-Modified et le modèle parsé
+
+    Permet de revalider une ressource avec une requête conditionnelle : sur une
+    réponse 304, le modèle mémorisé est retourné tel quel, sans retélécharger
+    ni reparser le JSON. Le nombre d'URL suivies est borné (LRU).
+
+    Args:
+        maxsize: Nombre maximum d'URL mémorisées (par défaut: 1024)
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Validators]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[Validators]:
+        """Retourne les validateurs connus pour une URL"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def store(self, url: str, headers: Mapping[str, str], value: Any) -> None:
+        """Mémorise les validateurs d'une réponse 200
+
+        Rien n'est mémorisé si la réponse ne porte ni ETag ni Last-Modified.
+
+        Args:
+            url: URL de la ressource
+            headers: En-têtes de la réponse
+            value: Modèle parsé à retourner sur un 304
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            self.invalidate(url)
+            return
+
+        with self._lock:
+            self._entries[url] = Validators(etag, last_modified, value)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url: str) -> None:
+        """Oublie les validateurs d'une URL"""
+        with self._lock:
+            self._entries.pop(url, None)
+
+    def clear(self) -> None:
+        """Vide le cache"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class EntityCache:
+    """Cache mémoire LRU avec durée de vie pour les modèles parsés
+
+    Conserve les instances Match / Club déjà construites pour éviter un aller-retour
+    HTTP et un from_dict lors des demandes répétées. Le nombre d'entrées est
+    borné ; au-delà, l'entrée la moins récemment utilisée est évincée.
+
+    Les clés utilisées par FFFClient sont les endpoints de l'API
+    (ex: FFFEndpoints.club(10000)).
+
+    Args:
+        maxsize: Nombre maximum d'entrées (par défaut: 1024)
+        ttl: Durée de vie d'une entrée en secondes, None pour aucune expiration
+            (par défaut: 300)
+
+    Example:
+        >>> cache = EntityCache(maxsize=4096, ttl=600)
+        >>> client = FFFClient(entity_cache=cache)
+        >>> cache.invalidate(FFFEndpoints.club(10000))
+        >>> print(cache.stats())
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 300):
+        if maxsize <= 0:
+            raise ValueError("maxsize doit être strictement positif")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Retourne la valeur associée à une clé, ou None si absente ou expirée"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Mémorise une valeur, en évinçant l'entrée la plus ancienne si besoin"""
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: str) -> bool:
+        """Supprime une entrée
+
+        Returns:
+            True si la clé était présente
+        """
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Vide le cache (les compteurs sont conservés)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Retourne les compteurs du cache"""
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+
+def _default_ttls() -> Dict[str, Optional[float]]:
+    return {
+        "clubs": 3 * JOUR,
+        "clubs/equipes": JOUR,
+        "terrains": 3 * JOUR,
+        "competitions": JOUR,
+        "competitions/poules": JOUR,
+        "competitions/calendrier": 600,
+        "competitions/classement": 600,
+        "match_entities": None,
+        "match_feuilles": None,
+    }
+
+
+@dataclass
+class CachePolicy:
+    """Durées de vie du cache disque par famille de route
+
+    Les familles sont celles retournées par FFFEndpoints.family. Une durée à
+    None signifie « sans expiration », une durée à 0 désactive la mise en cache.
+
+    Pour les matchs (match_entities), la durée configurée ne s'applique qu'aux
+    matchs terminés (même règle que Match.is_finished) ; les matchs en cours ou
+    à venir utilisent live_match_ttl. Les autres familles, dont les feuilles de
+    match (sans statut), utilisent leur durée configurée.
+
+    Args:
+        ttls: Durée de vie en secondes par famille de route
+        default_ttl: Durée de vie des familles non listées (par défaut: 1 heure)
+        live_match_ttl: Durée de vie d'un match non terminé (par défaut: 30 secondes)
+    """
+    ttls: Dict[str, Optional[float]] = field(default_factory=_default_ttls)
+    default_ttl: Optional[float] = 3600
+    live_match_ttl: float = 30
+
+    # Familles dont les réponses portent le statut du match
+    MATCH_FAMILIES = ("match_entities",)
+
+    def ttl_for(self, endpoint: str, data: Any) -> Optional[float]:
+        """Retourne la durée de vie d'une réponse
+
+        Args:
+            endpoint: Endpoint de l'API
+            data: Réponse JSON décodée
+
+        Returns:
+            Durée de vie en secondes, None pour une réponse sans expiration
+        """
+        family = FFFEndpoints.family(endpoint)
+        ttl = self.ttls.get(family, self.default_ttl)
+        if family in self.MATCH_FAMILIES:
+            finished = isinstance(data, dict) and data.get("status") == STATUT_TERMINE
+            if not finished:
+                return self.live_match_ttl
+        return ttl
+
+
+class DiskCache:
+    """Cache disque des réponses de l'API, stocké dans une base SQLite
+
+    Les corps de réponse bruts sont stockés par URL avec une date d'expiration.
+    La taille totale est bornée : au-delà de max_size, les entrées expirées puis
+    les moins récemment lues sont évincées.
+
+    La base est en mode WAL et chaque écriture se fait dans une transaction
+    immédiate : plusieurs threads et plusieurs processus d'un même hôte peuvent
+    partager le même fichier. Chaque thread (et chaque processus après un fork)
+    utilise sa propre connexion.
+
+    Args:
+        path: Chemin du fichier SQLite
+        max_size: Taille maximale des corps stockés, en octets (par défaut: 256 Mo)
+        policy: Politique de durée de vie par famille de route
+
+    Example:
+        >>> cache = DiskCache("~/.cache/fffdata.sqlite")
+        >>> client = FFFClient(cache=cache)
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            body BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            expires_at REAL,
+            accessed_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+        CREATE TABLE IF NOT EXISTS stats (
+            id INTEGER PRIMARY KEY CHECK (id = 0),
+            total_size INTEGER NOT NULL
+        );
+        INSERT OR IGNORE INTO stats (id, total_size) VALUES (0, 0);
+        CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses BEGIN
+            UPDATE stats SET total_size = total_size + NEW.size WHERE id = 0;
+        END;
+        CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses BEGIN
+            UPDATE stats SET total_size = total_size - OLD.size WHERE id = 0;
+        END;
+        CREATE TRIGGER IF NOT EXISTS responses_update AFTER UPDATE OF size ON responses BEGIN
+            UPDATE stats SET total_size = total_size - OLD.size + NEW.size WHERE id = 0;
+        END;
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = 256 * 1024 * 1024,
+        policy: Optional[CachePolicy] = None
+    ):
+        self.path = os.path.expanduser(path)
+        self.max_size = max_size
+        self.policy = policy or CachePolicy()
+        self._local = threading.local()
+
+        self._connection().executescript(self._SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Retourne la connexion du thread courant"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _transaction(self) -> "_Transaction":
+        return _Transaction(self._connection())
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Retourne le corps mémorisé pour une clé, ou None s'il est absent ou expiré"""
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        body, expires_at = row
+        now = time.time()
+        if expires_at is not None and expires_at <= now:
+            self.delete(key)
+            return None
+
+        conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return body
+
+    def set(self, key: str, body: bytes, ttl: Optional[float] = None) -> None:
+        """Mémorise un corps de réponse
+
+        Args:
+            key: Clé (URL de la ressource)
+            body: Corps brut de la réponse
+            ttl: Durée de vie en secondes (None: sans expiration, 0: ignoré)
+        """
+        if ttl is not None and ttl <= 0:
+            return
+        size = len(body)
+        if size > self.max_size:
+            return
+
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO responses (key, body, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET body = excluded.body, size = excluded.size, "
+                "expires_at = excluded.expires_at, accessed_at = excluded.accessed_at",
+                (key, sqlite3.Binary(body), size, expires_at, now)
+            )
+            self._evict(conn, now)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Évince des entrées tant que la taille totale dépasse max_size"""
+        total = conn.execute("SELECT total_size FROM stats WHERE id = 0").fetchone()[0]
+        if total <= self.max_size:
+            return
+
+        conn.execute(
+            "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+        )
+        total = conn.execute("SELECT total_size FROM stats WHERE id = 0").fetchone()[0]
+
+        while total > self.max_size:
+            rows = conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT 64"
+            ).fetchall()
+            if not rows:
+                break
+            victims = []
+            for key, size in rows:
+                victims.append((key,))
+                total -= size
+                if total <= self.max_size:
+                    break
+            conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+
+    def delete(self, key: str) -> None:
+        """Supprime une entrée"""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Vide le cache"""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def size(self) -> int:
+        """Retourne la taille totale des corps stockés, en octets"""
+        return self._connection().execute(
+            "SELECT total_size FROM stats WHERE id = 0"
+        ).fetchone()[0]
+
+    def close(self) -> None:
+        """Ferme la connexion du thread courant"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class _Transaction:
+    """Transaction SQLite immédiate (verrou d'écriture pris dès le début)"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.conn.execute("COMMIT")
+        else:
+            self.conn.execute("ROLLBACK")
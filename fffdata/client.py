@@ -1,14 +1,64 @@
 """Client principal pour l'API FFF"""
 
+import threading
+import time
+import weakref
 import requests
-from typing import Dict, Any, Optional
+import requests.adapters
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+from typing import Dict, Any, List, Optional, Callable, Iterable, Iterator, Sequence, Tuple, Union
 from .exceptions import (
     FFFAPIError,
     MatchNotFoundError,
     InvalidMatchNumberError,
     APIConnectionError
 )
-from .models import Club, Match
+from .cache import DiskCache, EntityCache, ValidatorCache
+from .decoders import JSONDecoder, get_decoder
+from .endpoints import FFFEndpoints
+from .models import Club, IdentityMap, Match, projection
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+
+
+JSONData = Union[Dict[str, Any], List[Any]]
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'fffdata-python-client/0.1.0',
+    'Accept': 'application/json'
+}
+
+
+def _accept_encoding() -> str:
+    """Retourne les encodages de compression que la session sait décoder"""
+    encodings = "gzip, deflate"
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+        except ImportError:
+            return encodings
+    return encodings + ", br"
+
+
+def _check_numero(numero: int, libelle: str) -> None:
+    """Vérifie qu'un numéro d'entité est un entier positif
+    
+    Args:
+        numero: Numéro à valider
+        libelle: Libellé de l'entité pour le message d'erreur (ex: "de match")
+    
+    Raises:
+        InvalidMatchNumberError: Si le numéro est invalide
+    """
+    if not isinstance(numero, int) or numero <= 0:
+        raise InvalidMatchNumberError(
+            f"Le numéro {libelle} doit être un entier positif"
+        )
 
 
 class FFFClient:
@@ -17,6 +67,49 @@ class FFFClient:
     Args:
         base_url: URL de base de l'API (par défaut: https://api-dofa.fff.fr)
         timeout: Timeout en secondes pour les requêtes (par défaut: 30)
+        revalidate: Active les requêtes conditionnelles ETag / Last-Modified : les
+            modèles déjà récupérés sont retournés sans re-parsing si l'API répond
+            304 Not Modified (par défaut: False)
+        cache: Cache disque (DiskCache) consulté avant chaque requête GET, avec
+            des durées de vie par famille de route (par défaut: aucun)
+        entity_cache: Cache mémoire (EntityCache) des modèles Match / Club déjà
+            construits, clé = endpoint (par défaut: aucun)
+        retry: Politique de nouvelles tentatives (RetryPolicy) pour les erreurs
+            transitoires (5xx, 429, timeouts). Par défaut: aucune nouvelle tentative
+        rate_limiter: Limiteur de débit (RateLimiter) appliqué à chaque envoi de
+            requête, nouvelles tentatives comprises (par défaut: aucun)
+        coalesce: Regroupe les appels concurrents (threads) portant sur le même
+            endpoint en une seule requête dont le résultat, ou l'exception, est
+            partagé par tous les appelants (par défaut: False)
+        pool_connections: Nombre de pools de connexions (un par hôte) conservés
+            (par défaut: 10)
+        pool_maxsize: Nombre maximum de connexions gardées ouvertes par hôte ; à
+            dimensionner au nombre de threads qui utilisent le client (par défaut: 10)
+        pool_block: Si True, un thread attend qu'une connexion du pool se libère
+            au lieu d'ouvrir une connexion supplémentaire jetée après usage
+            (par défaut: False)
+        keep_alive: Réutilise les connexions entre les requêtes (par défaut: True)
+        compression: Négocie la compression des réponses (gzip, deflate, et br si
+            brotli est installé) (par défaut: True)
+        session_per_thread: Utilise une session requests par thread au lieu d'une
+            session partagée (par défaut: False)
+        json_decoder: Fonction de décodage bytes -> JSON (par défaut: orjson s'il
+            est installé, sinon le module json standard)
+        lazy: Retourne des modèles à hydratation paresseuse (LazyMatch, LazyClub) dont
+            les sous-objets ne sont construits qu'au premier accès (par défaut: False)
+        identity_map: Carte d'identité (IdentityMap) partageant les sous-entités
+            répétées (compétition, poule, clubs, terrains...) entre tous les modèles
+            parsés par le client (par défaut: aucune)
+    
+    Thread-safety:
+        Un même FFFClient peut être utilisé par plusieurs threads. Toutes les
+        sessions partagent un unique adaptateur HTTP, donc un unique pool de
+        connexions borné par pool_maxsize. Par défaut les threads partagent aussi
+        la session ; avec session_per_thread=True, chaque thread a sa propre
+        session (en-têtes et cookies isolés) branchée sur ce même pool, libérée à
+        la fin du thread (ex: threads des get_*_bulk et du crawler). Modifier
+        client.session depuis un thread pendant que d'autres l'utilisent n'est
+        pas supporté.
     
     Example:
         >>> client = FFFClient()
@@ -27,72 +120,324 @@ class FFFClient:
     def __init__(
         self, 
         base_url: str = "https://api-dofa.fff.fr",
-        timeout: int = 30
+        timeout: int = 30,
+        revalidate: bool = False,
+        cache: Optional[DiskCache] = None,
+        entity_cache: Optional[EntityCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce: bool = False,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        compression: bool = True,
+        session_per_thread: bool = False,
+        json_decoder: Optional[JSONDecoder] = None,
+        lazy: bool = False,
+        identity_map: Optional[IdentityMap] = None
     ):
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'fffdata-python-client/0.1.0',
-            'Accept': 'application/json'
-        })
+        self.validators = ValidatorCache() if revalidate else None
+        self.cache = cache
+        self.entity_cache = entity_cache
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self._inflight = SingleFlight() if coalesce else None
+        self.json_decoder = json_decoder or get_decoder()
+        self.lazy = lazy
+        self.identity_map = identity_map
+        
+        self.headers = dict(DEFAULT_HEADERS)
+        self.headers['Accept-Encoding'] = _accept_encoding() if compression else 'identity'
+        if not keep_alive:
+            self.headers['Connection'] = 'close'
+        
+        self.adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.session_per_thread = session_per_thread
+        self._local = threading.local()
+        # Références faibles : la session d'un thread disparaît avec son thread-local
+        self._sessions: "weakref.WeakSet[requests.Session]" = weakref.WeakSet()
+        self._sessions_lock = threading.Lock()
+        self.session = self._new_session()
     
-    def _request(
+    def _new_session(self) -> requests.Session:
+        """Crée une session branchée sur l'adaptateur (pool de connexions) partagé"""
+        session = requests.Session()
+        session.mount('https://', self.adapter)
+        session.mount('http://', self.adapter)
+        session.headers.update(self.headers)
+        with self._sessions_lock:
+            self._sessions.add(session)
+        return session
+    
+    def _get_session(self) -> requests.Session:
+        """Retourne la session à utiliser pour le thread courant"""
+        if not self.session_per_thread:
+            return self.session
+        
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = self._new_session()
+        return session
+    
+    def _send(
         self, 
         method: str, 
         endpoint: str, 
+        retry: Optional[RetryPolicy] = None,
         **kwargs
-    ) -> Optional[Dict[str, Any]]:
-        """Effectue une requête HTTP vers l'API
+    ) -> Optional[requests.Response]:
+        """Envoie une requête HTTP vers l'API et vérifie son statut
+        
+        Les erreurs de connexion, timeouts et statuts rejouables sont retentés
+        selon la politique de nouvelles tentatives (retry ou, à défaut, celle du
+        client).
         
         Args:
             method: Méthode HTTP (GET, POST, etc.)
             endpoint: Endpoint de l'API
+            retry: Politique de nouvelles tentatives pour cet appel
             **kwargs: Arguments additionnels pour requests
         
         Returns:
-            Dict contenant la réponse JSON, ou None si ressource non trouvée (404)
+            Réponse HTTP (2xx ou 304), ou None si ressource non trouvée (404)
         
         Raises:
             APIConnectionError: En cas d'erreur de connexion
             FFFAPIError: Pour toute autre erreur API
         """
         url = f"{self.base_url}{endpoint}"
+        policy = retry if retry is not None else self.retry
         
         # Ajouter le timeout si non spécifié
         if 'timeout' not in kwargs:
             kwargs['timeout'] = self.timeout
         
+        debut = time.monotonic()
+        tentative = 0
+        while True:
+            status = None
+            retry_after = None
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(endpoint)
+            
+            try:
+                response = self._get_session().request(method, url, **kwargs)
+                response.raise_for_status()
+                return response
+            
+            except requests.exceptions.Timeout:
+                erreur = APIConnectionError(f"Timeout lors de la connexion à {url}")
+            
+            except requests.exceptions.ConnectionError:
+                erreur = APIConnectionError(f"Impossible de se connecter à {url}")
+            
+            except requests.exceptions.HTTPError as e:
+                if response.status_code == 404:
+                    return None  # Ressource non trouvée, on retourne None
+                erreur = FFFAPIError(f"Erreur HTTP {response.status_code}: {e}")
+                status = response.status_code
+                retry_after = response.headers.get('Retry-After')
+            
+            except requests.exceptions.RequestException as e:
+                raise FFFAPIError(f"Erreur lors de la requête: {e}")
+            
+            if policy is None or not policy.is_retryable(method, status):
+                raise erreur
+            
+            delai = policy.next_delay(
+                tentative, time.monotonic() - debut, status, retry_after
+            )
+            if delai is None:
+                raise erreur
+            
+            time.sleep(delai)
+            tentative += 1
+    
+    def _decode(self, response: requests.Response) -> Any:
+        """Décode le corps JSON d'une réponse, directement depuis les octets reçus
+        
+        Raises:
+            FFFAPIError: Si la réponse n'est pas un JSON valide
+        """
+        try:
+            return self.json_decoder(response.content)
+        except ValueError:
+            raise FFFAPIError("La réponse de l'API n'est pas un JSON valide")
+    
+    def _cache_lookup(self, endpoint: str) -> Optional[Any]:
+        """Retourne la réponse décodée depuis le cache disque, si présente et valide"""
+        if self.cache is None:
+            return None
+        
+        body = self.cache.get(f"{self.base_url}{endpoint}")
+        if body is None:
+            return None
+        
         try:
-            response = self.session.request(method, url, **kwargs)
-            response.raise_for_status()
-            return response.json()
+            return self.json_decoder(body)
+        except ValueError:
+            return None  # Entrée corrompue, on repasse par le réseau
+    
+    def _cache_store(self, endpoint: str, response: requests.Response, data: Any) -> None:
+        """Mémorise une réponse dans le cache disque selon sa politique de durée de vie"""
+        if self.cache is None:
+            return
+        
+        ttl = self.cache.policy.ttl_for(endpoint, data)
+        self.cache.set(f"{self.base_url}{endpoint}", response.content, ttl)
+    
+    def _request(
+        self, 
+        method: str, 
+        endpoint: str, 
+        retry: Optional[RetryPolicy] = None,
+        **kwargs
+    ) -> Optional[Dict[str, Any]]:
+        """Effectue une requête HTTP vers l'API
+        
+        Les requêtes GET sont d'abord cherchées dans le cache disque s'il est configuré.
+        
+        Args:
+            method: Méthode HTTP (GET, POST, etc.)
+            endpoint: Endpoint de l'API
+            retry: Politique de nouvelles tentatives pour cet appel
+            **kwargs: Arguments additionnels pour requests
+        
+        Returns:
+            Dict contenant la réponse JSON, ou None si ressource non trouvée (404)
+        
+        Raises:
+            APIConnectionError: En cas d'erreur de connexion
+            FFFAPIError: Pour toute autre erreur API
+        """
+        if method == 'GET':
+            data = self._cache_lookup(endpoint)
+            if data is not None:
+                return data
+        
+        response = self._send(method, endpoint, retry=retry, **kwargs)
         
-        except requests.exceptions.Timeout:
-            raise APIConnectionError(f"Timeout lors de la connexion à {url}")
+        if response is None:
+            return None
         
-        except requests.exceptions.ConnectionError:
-            raise APIConnectionError(f"Impossible de se connecter à {url}")
+        data = self._decode(response)
+        if method == 'GET':
+            self._cache_store(endpoint, response, data)
+        return data
+    
+    def _get_model(
+        self,
+        endpoint: str,
+        parser: Callable[[Any], Any],
+        retry: Optional[RetryPolicy] = None
+    ) -> Any:
+        """Récupère une ressource et la convertit en modèle
         
-        except requests.exceptions.HTTPError as e:
-            if response.status_code == 404:
-                return None  # Ressource non trouvée, on retourne None
-            raise FFFAPIError(f"Erreur HTTP {response.status_code}: {e}")
+        Le cache d'entités, s'il est configuré, est consulté en premier. Avec
+        coalesce, les appels concurrents sur un même endpoint partagent une seule
+        requête et le même modèle parsé.
+        Si la revalidation est activée, la requête est conditionnelle
+        (If-None-Match / If-Modified-Since) et une réponse 304 retourne le
+        modèle déjà parsé, sans nouvel appel à parser.
         
-        except requests.exceptions.JSONDecodeError:
-            raise FFFAPIError("La réponse de l'API n'est pas un JSON valide")
+        Args:
+            endpoint: Endpoint de l'API
+            parser: Fonction construisant le modèle depuis le JSON (ex: Match.from_dict)
+            retry: Politique de nouvelles tentatives pour cet appel
+        
+        Returns:
+            Modèle construit, ou None si ressource non trouvée (404)
+        """
+        if self.entity_cache is not None:
+            value = self.entity_cache.get(endpoint)
+            if value is not None:
+                return value
+        
+        if self._inflight is not None:
+            value = self._inflight.do(
+                endpoint, lambda: self._fetch_model(endpoint, parser, retry)
+            )
+        else:
+            value = self._fetch_model(endpoint, parser, retry)
+        
+        if value is not None and self.entity_cache is not None:
+            self.entity_cache.set(endpoint, value)
+        return value
+    
+    def _fetch_model(
+        self,
+        endpoint: str,
+        parser: Callable[[Any], Any],
+        retry: Optional[RetryPolicy] = None
+    ) -> Any:
+        """Télécharge (ou revalide) une ressource et la convertit en modèle"""
+        if self.validators is None:
+            data = self._request('GET', endpoint, retry=retry)
+            return None if data is None else parser(data)
+        
+        data = self._cache_lookup(endpoint)
+        if data is not None:
+            return parser(data)
+        
+        url = f"{self.base_url}{endpoint}"
+        entry = self.validators.get(url)
+        headers = entry.conditional_headers() if entry is not None else {}
+        
+        response = self._send('GET', endpoint, retry=retry, headers=headers)
+        
+        if response is None:
+            self.validators.invalidate(url)
+            return None
+        
+        if response.status_code == 304 and entry is not None:
+            return entry.value
+        
+        data = self._decode(response)
+        self._cache_store(endpoint, response, data)
+        value = parser(data)
+        self.validators.store(url, response.headers, value)
+        return value
+    
+    def _get_record(
+        self,
+        endpoint: str,
+        project: Callable[[Any], tuple],
+        retry: Optional[RetryPolicy] = None
+    ) -> Optional[tuple]:
+        """Récupère une ressource et n'en extrait que quelques champs
         
-        except requests.exceptions.RequestException as e:
-            raise FFFAPIError(f"Erreur lors de la requête: {e}")
+        Le cache d'entités et la revalidation, qui conservent des modèles
+        complets, ne sont pas utilisés ; le cache disque l'est.
+        """
+        data = self._request('GET', endpoint, retry=retry)
+        return None if data is None else project(data)
     
-    def get_match_entities(self, numero_match: int) -> Optional[Match]:
+    def get_match_entities(
+        self,
+        numero_match: int,
+        retry: Optional[RetryPolicy] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> Union[Match, tuple, None]:
         """Récupère les entités d'un match (équipes, joueurs, etc.)
         
         Args:
             numero_match: Numéro unique du match (entier)
+            retry: Politique de nouvelles tentatives pour cet appel (par défaut: celle du client)
+            fields: Champs à extraire (ex: ("ma_no", "home_score", "away_score", "status")
+                ou "home.short_name"). Retourne alors un MatchRecord (namedtuple) léger
+                au lieu d'un Match, sans construire les sous-objets non demandés.
+                Voir fffdata.models.projection.
         
         Returns:
-            Instance de Match avec toutes les données structurées, ou None si le match n'existe pas
+            Instance de Match avec toutes les données structurées (ou MatchRecord avec
+            fields), ou None si le match n'existe pas
         
         Raises:
             InvalidMatchNumberError: Si le numéro de match est invalide
@@ -107,24 +452,27 @@ class FFFClient:
             >>> else:
             >>>     print("Match non trouvé")
         """
-        if not isinstance(numero_match, int) or numero_match <= 0:
-            raise InvalidMatchNumberError(
-                "Le numéro de match doit être un entier positif"
-            )
-        
-        endpoint = f"/api/match_entities/{numero_match}.json"
-        data = self._request('GET', endpoint)
+        _check_numero(numero_match, "de match")
         
-        if data is None:
-            return None
-        
-        return Match.from_dict(data)
+        endpoint = FFFEndpoints.match_entities(numero_match)
+        if fields is not None:
+            return self._get_record(endpoint, projection(Match, fields), retry)
+        parser = partial(Match.from_dict, lazy=self.lazy, context=self.identity_map)
+        return self._get_model(endpoint, parser, retry)
     
-    def get_club(self, numero_club: int) -> Optional[Club]:
+    def get_club(
+        self,
+        numero_club: int,
+        retry: Optional[RetryPolicy] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> Union[Club, tuple, None]:
         """Récupère les informations d'un club
         
         Args:
             numero_club: Numéro unique du club (entier)
+            retry: Politique de nouvelles tentatives pour cet appel (par défaut: celle du client)
+            fields: Champs à extraire ; retourne alors un ClubRecord (namedtuple)
+                au lieu d'un Club (voir get_match_entities)
         
         Returns:
             Instance de Club avec toutes les données structurées, ou None si le club n'existe pas
@@ -142,22 +490,237 @@ class FFFClient:
             >>> else:
             >>>     print("Club non trouvé")
         """
-        if not isinstance(numero_club, int) or numero_club <= 0:
-            raise InvalidMatchNumberError(
-                "Le numéro de club doit être un entier positif"
-            )
+        _check_numero(numero_club, "de club")
+        
+        endpoint = FFFEndpoints.club(numero_club)
+        if fields is not None:
+            return self._get_record(endpoint, projection(Club, fields), retry)
+        parser = partial(Club.from_dict, lazy=self.lazy, context=self.identity_map)
+        return self._get_model(endpoint, parser, retry)
+    
+    def get_match_feuille(self, numero_match: int) -> Optional[JSONData]:
+        """Récupère la feuille de match (JSON brut)"""
+        _check_numero(numero_match, "de match")
+        return self._request('GET', FFFEndpoints.match_feuille(numero_match))
+    
+    def get_club_equipes(self, numero_club: int) -> Optional[JSONData]:
+        """Récupère toutes les équipes d'un club (JSON brut)"""
+        _check_numero(numero_club, "de club")
+        return self._request('GET', FFFEndpoints.club_equipes(numero_club))
+    
+    def get_competition(self, numero_competition: int) -> Optional[JSONData]:
+        """Récupère les informations d'une compétition (JSON brut)"""
+        _check_numero(numero_competition, "de compétition")
+        return self._request('GET', FFFEndpoints.competition(numero_competition))
+    
+    def get_competition_poules(
+        self,
+        numero_competition: int,
+        phase: int = 1
+    ) -> Optional[JSONData]:
+        """Récupère les poules d'une phase de compétition (JSON brut)"""
+        _check_numero(numero_competition, "de compétition")
+        return self._request(
+            'GET', FFFEndpoints.competition_poules(numero_competition, phase)
+        )
+    
+    def get_competition_classement(
+        self,
+        numero_competition: int,
+        phase: int = 1,
+        poule: int = 1
+    ) -> Optional[JSONData]:
+        """Récupère le classement d'une poule (JSON brut)"""
+        _check_numero(numero_competition, "de compétition")
+        return self._request(
+            'GET', FFFEndpoints.competition_classement(numero_competition, phase, poule)
+        )
+    
+    def get_competition_calendrier(
+        self,
+        numero_competition: int,
+        phase: int = 1,
+        poule: int = 1
+    ) -> Optional[JSONData]:
+        """Récupère le calendrier d'une poule (JSON brut)"""
+        _check_numero(numero_competition, "de compétition")
+        return self._request(
+            'GET', FFFEndpoints.competition_calendrier(numero_competition, phase, poule)
+        )
+    
+    def get_equipe(self, numero_equipe: int) -> Optional[JSONData]:
+        """Récupère les informations d'une équipe (JSON brut)"""
+        _check_numero(numero_equipe, "d'équipe")
+        return self._request('GET', FFFEndpoints.equipe(numero_equipe))
+    
+    def get_equipe_effectif(self, numero_equipe: int) -> Optional[JSONData]:
+        """Récupère l'effectif d'une équipe (JSON brut)"""
+        _check_numero(numero_equipe, "d'équipe")
+        return self._request('GET', FFFEndpoints.equipe_effectif(numero_equipe))
+    
+    def get_equipe_matchs(self, numero_equipe: int) -> Optional[JSONData]:
+        """Récupère tous les matchs d'une équipe (JSON brut)"""
+        _check_numero(numero_equipe, "d'équipe")
+        return self._request('GET', FFFEndpoints.equipe_matchs(numero_equipe))
+    
+    def get_joueur(self, numero_licence: int) -> Optional[JSONData]:
+        """Récupère les informations d'un joueur (JSON brut)"""
+        _check_numero(numero_licence, "de licence")
+        return self._request('GET', FFFEndpoints.joueur(numero_licence))
+    
+    def get_arbitre(self, numero_arbitre: int) -> Optional[JSONData]:
+        """Récupère les informations d'un arbitre (JSON brut)"""
+        _check_numero(numero_arbitre, "d'arbitre")
+        return self._request('GET', FFFEndpoints.arbitre(numero_arbitre))
+    
+    def get_terrain(self, numero_terrain: int) -> Optional[JSONData]:
+        """Récupère les informations d'un terrain (JSON brut)"""
+        _check_numero(numero_terrain, "de terrain")
+        return self._request('GET', FFFEndpoints.terrain(numero_terrain))
+    
+    def get_matches_bulk(
+        self,
+        numeros_match: Iterable[int],
+        max_workers: int = 8,
+        fields: Optional[Sequence[str]] = None
+    ) -> Iterator[Tuple[int, Union[Match, tuple, None, Exception]]]:
+        """Récupère un grand nombre de matchs en parallèle
         
-        endpoint = f"/api/clubs/{numero_club}.json"
-        data = self._request('GET', endpoint)
+        Les requêtes sont réparties sur un pool de threads qui partage le pool de
+        connexions du client. Les résultats sont produits
+        dans l'ordre de complétion, au fil de l'eau : seule une fenêtre bornée de
+        requêtes est en vol, la mémoire reste constante quel que soit le nombre
+        de numéros.
         
-        if data is None:
-            return None
+        Args:
+            numeros_match: Numéros des matchs à récupérer (itérable, éventuellement paresseux)
+            max_workers: Nombre de threads (par défaut: 8, à garder inférieur ou égal
+                à pool_maxsize)
+            fields: Champs à extraire de chaque match (voir get_match_entities)
+        
+        Yields:
+            Tuples (numero_match, résultat) où résultat est un Match (ou un
+            MatchRecord avec fields), None si le
+            match n'existe pas, ou l'exception levée pour ce numéro. Une erreur sur
+            un match n'interrompt pas le lot.
+        
+        Raises:
+            ValueError: Dès l'appel, si max_workers n'est pas strictement positif
+                ou si un champ de fields est inconnu
+            TypeError: Dès l'appel, si numeros_match n'est pas itérable
+        
+        Example:
+            >>> with FFFClient() as client:
+            >>>     for numero, resultat in client.get_matches_bulk(numeros):
+            >>>         if isinstance(resultat, Exception):
+            >>>             print(f"Erreur pour {numero}: {resultat}")
+            >>>         elif resultat is not None:
+            >>>             print(resultat.get_score())
+        """
+        if fields is not None:
+            projection(Match, fields)
+        fetch = partial(self.get_match_entities, fields=fields)
+        return self._bulk(fetch, numeros_match, max_workers)
+    
+    def get_clubs_bulk(
+        self,
+        numeros_club: Iterable[int],
+        max_workers: int = 8,
+        fields: Optional[Sequence[str]] = None
+    ) -> Iterator[Tuple[int, Union[Club, tuple, None, Exception]]]:
+        """Récupère un grand nombre de clubs en parallèle
+        
+        Même fonctionnement que get_matches_bulk.
+        
+        Args:
+            numeros_club: Numéros des clubs à récupérer
+            max_workers: Nombre de threads (par défaut: 8)
+            fields: Champs à extraire de chaque club (voir get_club)
+        
+        Yields:
+            Tuples (numero_club, Club | ClubRecord | None | exception) dans l'ordre de complétion
+        
+        Raises:
+            ValueError, TypeError: Dès l'appel, comme get_matches_bulk
+        """
+        if fields is not None:
+            projection(Club, fields)
+        fetch = partial(self.get_club, fields=fields)
+        return self._bulk(fetch, numeros_club, max_workers)
+    
+    def _bulk(
+        self,
+        fetch: Callable[[int], Any],
+        numeros: Iterable[int],
+        max_workers: int
+    ) -> Iterator[Tuple[int, Any]]:
+        """Exécute fetch sur chaque numéro via un pool de threads
+        
+        Les arguments sont vérifiés dès l'appel, avant la création du générateur.
+        """
+        if max_workers <= 0:
+            raise ValueError("max_workers doit être strictement positif")
+        return self._bulk_results(fetch, iter(numeros), max_workers)
+    
+    def _bulk_results(
+        self,
+        fetch: Callable[[int], Any],
+        iterateur: Iterator[int],
+        max_workers: int
+    ) -> Iterator[Tuple[int, Any]]:
+        """Générateur de _bulk
+        
+        Au plus 2 * max_workers requêtes sont soumises à la fois : une nouvelle
+        requête n'est soumise que lorsqu'un résultat est produit.
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="fffdata-bulk"
+        )
+        en_cours = {}
+        
+        try:
+            for numero in islice(iterateur, 2 * max_workers):
+                en_cours[executor.submit(fetch, numero)] = numero
+            
+            while en_cours:
+                termines, _ = wait(en_cours, return_when=FIRST_COMPLETED)
+                for future in termines:
+                    numero = en_cours.pop(future)
+                    try:
+                        resultat = future.result()
+                    except Exception as e:
+                        resultat = e
+                    
+                    # Remplir la fenêtre avant de rendre la main à l'appelant
+                    for suivant in islice(iterateur, 1):
+                        en_cours[executor.submit(fetch, suivant)] = suivant
+                    
+                    yield numero, resultat
+        finally:
+            for future in en_cours:
+                future.cancel()
+            executor.shutdown(wait=True)
+    
+    def invalidate(self, endpoint: str) -> None:
+        """Oublie une ressource dans tous les caches du client
         
-        return Club.from_dict(data)
+        Args:
+            endpoint: Endpoint de la ressource (ex: FFFEndpoints.match_entities(28541157))
+        """
+        if self.entity_cache is not None:
+            self.entity_cache.invalidate(endpoint)
+        if self.validators is not None:
+            self.validators.invalidate(f"{self.base_url}{endpoint}")
+        if self.cache is not None:
+            self.cache.delete(f"{self.base_url}{endpoint}")
     
     def close(self):
-        """Ferme la session HTTP"""
-        self.session.close()
+        """Ferme les sessions HTTP et le pool de connexions"""
+        with self._sessions_lock:
+            sessions, self._sessions = list(self._sessions), weakref.WeakSet()
+        for session in sessions:
+            session.close()
     
     def __enter__(self):
         """Support du context manager"""
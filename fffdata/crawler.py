@@ -0,0 +1,430 @@
+"""Parcours complet d'une compétition
+
+Une compétition se parcourt par étapes, chacune découvrant le travail de la
+suivante :
+
+    compétition -> poules de chaque phase -> calendrier de chaque poule -> matchs
+
+Toutes les étapes partagent un même pool de threads (et donc le pool de
+connexions, le limiteur de débit et la politique de nouvelles tentatives du
+client). Les résultats sont produits au fil de l'eau, dans l'ordre de
+complétion.
+
+Contre-pression : les matchs découverts sont servis en priorité. Seule une
+part des threads (discovery_workers) continue à explorer les calendriers
+pendant que des matchs attendent, et l'exploration s'arrête complètement tant
+que max_pending matchs sont en attente. La file d'attente reste donc bornée
+même sur un championnat de district complet.
+
+Reprise : avec une SQLiteFrontier, le travail restant et le travail terminé
+sont enregistrés sur disque. Un parcours interrompu reprend là où il s'était
+arrêté : seuls les travaux non terminés sont rechargés, et les endpoints déjà
+vus (y compris les clubs liés à plusieurs matchs) ne sont pas récupérés deux
+fois.
+
+Example:
+    >>> with FFFClient(pool_maxsize=16) as client:
+    >>>     crawler = CompetitionCrawler(client, max_workers=16)
+    >>>     for item, resultat in crawler.crawl(423015):
+    >>>         if item.kind == MATCH and isinstance(resultat, Match):
+    >>>             print(resultat.get_score())
+
+    >>> with SQLiteFrontier("~/.cache/crawl-d1.sqlite") as frontier:
+    >>>     for item, resultat in crawler.crawl(423015, frontier=frontier):
+    >>>         ...
+"""
+
+import json
+import os
+import sqlite3
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from .client import FFFClient
+from .endpoints import FFFEndpoints
+from .models import Match
+
+
+COMPETITION = "competition"
+POULES = "poules"
+# Poules d'une phase devinée, quand la compétition ne liste pas ses phases
+PHASE_PROBE = "poules_probe"
+CALENDRIER = "calendrier"
+MATCH = "match"
+CLUB = "club"
+
+# Étapes de découverte, de la plus proche des matchs à la plus éloignée
+DISCOVERY = (CALENDRIER, POULES, PHASE_PROBE, COMPETITION)
+# Étapes terminales, servies en priorité
+LEAVES = (MATCH, CLUB)
+
+# Dernière phase essayée quand la compétition ne liste pas ses phases
+MAX_PROBED_PHASES = 10
+
+_ENDPOINTS: Dict[str, Callable[..., str]] = {
+    COMPETITION: FFFEndpoints.competition,
+    POULES: FFFEndpoints.competition_poules,
+    PHASE_PROBE: FFFEndpoints.competition_poules,
+    CALENDRIER: FFFEndpoints.competition_calendrier,
+    MATCH: FFFEndpoints.match_entities,
+    CLUB: FFFEndpoints.club,
+}
+
+
+class WorkItem(NamedTuple):
+    """Unité de travail du parcours : une route de l'API et ses paramètres
+
+    Attributes:
+        kind: Étape (COMPETITION, POULES, PHASE_PROBE, CALENDRIER, MATCH ou CLUB)
+        args: Paramètres de la route, ex: (cp_no, phase, poule) pour un calendrier
+    """
+    kind: str
+    args: Tuple[int, ...]
+
+    @property
+    def endpoint(self) -> str:
+        """Endpoint de l'API correspondant (ex: /api/match_entities/28541157.json)"""
+        return _ENDPOINTS[self.kind](*self.args)
+
+
+def _items(data: Any) -> List[Any]:
+    """Éléments d'une réponse de collection (liste JSON ou objet hydra:member)"""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        for key in ("hydra:member", "member", "items"):
+            if isinstance(data.get(key), list):
+                return data[key]
+    return []
+
+
+def _numeros(elements: Iterable[Any], keys: Sequence[str]) -> List[int]:
+    """Numéros (entiers positifs) lus sous la première clé présente de chaque élément"""
+    numeros = []
+    for element in elements:
+        if not isinstance(element, dict):
+            continue
+        for key in keys:
+            value = element.get(key)
+            if isinstance(value, int) and value > 0:
+                numeros.append(value)
+                break
+    return numeros
+
+
+class Frontier:
+    """Travail restant d'un parcours, en mémoire
+
+    Chaque endpoint n'est ajouté qu'une fois : les matchs listés par plusieurs
+    calendriers ne sont récupérés qu'une fois.
+    """
+
+    def __init__(self):
+        self._pending: Dict[str, Deque[WorkItem]] = {kind: deque() for kind in _ENDPOINTS}
+        self._seen: Set[str] = set()
+
+    def push(self, item: WorkItem) -> bool:
+        """Ajoute un travail à faire ; retourne False s'il a déjà été vu"""
+        endpoint = item.endpoint
+        if endpoint in self._seen:
+            return False
+        self._seen.add(endpoint)
+        self._pending[item.kind].append(item)
+        return True
+
+    def pop(self, kind: str) -> Optional[WorkItem]:
+        """Retire le prochain travail d'une étape, ou None si elle est vide"""
+        file = self._pending[kind]
+        return file.popleft() if file else None
+
+    def pending(self, kind: str) -> int:
+        """Nombre de travaux en attente pour une étape"""
+        return len(self._pending[kind])
+
+    def done(self, item: WorkItem) -> None:
+        """Marque un travail comme terminé (rien à faire en mémoire)"""
+
+    def checkpoint(self) -> None:
+        """Enregistre l'avancement (rien à faire en mémoire)"""
+
+
+class SQLiteFrontier(Frontier):
+    """Travail restant et terminé d'un parcours, enregistré dans une base SQLite
+
+    Chaque endpoint découvert est inscrit une fois (clé primaire) puis marqué
+    terminé quand l'appelant a traité son résultat (reprise du générateur de
+    crawl() après ce résultat). Les écritures sont regroupées en
+    transactions de checkpoint_every opérations : après un arrêt brutal, au
+    plus ce nombre de travaux est refait. Un travail découvert est toujours
+    enregistré dans la même transaction que la fin du travail qui l'a
+    découvert, ou avant.
+
+    À l'ouverture, seuls les travaux non terminés sont chargés : le coût d'une
+    reprise est proportionnel au travail restant. Un travail en erreur n'est
+    pas marqué terminé et sera retenté à la reprise suivante.
+
+    Args:
+        path: Chemin du fichier SQLite
+        checkpoint_every: Nombre d'écritures entre deux validations (par défaut: 200)
+
+    Thread-safety:
+        Utilisée par la seule boucle d'ordonnancement du crawler ; une frontière
+        par parcours.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS frontier (
+            endpoint TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            args TEXT NOT NULL,
+            done INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS frontier_pending ON frontier (done);
+    """
+
+    def __init__(self, path: str, checkpoint_every: int = 200):
+        super().__init__()
+        self.path = os.path.expanduser(path)
+        self.checkpoint_every = checkpoint_every
+        self._writes = 0
+
+        self.conn = sqlite3.connect(self.path, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self._SCHEMA)
+
+        for kind, args in self.conn.execute(
+            "SELECT kind, args FROM frontier WHERE done = 0 ORDER BY rowid"
+        ):
+            self._pending[kind].append(WorkItem(kind, tuple(json.loads(args))))
+        self.conn.execute("BEGIN")
+
+    def push(self, item: WorkItem) -> bool:
+        """Ajoute un travail à faire ; retourne False s'il a déjà été vu, même lors d'un parcours précédent"""
+        endpoint = item.endpoint
+        if endpoint in self._seen:
+            return False
+        self._seen.add(endpoint)
+        cursor = self.conn.execute(
+            "INSERT OR IGNORE INTO frontier (endpoint, kind, args) VALUES (?, ?, ?)",
+            (endpoint, item.kind, json.dumps(item.args))
+        )
+        if not cursor.rowcount:
+            return False
+        self._pending[item.kind].append(item)
+        self._written()
+        return True
+
+    def done(self, item: WorkItem) -> None:
+        """Marque un travail comme terminé"""
+        self.conn.execute("UPDATE frontier SET done = 1 WHERE endpoint = ?", (item.endpoint,))
+        self._written()
+
+    def _written(self) -> None:
+        self._writes += 1
+        if self._writes >= self.checkpoint_every:
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """Valide les écritures en cours"""
+        if self.conn.in_transaction:
+            self.conn.execute("COMMIT")
+        self.conn.execute("BEGIN")
+        self._writes = 0
+
+    def completed(self) -> int:
+        """Nombre de travaux terminés, parcours précédents compris"""
+        return self.conn.execute("SELECT COUNT(*) FROM frontier WHERE done = 1").fetchone()[0]
+
+    def close(self) -> None:
+        """Valide les écritures en cours et ferme la base"""
+        if self.conn.in_transaction:
+            self.conn.execute("COMMIT")
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class CompetitionCrawler:
+    """Récupère une ou plusieurs compétitions complètes, jusqu'aux matchs
+
+    Les phases sont lues dans la réponse de la compétition (clé "phases") quand
+    elle les donne ; à défaut, les phases sont essayées une à une (travaux
+    PHASE_PROBE) tant que la précédente a des poules, jusqu'à MAX_PROBED_PHASES
+    (une requête 404 de plus par compétition sans liste de phases).
+
+    Args:
+        client: Client utilisé pour toutes les requêtes ; pool_maxsize doit être
+            au moins égal à max_workers
+        max_workers: Nombre de threads (par défaut: 8)
+        max_pending: Nombre de matchs en attente au-delà duquel l'exploration des
+            calendriers est suspendue (par défaut: 1000)
+        discovery_workers: Threads réservés à l'exploration tant que des matchs
+            attendent (par défaut: max_workers // 4, au moins 1)
+        matches: Récupère les match_entities ; False pour s'arrêter aux
+            calendriers (par défaut: True)
+        fields: Champs à extraire de chaque match (voir FFFClient.get_match_entities)
+        clubs: Récupère aussi le club de chaque équipe des matchs, une fois par
+            club (par défaut: False ; nécessite des Match complets, sans fields)
+
+    Thread-safety:
+        Un crawl() à la fois par instance ; le client peut être partagé.
+    """
+
+    def __init__(
+        self,
+        client: FFFClient,
+        max_workers: int = 8,
+        max_pending: int = 1000,
+        discovery_workers: Optional[int] = None,
+        matches: bool = True,
+        fields: Optional[Sequence[str]] = None,
+        clubs: bool = False
+    ):
+        if max_workers <= 0:
+            raise ValueError("max_workers doit être strictement positif")
+        self.client = client
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.discovery_workers = max(1, max_workers // 4) if discovery_workers is None else discovery_workers
+        self.matches = matches
+        self.fields = fields
+        self.clubs = clubs
+
+    def _fetch(self, item: WorkItem) -> Any:
+        """Exécute la requête d'un travail (dans un thread du pool)"""
+        if item.kind == COMPETITION:
+            return self.client.get_competition(*item.args)
+        if item.kind in (POULES, PHASE_PROBE):
+            return self.client.get_competition_poules(*item.args)
+        if item.kind == CALENDRIER:
+            return self.client.get_competition_calendrier(*item.args)
+        if item.kind == CLUB:
+            return self.client.get_club(*item.args)
+        return self.client.get_match_entities(*item.args, fields=self.fields)
+
+    def _expand(self, item: WorkItem, data: Any) -> List[WorkItem]:
+        """Travaux découverts dans le résultat d'un travail"""
+        if data is None or isinstance(data, Exception) or item.kind == CLUB:
+            return []
+
+        if item.kind == MATCH:
+            if not self.clubs or not isinstance(data, Match):
+                return []
+            equipes = (data.home, data.away)
+            return [WorkItem(CLUB, (e.club.cl_no,)) for e in equipes if e.club is not None and e.club.cl_no]
+
+        if item.kind == COMPETITION:
+            (cp_no,) = item.args
+            phases = _numeros(data.get("phases") or [], ("number", "ph_no")) if isinstance(data, dict) else []
+            if not phases:
+                return [WorkItem(PHASE_PROBE, (cp_no, 1))]
+            return [WorkItem(POULES, (cp_no, phase)) for phase in phases]
+
+        if item.kind in (POULES, PHASE_PROBE):
+            cp_no, phase = item.args
+            poules = _numeros(_items(data), ("stage_number", "number", "gp_no"))
+            suivants = [WorkItem(CALENDRIER, (cp_no, phase, poule)) for poule in poules]
+            if poules and item.kind == PHASE_PROBE and phase < MAX_PROBED_PHASES:
+                suivants.append(WorkItem(PHASE_PROBE, (cp_no, phase + 1)))
+            return suivants
+
+        if not self.matches:
+            return []
+        return [WorkItem(MATCH, (ma_no,)) for ma_no in _numeros(_items(data), ("ma_no",))]
+
+    def _next(self, frontier: Frontier, discovering: int) -> Optional[WorkItem]:
+        """Choisit le prochain travail à soumettre (contre-pression entre étapes)"""
+        attente = sum(frontier.pending(kind) for kind in LEAVES)
+        if attente < self.max_pending and (not attente or discovering < self.discovery_workers):
+            for kind in DISCOVERY:
+                item = frontier.pop(kind)
+                if item is not None:
+                    return item
+        for kind in LEAVES:
+            item = frontier.pop(kind)
+            if item is not None:
+                return item
+        return None
+
+    def crawl(
+        self,
+        *numeros_competition: int,
+        frontier: Optional[Frontier] = None
+    ) -> Iterator[Tuple[WorkItem, Any]]:
+        """Parcourt les compétitions et produit les résultats au fil de l'eau
+
+        Args:
+            *numeros_competition: Numéros des compétitions (cp_no) ; peut être
+                vide pour terminer un parcours enregistré dans frontier
+            frontier: Frontière à utiliser, ex: SQLiteFrontier pour un parcours
+                reprenable (par défaut: en mémoire). Les travaux déjà terminés
+                qu'elle contient ne sont pas refaits.
+
+        Yields:
+            Tuples (WorkItem, résultat) dans l'ordre de complétion. Le résultat
+            est le JSON brut pour la compétition, les poules et les calendriers,
+            un Match (ou MatchRecord avec fields) pour un match, un Club pour
+            un club, None si la
+            ressource n'existe pas, ou l'exception levée pour ce travail. Une
+            erreur n'interrompt pas le parcours.
+        """
+        if frontier is None:
+            frontier = Frontier()
+        for cp_no in numeros_competition:
+            frontier.push(WorkItem(COMPETITION, (cp_no,)))
+        return self._run(frontier)
+
+    def _run(self, frontier: Frontier) -> Iterator[Tuple[WorkItem, Any]]:
+        """Boucle d'ordonnancement : une fenêtre de 2 * max_workers travaux en vol"""
+        fenetre = 2 * self.max_workers
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="fffdata-crawl"
+        )
+        en_cours: Dict[Any, WorkItem] = {}
+        discovering = 0
+
+        def remplir():
+            nonlocal discovering
+            while len(en_cours) < fenetre:
+                item = self._next(frontier, discovering)
+                if item is None:
+                    return
+                if item.kind in DISCOVERY:
+                    discovering += 1
+                en_cours[executor.submit(self._fetch, item)] = item
+
+        try:
+            remplir()
+            while en_cours:
+                termines, _ = wait(en_cours, return_when=FIRST_COMPLETED)
+                for future in termines:
+                    item = en_cours.pop(future)
+                    if item.kind in DISCOVERY:
+                        discovering -= 1
+                    try:
+                        resultat = future.result()
+                    except Exception as e:
+                        resultat = e
+
+                    for suivant in self._expand(item, resultat):
+                        frontier.push(suivant)
+
+                    # Remplir la fenêtre avant de rendre la main à l'appelant
+                    remplir()
+                    yield item, resultat
+                    # Terminé seulement une fois le résultat traité : si l'appelant
+                    # lève une exception, le travail sera refait à la reprise
+                    if not isinstance(resultat, Exception):
+                        frontier.done(item)
+        finally:
+            for future in en_cours:
+                future.cancel()
+            executor.shutdown(wait=True)
+            frontier.checkpoint()
@@ -0,0 +1,129 @@
+"""Conversion des dates et heures de l'API FFF
+
+L'API donne la date d'un match sous forme ISO à minuit UTC
+("2024-03-17T00:00:00+00:00") et l'heure locale séparément ("15H00"). Le coup
+d'envoi est reconstruit dans le fuseau Europe/Paris. Les horodatages
+(external_updated_at) sont des dates ISO avec décalage.
+
+Les conversions sont mises en cache par chaîne : sur une saison, les mêmes
+dates et heures reviennent des centaines de fois. Les fonctions *_array
+convertissent toute une colonne en datetime64 (numpy) en ne parsant chaque
+valeur distincte qu'une fois.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Iterable, List, Optional, Sequence, TypeVar
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # pragma: no cover - Python < 3.9
+    from backports.zoneinfo import ZoneInfo
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    np = None
+
+
+PARIS = ZoneInfo("Europe/Paris")
+
+# Valeur int64 de NaT (date inconnue) en datetime64
+_NAT = -(2 ** 63)
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=4096)
+def parse_kickoff(date: Optional[str], time: Optional[str]) -> Optional[datetime]:
+    """Retourne le coup d'envoi (heure de Paris) d'un match
+
+    Args:
+        date: Date du match, ISO ("2024-03-17T00:00:00+00:00") ou "2024-03-17"
+        time: Heure locale du match ("15H00"), minuit si absente ou invalide
+
+    Returns:
+        datetime avec fuseau Europe/Paris, ou None si la date est absente ou invalide
+    """
+    if not date:
+        return None
+    try:
+        jour = datetime.strptime(date[:10], "%Y-%m-%d")
+    except ValueError:
+        return None
+
+    heure = minute = 0
+    if time:
+        h, _, m = time.upper().partition("H")
+        if h.isdigit() and (m.isdigit() or not m) and int(h) < 24 and int(m or 0) < 60:
+            heure, minute = int(h), int(m or 0)
+    return jour.replace(hour=heure, minute=minute, tzinfo=PARIS)
+
+
+@lru_cache(maxsize=16384)
+def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Convertit un horodatage ISO de l'API en datetime (heure de Paris)
+
+    Args:
+        value: Horodatage ISO ("2024-03-12T09:41:17+00:00"), heure de Paris si
+            sans décalage
+
+    Returns:
+        datetime avec fuseau Europe/Paris, ou None si la valeur est absente ou invalide
+    """
+    if not value:
+        return None
+    try:
+        # fromisoformat n'accepte le suffixe Z qu'à partir de Python 3.11
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=PARIS)
+    return moment.astimezone(PARIS)
+
+
+def _array(keys: Iterable[tuple], parse: Callable[..., Optional[datetime]]) -> "np.ndarray":
+    """Convertit des valeurs en datetime64[s] UTC, chaque valeur distincte une seule fois"""
+    if np is None:
+        raise ImportError("numpy n'est pas installé (pip install fffdata[analytics])")
+    distincts = {}
+    codes = [distincts.setdefault(key, len(distincts)) for key in keys]
+    stamps = [parse(*key) for key in distincts]
+    secondes = np.array(
+        [_NAT if s is None else int(s.timestamp()) for s in stamps],
+        dtype="int64"
+    )
+    return secondes[np.array(codes, dtype=np.intp)].view("datetime64[s]")
+
+
+def kickoff_array(dates: Sequence[Optional[str]], times: Sequence[Optional[str]]) -> "np.ndarray":
+    """Coups d'envoi d'une colonne de matchs, en datetime64[s] UTC (NaT si inconnu)
+
+    Args:
+        dates: Dates des matchs (Match.date)
+        times: Heures des matchs (Match.time), dans le même ordre
+    """
+    return _array(zip(dates, times), parse_kickoff)
+
+
+def datetime_array(values: Iterable[Optional[str]]) -> "np.ndarray":
+    """Horodatages ISO (ex: external_updated_at) en datetime64[s] UTC (NaT si inconnu)"""
+    return _array(((v,) for v in values), parse_datetime)
+
+
+def sort_by_kickoff(matches: Iterable[T], reverse: bool = False) -> List[T]:
+    """Trie des matchs par coup d'envoi, ceux sans date en dernier
+
+    Args:
+        matches: Match (ou tout objet ayant un attribut kickoff)
+        reverse: Du plus récent au plus ancien (les matchs sans date restent en dernier)
+    """
+    matches = list(matches)
+    kickoffs = [m.kickoff for m in matches]
+    connus = sorted(
+        (i for i, k in enumerate(kickoffs) if k is not None),
+        key=kickoffs.__getitem__,
+        reverse=reverse
+    )
+    return [matches[i] for i in connus] + [m for m, k in zip(matches, kickoffs) if k is None]
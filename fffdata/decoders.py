@@ -0,0 +1,47 @@
+"""Décodeurs JSON utilisables par les clients FFF"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    orjson = None
+
+
+# Un décodeur prend le corps brut d'une réponse (bytes) et retourne l'objet JSON.
+# Il doit lever ValueError (ou une sous-classe) si le corps n'est pas un JSON valide.
+JSONDecoder = Callable[[bytes], Any]
+
+
+def stdlib_decoder(body: bytes) -> Any:
+    """Décode avec le module json de la bibliothèque standard
+
+    json.loads accepte directement des bytes UTF-8 : aucune conversion
+    intermédiaire en texte n'est faite côté client.
+    """
+    return json.loads(body)
+
+
+def get_decoder(name: Optional[str] = None) -> JSONDecoder:
+    """Retourne un décodeur JSON
+
+    Args:
+        name: "orjson", "json", ou None pour le plus rapide disponible
+
+    Returns:
+        Fonction de décodage bytes -> objet JSON
+
+    Raises:
+        ImportError: Si le décodeur demandé n'est pas installé
+        ValueError: Si le nom est inconnu
+    """
+    if name is None:
+        return orjson.loads if orjson is not None else stdlib_decoder
+    if name == "orjson":
+        if orjson is None:
+            raise ImportError("orjson n'est pas installé (pip install fffdata[fast])")
+        return orjson.loads
+    if name == "json":
+        return stdlib_decoder
+    raise ValueError(f"Décodeur JSON inconnu: {name}")
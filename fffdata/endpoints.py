@@ -16,6 +16,29 @@ class FFFEndpoints:
     
     BASE_URL = "https://api-dofa.fff.fr"
     
+    @staticmethod
+    def family(endpoint: str) -> str:
+        """
+        Retourne la famille de route d'un endpoint
+        
+        La famille regroupe les endpoints de même nature, par exemple pour
+        appliquer une même politique de cache ou de débit.
+        
+        Args:
+            endpoint: Endpoint de l'API (ex: /api/clubs/10000/equipes.json)
+        
+        Returns:
+            Ressource principale, suivie de la sous-ressource éventuelle
+            (ex: "clubs", "clubs/equipes", "competitions/calendrier")
+        """
+        parts = endpoint.split('?', 1)[0].strip('/').split('/')
+        if len(parts) < 2:
+            return parts[0]
+        family = parts[1]
+        if len(parts) > 3:
+            family += '/' + parts[-1].split('.', 1)[0]
+        return family
+    
     # ==================== MATCHS ====================
     
     @staticmethod
@@ -258,7 +281,7 @@ class FFFEndpoints:
     # ==================== ARBITRES ====================
     
     @staticmethod
-    def joueur(numero_arbitre: int) -> str:
+    def arbitre(numero_arbitre: int) -> str:
         """
         Récupère les informations d'un arbitre
         
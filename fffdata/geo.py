@@ -0,0 +1,365 @@
+"""Index spatial des terrains, clubs et matchs
+
+Les points sont rangés dans une grille régulière en degrés (cellules de
+cell_km de côté en latitude). Une recherche par rayon ne parcourt que les
+cellules qui recouvrent le cercle ; une recherche des k plus proches parcourt
+les cellules par anneaux autour du point et s'arrête dès qu'aucun anneau
+suivant ne peut contenir de point plus proche. Les distances sont calculées
+par la formule de haversine, en kilomètres.
+
+Chaque point est identifié par une clé (type, numéro) : ("terrain", te_no),
+("club", cl_no) ou ("match", ma_no). Les terrains d'un match (TerrainMatch)
+n'ont pas de coordonnées : elles sont retrouvées par te_no parmi les terrains
+des clubs déjà indexés.
+
+Example:
+    >>> index = GeoIndex()
+    >>> index.add_clubs(clubs)
+    >>> index.add_matches(matchs)
+    >>> for distance, (_, ma_no) in index.within(45.44, 4.39, 20, kind=MATCH):
+    >>>     print(ma_no, f"{distance:.1f} km")
+    >>> index.save("geo.json")
+"""
+
+import heapq
+import json
+import math
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+TERRAIN = "terrain"
+CLUB = "club"
+MATCH = "match"
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+Key = Tuple[str, int]
+Cell = Tuple[int, int]
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Distance en kilomètres entre deux points (latitude, longitude en degrés)"""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    a = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _coordinates(obj: Any) -> Optional[Tuple[float, float]]:
+    latitude = getattr(obj, "latitude", None)
+    longitude = getattr(obj, "longitude", None)
+    if latitude is None or longitude is None:
+        return None
+    return float(latitude), float(longitude)
+
+
+class GeoIndex:
+    """Index spatial en grille, avec ajouts et suppressions incrémentaux
+
+    Args:
+        cell_km: Côté des cellules en kilomètres (en latitude) ; de l'ordre du
+            rayon des recherches les plus fréquentes (par défaut: 10)
+    """
+
+    def __init__(self, cell_km: float = 10.0):
+        if cell_km <= 0:
+            raise ValueError("cell_km doit être strictement positif")
+        self.cell_km = cell_km
+        self._size = cell_km / KM_PER_DEGREE
+        self._points: Dict[Key, Tuple[float, float]] = {}
+        self._cells: Dict[Cell, Dict[Key, Tuple[float, float]]] = {}
+        self._bounds: Optional[List[int]] = None  # [i_min, i_max, j_min, j_max]
+
+    def _index(self, degres: float) -> int:
+        return int(math.floor(degres / self._size))
+
+    def _cell(self, latitude: float, longitude: float) -> Cell:
+        return self._index(latitude), self._index(longitude)
+
+    # ==================== AJOUTS ====================
+
+    def add(self, key: Key, latitude: float, longitude: float) -> None:
+        """Indexe un point (le déplace s'il est déjà indexé)"""
+        if not -90 <= latitude <= 90 or not -180 <= longitude <= 180:
+            raise ValueError(f"Coordonnées invalides: {latitude}, {longitude}")
+        key = (key[0], key[1])
+        self.remove(key)
+        cell = self._cell(latitude, longitude)
+        self._points[key] = (latitude, longitude)
+        self._cells.setdefault(cell, {})[key] = (latitude, longitude)
+
+        i, j = cell
+        if self._bounds is None:
+            self._bounds = [i, i, j, j]
+        else:
+            b = self._bounds
+            b[0], b[1], b[2], b[3] = min(b[0], i), max(b[1], i), min(b[2], j), max(b[3], j)
+
+    def remove(self, key: Key) -> bool:
+        """Retire un point ; retourne False s'il n'était pas indexé"""
+        position = self._points.pop(key, None)
+        if position is None:
+            return False
+        cell = self._cell(*position)
+        points = self._cells[cell]
+        del points[key]
+        if not points:
+            del self._cells[cell]
+        return True
+
+    def add_terrain(self, terrain: Any) -> bool:
+        """Indexe un Terrain ; retourne False s'il n'a pas de coordonnées"""
+        position = _coordinates(terrain)
+        if position is None:
+            return False
+        self.add((TERRAIN, terrain.te_no), *position)
+        return True
+
+    def add_club(self, club: Any) -> bool:
+        """Indexe un Club et ceux de ses terrains qui ont des coordonnées
+
+        Returns:
+            False si le club lui-même n'a pas de coordonnées
+        """
+        for terrain in club.terrains:
+            self.add_terrain(terrain)
+        position = _coordinates(club)
+        if position is None:
+            return False
+        self.add((CLUB, club.cl_no), *position)
+        return True
+
+    def add_clubs(self, clubs: Iterable[Any]) -> None:
+        """Indexe une liste de clubs et leurs terrains"""
+        for club in clubs:
+            self.add_club(club)
+
+    def locate(self, match: Any) -> Optional[Tuple[float, float]]:
+        """Coordonnées du terrain d'un match, si ce terrain est indexé"""
+        terrain = match.terrain
+        if terrain is None:
+            return None
+        return self._points.get((TERRAIN, terrain.te_no))
+
+    def add_match(self, match: Any) -> bool:
+        """Indexe un match à la position de son terrain
+
+        Returns:
+            False si le terrain du match n'est pas (encore) indexé
+        """
+        position = self.locate(match)
+        if position is None:
+            return False
+        self.add((MATCH, match.ma_no), *position)
+        return True
+
+    def add_matches(self, matches: Iterable[Any]) -> int:
+        """Indexe une liste de matchs ; retourne le nombre de matchs localisés"""
+        return sum(self.add_match(match) for match in matches)
+
+    # ==================== RECHERCHES ====================
+
+    def _lon_span(self, latitude: float, km: float) -> float:
+        """Écart de longitude (degrés) couvrant km à cette latitude"""
+        cos = math.cos(math.radians(min(89.9, abs(latitude))))
+        return min(180.0, km / (KM_PER_DEGREE * cos))
+
+    def _lon_ranges(self, longitude: float, span: float) -> List[Tuple[float, float]]:
+        """Intervalles de longitude de [longitude - span, longitude + span], antiméridien compris"""
+        if span >= 180:
+            return [(-180.0, 180.0)]
+        debut, fin = longitude - span, longitude + span
+        intervalles = [(max(debut, -180.0), min(fin, 180.0))]
+        if debut < -180:
+            intervalles.append((debut + 360, 180.0))
+        if fin > 180:
+            intervalles.append((-180.0, fin - 360))
+        return intervalles
+
+    def within(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        kind: Optional[str] = None
+    ) -> List[Tuple[float, Key]]:
+        """Points à moins de radius_km, du plus proche au plus éloigné
+
+        Ne parcourt que les cellules occupées qui recouvrent le cercle : la
+        boîte de recherche est bornée par l'étendue de l'index, et quand elle
+        compte plus de cellules que l'index n'en occupe, ce sont les cellules
+        occupées qui sont parcourues. Les recherches qui franchissent
+        l'antiméridien trouvent les points de l'autre côté.
+
+        Args:
+            latitude, longitude: Centre de la recherche
+            radius_km: Rayon en kilomètres
+            kind: Limite la recherche à un type (TERRAIN, CLUB ou MATCH)
+
+        Returns:
+            Liste de (distance en km, clé)
+        """
+        if self._bounds is None:
+            return []
+        b = self._bounds
+        dlat = radius_km / KM_PER_DEGREE
+        dlon = self._lon_span(max(abs(latitude - dlat), abs(latitude + dlat)), radius_km)
+        i0 = max(b[0], self._index(latitude - dlat))
+        i1 = min(b[1], self._index(latitude + dlat))
+        colonnes = []
+        for debut, fin in self._lon_ranges(longitude, dlon):
+            j0, j1 = max(b[2], self._index(debut)), min(b[3], self._index(fin))
+            if j0 <= j1:
+                colonnes.append((j0, j1))
+        if i0 > i1 or not colonnes:
+            return []
+
+        boite = (i1 - i0 + 1) * sum(j1 - j0 + 1 for j0, j1 in colonnes)
+        if boite > len(self._cells):
+            cellules = [
+                points for (i, j), points in self._cells.items()
+                if i0 <= i <= i1 and any(j0 <= j <= j1 for j0, j1 in colonnes)
+            ]
+        else:
+            cellules = [
+                self._cells[(i, j)]
+                for i in range(i0, i1 + 1)
+                for j0, j1 in colonnes
+                for j in range(j0, j1 + 1)
+                if (i, j) in self._cells
+            ]
+
+        resultats = []
+        for points in cellules:
+            for key, (lat, lon) in points.items():
+                if kind is not None and key[0] != kind:
+                    continue
+                distance = haversine(latitude, longitude, lat, lon)
+                if distance <= radius_km:
+                    resultats.append((distance, key))
+        resultats.sort()
+        return resultats
+
+    def _ring(self, i: int, j: int, r: int) -> List[Cell]:
+        """Cellules à la distance de Tchebychev r de (i, j), dans l'étendue de l'index"""
+        if r == 0:
+            return [(i, j)]
+        b = self._bounds
+        j0, j1 = max(b[2], j - r), min(b[3], j + r)
+        i0, i1 = max(b[0], i - r + 1), min(b[1], i + r - 1)
+        cellules = []
+        for ligne in (i - r, i + r):
+            if b[0] <= ligne <= b[1]:
+                cellules.extend((ligne, c) for c in range(j0, j1 + 1))
+        for colonne in (j - r, j + r):
+            if b[2] <= colonne <= b[3]:
+                cellules.extend((l, colonne) for l in range(i0, i1 + 1))
+        return cellules
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 10,
+        kind: Optional[str] = None,
+        max_km: Optional[float] = None
+    ) -> List[Tuple[float, Key]]:
+        """Les k points les plus proches, du plus proche au plus éloigné
+
+        Parcourt les anneaux de cellules autour du point, bornés à l'étendue de
+        l'index ; dès qu'un anneau compte plus de cellules que l'index n'en
+        occupe, les cellules occupées restantes sont parcourues directement.
+
+        Args:
+            latitude, longitude: Point de référence
+            k: Nombre de points
+            kind: Limite la recherche à un type (TERRAIN, CLUB ou MATCH)
+            max_km: Distance maximale (par défaut: aucune)
+
+        Returns:
+            Liste de (distance en km, clé), au plus k éléments
+        """
+        if k <= 0 or self._bounds is None:
+            return []
+        i, j = self._cell(latitude, longitude)
+        b = self._bounds
+        r_max = max(abs(i - b[0]), abs(i - b[1]), abs(j - b[2]), abs(j - b[3]))
+
+        meilleurs: List[Tuple[float, Key]] = []  # tas max : (-distance, clé)
+
+        def garder(cellules: Iterable[Dict[Key, Tuple[float, float]]]) -> None:
+            for points in cellules:
+                for key, (lat, lon) in points.items():
+                    if kind is not None and key[0] != kind:
+                        continue
+                    distance = haversine(latitude, longitude, lat, lon)
+                    if max_km is not None and distance > max_km:
+                        continue
+                    if len(meilleurs) < k:
+                        heapq.heappush(meilleurs, (-distance, key))
+                    elif distance < -meilleurs[0][0]:
+                        heapq.heapreplace(meilleurs, (-distance, key))
+
+        for r in range(r_max + 1):
+            # Distance minimale d'un point hors des anneaux 0..r-1 déjà parcourus :
+            # au moins (r - 1) cellules d'écart en latitude ou en longitude ;
+            # l'écart en longitude est borné par la distance à l'antiméridien
+            marge = max(0, r - 1) * self._size
+            parallele = min(89.9, abs(latitude) + marge)
+            ecart = min(marge, 180.0 - abs(longitude))
+            borne = min(marge * KM_PER_DEGREE, haversine(parallele, 0.0, parallele, ecart))
+            if len(meilleurs) == k and -meilleurs[0][0] <= borne:
+                break
+            if max_km is not None and borne > max_km:
+                break
+            anneau = self._ring(i, j, r)
+            if len(anneau) > len(self._cells):
+                # Anneaux plus grands que l'index : parcourir les cellules occupées restantes
+                garder(
+                    points for (ci, cj), points in self._cells.items()
+                    if max(abs(ci - i), abs(cj - j)) >= r
+                )
+                break
+            garder(self._cells[cell] for cell in anneau if cell in self._cells)
+        return sorted((-d, key) for d, key in meilleurs)
+
+    def position(self, key: Key) -> Optional[Tuple[float, float]]:
+        """Coordonnées d'un point indexé"""
+        return self._points.get(key)
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._points
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    # ==================== PERSISTANCE ====================
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Forme sérialisable (JSON) de l'index"""
+        return {
+            "cell_km": self.cell_km,
+            "points": [[kind, numero, lat, lon] for (kind, numero), (lat, lon) in self._points.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GeoIndex":
+        """Reconstruit un index depuis to_dict()"""
+        index = cls(cell_km=data["cell_km"])
+        for kind, numero, lat, lon in data["points"]:
+            index.add((kind, numero), lat, lon)
+        return index
+
+    def save(self, path: str) -> None:
+        """Enregistre l'index dans un fichier JSON"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> "GeoIndex":
+        """Charge un index enregistré par save()"""
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
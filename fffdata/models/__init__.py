@@ -12,6 +12,9 @@ from .match import (
     MatchMembre,
     ClubInfo
 )
+from .lazy import LazyMatch, LazyClub
+from .identity import IdentityMap
+from .schema import projection
 
 __all__ = [
     # Club
@@ -29,4 +32,11 @@ __all__ = [
     "Team",
     "MatchMembre",
     "ClubInfo",
+    # Hydratation paresseuse
+    "LazyMatch",
+    "LazyClub",
+    # Partage des sous-entités
+    "IdentityMap",
+    # Extraction de quelques champs
+    "projection",
 ]
\ No newline at end of file
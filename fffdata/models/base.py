@@ -0,0 +1,35 @@
+"""Outils communs aux modèles de données"""
+
+from dataclasses import fields
+
+
+def slotted(cls):
+    """Reconstruit une dataclass avec des __slots__
+
+    Équivalent portable de ``@dataclass(slots=True, weakref_slot=True)``
+    (Python 3.11+) : les instances n'ont plus de ``__dict__``, ce qui divise
+    leur empreinte mémoire, tout en gardant les mêmes attributs, méthodes et
+    valeurs par défaut. Elles restent utilisables avec ``weakref``.
+
+    À appliquer au-dessus de ``@dataclass``::
+
+        @slotted
+        @dataclass
+        class Phase:
+            ...
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    namespace['__slots__'] = names
+    if not any(hasattr(base, '__weakref__') for base in cls.__bases__):
+        namespace['__slots__'] += ('__weakref__',)
+    # Les valeurs par défaut sont déjà capturées par le __init__ généré ;
+    # les laisser en attributs de classe entrerait en conflit avec les slots.
+    for name in names:
+        namespace.pop(name, None)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
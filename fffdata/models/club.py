@@ -3,48 +3,40 @@
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+from .base import slotted
+from .identity import IdentityMap
+from .schema import from_schema, schema
 
+
+@from_schema
+@slotted
 @dataclass
 class District:
     """Représente un district de football"""
+    IDENTITY = ("cg_no",)
     cg_no: int
     name: str
     short_name: str
     type_label: str
     cp_cod: List[str] = field(default_factory=list)
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "District":
-        """Crée une instance depuis un dict"""
-        return cls(
-            cg_no=data.get("cg_no"),
-            name=data.get("name", ""),
-            short_name=data.get("short_name", ""),
-            type_label=data.get("type_label", ""),
-            cp_cod=data.get("cp_cod", [])
-        )
 
 
+@from_schema
+@slotted
 @dataclass
 class Contact:
     """Représente un contact du club"""
     type: str
     type_label: str
     value: str
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "Contact":
-        """Crée une instance depuis un dict"""
-        return cls(
-            type=data.get("type", ""),
-            type_label=data.get("type_label", ""),
-            value=data.get("value", "")
-        )
 
 
+@from_schema
+@slotted
 @dataclass
 class Terrain:
     """Représente un terrain"""
+    IDENTITY = ("te_no",)
     te_no: int
     name: str
     address: Optional[str] = None
@@ -54,23 +46,10 @@ class Terrain:
     latitude: Optional[float] = None
     longitude: Optional[float] = None
     external_updated_at: Optional[str] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "Terrain":
-        """Crée une instance depuis un dict"""
-        return cls(
-            te_no=data.get("te_no"),
-            name=data.get("name", ""),
-            address=data.get("address"),
-            zip_code=data.get("zip_code"),
-            city=data.get("city"),
-            libelle_surface=data.get("libelle_surface"),
-            latitude=data.get("latitude"),
-            longitude=data.get("longitude"),
-            external_updated_at=data.get("external_updated_at")
-        )
 
 
+@from_schema
+@slotted
 @dataclass
 class Club:
     """Représente un club de football
@@ -110,48 +89,32 @@ class Club:
     membres: List[dict] = field(default_factory=list)
     
     @classmethod
-    def from_dict(cls, data: dict) -> "Club":
+    def from_dict(
+        cls,
+        data: dict,
+        lazy: bool = False,
+        context: Optional[IdentityMap] = None
+    ) -> "Club":
         """Crée une instance de Club depuis un dictionnaire
         
         Args:
             data: Dictionnaire contenant les données du club
+            lazy: Si True, retourne un LazyClub dont le district, les contacts et
+                les terrains ne sont construits qu'au premier accès
+            context: Carte d'identité partageant district et terrains entre les
+                clubs parsés
             
         Returns:
             Instance de Club
         """
-        district = None
-        if data.get("district"):
-            district = District.from_dict(data["district"])
-        
-        contacts = []
-        if data.get("contacts"):
-            contacts = [Contact.from_dict(c) for c in data["contacts"]]
-        
-        terrains = []
-        if data.get("terrains"):
-            terrains = [Terrain.from_dict(t) for t in data["terrains"]]
+        if lazy:
+            from .lazy import LazyClub
+            return LazyClub.from_raw(data, context)
         
-        return cls(
-            cl_no=data.get("cl_no"),
-            name=data.get("name", ""),
-            short_name=data.get("short_name", ""),
-            location=data.get("location", ""),
-            affiliation_number=data.get("affiliation_number"),
-            district=district,
-            department_code=data.get("department_code"),
-            colors=data.get("colors"),
-            logo=data.get("logo"),
-            address1=data.get("address1"),
-            address2=data.get("address2"),
-            address3=data.get("address3"),
-            postal_code=data.get("postal_code"),
-            distributor_office=data.get("distributor_office"),
-            latitude=data.get("latitude"),
-            longitude=data.get("longitude"),
-            contacts=contacts,
-            terrains=terrains,
-            membres=data.get("membres", [])
-        )
+        club = schema(cls).parse(cls, data, context)
+        if context is not None:
+            context.intern_fields(club)
+        return club
     
     def get_full_address(self) -> str:
         """Retourne l'adresse complète formatée"""
@@ -0,0 +1,99 @@
+"""Carte d'identité des sous-entités partagées entre modèles
+
+Sur une saison, tous les matchs d'une compétition répètent la même Competition,
+le même CDG, les mêmes Phase, Poule et ClubInfo. Parsés avec un IdentityMap, ces
+sous-objets sont résolus par identifiant naturel (cp_no, cg_no, cl_no, te_no,
+mm_no...) vers une instance unique, et les chaînes répétées (libellés,
+horodatages) sont internées.
+"""
+
+import sys
+import threading
+from dataclasses import fields
+from typing import Any, Dict, Tuple
+
+
+class IdentityMap:
+    """Partage les sous-entités identiques entre les modèles parsés
+
+    Chaque classe partageable déclare les clés de son identifiant naturel dans
+    l'attribut de classe IDENTITY. La clé d'identité inclut aussi
+    external_updated_at : deux versions différentes d'une même entité ne sont
+    jamais confondues. Les entités sans identifiant (données manquantes) ne sont
+    pas partagées.
+
+    Les modèles étant mutables, une modification d'une entité partagée est
+    visible depuis tous les modèles qui la référencent.
+
+    Args:
+        intern_strings: Interne les chaînes des modèles construits (par défaut: True)
+
+    Example:
+        >>> identites = IdentityMap()
+        >>> matchs = [Match.from_dict(d, context=identites) for d in payloads]
+        >>> matchs[0].competition is matchs[1].competition
+        True
+    """
+
+    def __init__(self, intern_strings: bool = True):
+        self.intern_strings = intern_strings
+        self.hits = 0
+        self._entities: Dict[Tuple, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, cls: type, data: dict, scope: Tuple = ()) -> Any:
+        """Retourne l'instance partagée correspondant à data, en la construisant si besoin
+
+        Args:
+            cls: Classe du modèle (ex: Competition)
+            data: Dictionnaire de l'API pour cette entité
+            scope: Identifiant du parent, pour les entités dont l'identifiant n'est
+                unique qu'au sein d'une compétition (Phase, Poule, PouleJournee)
+        """
+        identity = getattr(cls, "IDENTITY", None)
+        if identity is None:
+            return self.build(cls, data)
+
+        ids = tuple(data.get(k) for k in identity)
+        if all(v is None for v in ids):
+            return self.build(cls, data)
+
+        key = (cls, scope, ids, data.get("external_updated_at"))
+        obj = self._entities.get(key)
+        if obj is not None:
+            self.hits += 1
+            return obj
+
+        obj = self.build(cls, data)
+        with self._lock:
+            return self._entities.setdefault(key, obj)
+
+    def build(self, cls: type, data: dict) -> Any:
+        """Construit une nouvelle instance, sous-objets résolus via cette carte"""
+        obj = cls.from_dict(data, context=self)
+        self.intern_fields(obj)
+        return obj
+
+    def intern(self, value: Any) -> Any:
+        """Interne une valeur si c'est une chaîne"""
+        if self.intern_strings and type(value) is str:
+            return sys.intern(value)
+        return value
+
+    def intern_fields(self, obj: Any) -> None:
+        """Interne les attributs chaîne d'un modèle"""
+        if not self.intern_strings:
+            return
+        for f in fields(obj):
+            value = getattr(obj, f.name)
+            if type(value) is str:
+                setattr(obj, f.name, sys.intern(value))
+
+    def clear(self) -> None:
+        """Oublie toutes les entités partagées"""
+        with self._lock:
+            self._entities.clear()
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
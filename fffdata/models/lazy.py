@@ -0,0 +1,122 @@
+"""Modèles à hydratation paresseuse
+
+Un LazyMatch (ou LazyClub) garde le dictionnaire brut de l'API et ne construit
+ses sous-objets qu'au premier accès, puis les conserve. Les attributs simples
+(ma_no, scores, date, statut...) sont renseignés dès la création. Une fois tous
+les sous-objets construits, le dictionnaire brut et le contexte d'identité sont
+libérés. L'accès aux attributs est identique à celui d'un Match ou d'un Club
+classique, et isinstance(obj, Match) reste vrai. Sérialisé (to_dict, pickle...),
+un modèle paresseux est entièrement construit et relu comme un Match ou un Club.
+
+Le mode paresseux n'est avantageux que si une partie des sous-objets n'est
+jamais lue (parcours des scores et dates d'une saison, par exemple) : quand
+tous finissent par être lus, Match.from_dict est au moins aussi rapide.
+"""
+
+from dataclasses import fields
+from typing import Callable, Dict, Optional
+
+from .identity import IdentityMap
+from .club import Club
+from .match import Match
+from .schema import Schema, schema
+
+
+def _lazy_attribute(base: type, name: str, build: Callable[[dict], object]) -> property:
+    """Crée une propriété qui construit le sous-objet name au premier accès
+
+    La valeur est stockée dans le slot de la classe de base, que la propriété
+    masque. Le contexte d'identité éventuel est celui fourni à la création.
+    """
+    slot = base.__dict__[name]
+    get, set_ = slot.__get__, slot.__set__
+
+    def getter(self):
+        try:
+            return get(self)
+        except AttributeError:
+            value = build(self._raw, self._context)
+            set_(self, value)
+            _built(self)
+            return value
+
+    def setter(self, value):
+        try:
+            get(self)
+        except AttributeError:
+            set_(self, value)
+            _built(self)
+        else:
+            set_(self, value)
+
+    return property(getter, setter, doc=f"{name} (construit au premier accès)")
+
+
+def _built(obj) -> None:
+    """Compte un sous-objet construit ; libère les données brutes après le dernier"""
+    obj._pending -= 1
+    if not obj._pending:
+        obj._raw = obj._context = None
+
+
+def _make_lazy(cls: type, nested: Dict[str, Callable[[dict], object]]) -> None:
+    """Installe les propriétés paresseuses de cls pour chaque sous-objet"""
+    base = cls.__mro__[1]
+    for name, build in nested.items():
+        setattr(cls, name, _lazy_attribute(base, name, build))
+
+
+def _from_raw(cls: type, data: dict, context: Optional[IdentityMap], compiled: Schema):
+    """Crée une instance paresseuse avec ses seuls attributs simples"""
+    obj = cls.__new__(cls)
+    obj._raw = data
+    obj._context = context
+    obj._pending = len(compiled.nested)
+    compiled.assign(obj, data, context.intern if context is not None else None)
+    return obj
+
+
+def _eq(self, other) -> bool:
+    """Égalité attribut par attribut avec la classe de base (paresseuse ou non)"""
+    base = type(self).__mro__[1]
+    if not isinstance(other, base):
+        return NotImplemented
+    return all(getattr(self, f.name) == getattr(other, f.name) for f in fields(base))
+
+
+class LazyMatch(Match):
+    """Match dont les sous-objets sont construits au premier accès
+
+    Example:
+        >>> match = Match.from_dict(data, lazy=True)
+        >>> match.home_score          # disponible immédiatement
+        >>> match.home.short_name     # construit Team + ClubInfo à ce moment
+    """
+
+    __slots__ = ("_raw", "_context", "_pending")
+
+    @classmethod
+    def from_raw(cls, data: dict, context: Optional[IdentityMap] = None) -> "LazyMatch":
+        """Crée un LazyMatch depuis un dictionnaire, sans construire les sous-objets"""
+        return _from_raw(cls, data, context, schema(Match))
+
+    __eq__ = _eq
+    __hash__ = None
+
+
+class LazyClub(Club):
+    """Club dont le district, les contacts et les terrains sont construits au premier accès"""
+
+    __slots__ = ("_raw", "_context", "_pending")
+
+    @classmethod
+    def from_raw(cls, data: dict, context: Optional[IdentityMap] = None) -> "LazyClub":
+        """Crée un LazyClub depuis un dictionnaire, sans construire les sous-objets"""
+        return _from_raw(cls, data, context, schema(Club))
+
+    __eq__ = _eq
+    __hash__ = None
+
+
+_make_lazy(LazyMatch, schema(Match).nested)
+_make_lazy(LazyClub, schema(Club).nested)
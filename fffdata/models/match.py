@@ -1,29 +1,37 @@
 """Modèles de données pour les matchs"""
 
 from dataclasses import dataclass, field
+from functools import partial
 from typing import List, Optional
 from datetime import datetime
 
+from ..dates import parse_kickoff
+from .base import slotted
+from .identity import IdentityMap
+from .schema import MISSING, SCOPE, from_schema, schema
 
+
+# Statut d'un match terminé (A = Arbitré/Terminé)
+STATUT_TERMINE = "A"
+
+
+@from_schema
+@slotted
 @dataclass
 class CDG:
     """Comité Départemental ou de Gestion"""
+    IDENTITY = ("cg_no",)
     cg_no: int
     name: str
     external_updated_at: Optional[str] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "CDG":
-        return cls(
-            cg_no=data.get("cg_no"),
-            name=data.get("name", ""),
-            external_updated_at=data.get("external_updated_at")
-        )
 
 
+@from_schema
+@slotted
 @dataclass
 class Competition:
     """Représente une compétition"""
+    IDENTITY = ("cp_no", "season")
     cp_no: int
     season: int
     type: str
@@ -31,98 +39,61 @@ class Competition:
     level: str
     cdg: Optional[CDG] = None
     external_updated_at: Optional[str] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "Competition":
-        cdg = None
-        if data.get("cdg"):
-            cdg = CDG.from_dict(data["cdg"])
-        
-        return cls(
-            cp_no=data.get("cp_no"),
-            season=data.get("season"),
-            type=data.get("type", ""),
-            name=data.get("name", ""),
-            level=data.get("level", ""),
-            cdg=cdg,
-            external_updated_at=data.get("external_updated_at")
-        )
 
 
+@from_schema
+@slotted
 @dataclass
 class Phase:
     """Phase de la compétition"""
+    IDENTITY = ("number",)
     number: int
     type: str
     name: str
     external_updated_at: Optional[str] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "Phase":
-        return cls(
-            number=data.get("number"),
-            type=data.get("type", ""),
-            name=data.get("name", ""),
-            external_updated_at=data.get("external_updated_at")
-        )
 
 
+@from_schema
+@slotted
 @dataclass
 class Poule:
     """Poule de la compétition"""
+    IDENTITY = ("stage_number",)
     stage_number: int
     name: str
     poule_unique: bool
     at_least_one_match_resultat: bool
     external_updated_at: Optional[str] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "Poule":
-        return cls(
-            stage_number=data.get("stage_number"),
-            name=data.get("name", ""),
-            poule_unique=data.get("poule_unique", False),
-            at_least_one_match_resultat=data.get("at_least_one_match_resultat", False),
-            external_updated_at=data.get("external_updated_at")
-        )
 
 
+@from_schema
+@slotted
 @dataclass
 class PouleJournee:
     """Journée de poule"""
+    IDENTITY = ("number",)
     number: int
     name: str
     external_updated_at: Optional[str] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "PouleJournee":
-        return cls(
-            number=data.get("number"),
-            name=data.get("name", ""),
-            external_updated_at=data.get("external_updated_at")
-        )
 
 
+@from_schema
+@slotted
 @dataclass
 class ClubInfo:
     """Informations du club dans un match"""
+    IDENTITY = ("cl_no",)
     cl_no: int
     logo: Optional[str] = None
     external_updated_at: Optional[str] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "ClubInfo":
-        return cls(
-            cl_no=data.get("cl_no"),
-            logo=data.get("logo"),
-            external_updated_at=data.get("external_updated_at")
-        )
 
 
+@from_schema
+@slotted
 @dataclass
 class Team:
     """Équipe participant au match"""
-    club: ClubInfo
+    club: Optional[ClubInfo]
     category_code: str
     category_label: str
     category_gender: str
@@ -134,32 +105,14 @@ class Team:
     type: str
     engagements: List[dict] = field(default_factory=list)
     external_updated_at: Optional[str] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "Team":
-        club = None
-        if data.get("club"):
-            club = ClubInfo.from_dict(data["club"])
-        
-        return cls(
-            club=club,
-            category_code=data.get("category_code", ""),
-            category_label=data.get("category_label", ""),
-            category_gender=data.get("category_gender", ""),
-            number=data.get("number"),
-            code=data.get("code"),
-            short_name=data.get("short_name", ""),
-            short_name_ligue=data.get("short_name_ligue", ""),
-            short_name_federation=data.get("short_name_federation", ""),
-            type=data.get("type", ""),
-            engagements=data.get("engagements", []),
-            external_updated_at=data.get("external_updated_at")
-        )
 
 
+@from_schema
+@slotted
 @dataclass
 class TerrainMatch:
     """Terrain où se joue le match"""
+    IDENTITY = ("te_no",)
     te_no: int
     name: str
     address: Optional[str] = None
@@ -167,23 +120,14 @@ class TerrainMatch:
     city: Optional[str] = None
     libelle_surface: Optional[str] = None
     external_updated_at: Optional[str] = None
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "TerrainMatch":
-        return cls(
-            te_no=data.get("te_no"),
-            name=data.get("name", ""),
-            address=data.get("address"),
-            zip_code=data.get("zip_code"),
-            city=data.get("city"),
-            libelle_surface=data.get("libelle_surface"),
-            external_updated_at=data.get("external_updated_at")
-        )
 
 
+@from_schema
+@slotted
 @dataclass
 class MatchMembre:
     """Membre officiel du match (arbitre, etc.)"""
+    IDENTITY = ("mm_no", "po_cod", "position_ordre")
     mm_no: int
     po_cod: str
     prenom: str
@@ -192,24 +136,24 @@ class MatchMembre:
     position_ordre: int
     external_updated_at: Optional[str] = None
     
-    @classmethod
-    def from_dict(cls, data: dict) -> "MatchMembre":
-        return cls(
-            mm_no=data.get("mm_no"),
-            po_cod=data.get("po_cod", ""),
-            prenom=data.get("prenom", ""),
-            nom=data.get("nom", ""),
-            label_position=data.get("label_position", ""),
-            position_ordre=data.get("position_ordre"),
-            external_updated_at=data.get("external_updated_at")
-        )
-    
     @property
     def full_name(self) -> str:
         """Retourne le nom complet"""
         return f"{self.prenom} {self.nom}"
 
 
+def _scope(data: dict, depth: int) -> tuple:
+    """Identifiant du parent d'une phase (1), poule (2) ou journée (3) dans une compétition"""
+    keys = (
+        data.get("competition", {}).get("cp_no"),
+        data.get("phase", {}).get("number"),
+        data.get("poule", {}).get("stage_number"),
+    )
+    return keys[:depth]
+
+
+@from_schema
+@slotted
 @dataclass
 class Match:
     """Représente un match de football
@@ -229,9 +173,9 @@ class Match:
     """
     ma_no: int
     competition: Competition
-    phase: Phase
-    poule: Poule
-    poule_journee: PouleJournee
+    phase: Phase = field(metadata={SCOPE: partial(_scope, depth=1)})
+    poule: Poule = field(metadata={SCOPE: partial(_scope, depth=2)})
+    poule_journee: PouleJournee = field(metadata={SCOPE: partial(_scope, depth=3)})
     home: Team
     away: Team
     season: int
@@ -239,23 +183,23 @@ class Match:
     status_label: str
     date: str
     time: str
-    home_score: int
-    away_score: int
+    home_score: int = field(metadata={MISSING: 0})
+    away_score: int = field(metadata={MISSING: 0})
     home_resu: str
     away_resu: str
-    cr_nb_but: int
+    cr_nb_but: int = field(metadata={MISSING: 0})
     terrain: Optional[TerrainMatch] = None
     initial_date: Optional[str] = None
     ma_ar: Optional[str] = None
     ma_inver: Optional[str] = None
     ma_arret: Optional[str] = None
     is_overtime: Optional[str] = None
-    home_but_contre: int = 0
+    home_but_contre: Optional[int] = None
     home_nb_point: Optional[int] = None
     home_nb_tir_but: Optional[int] = None
     home_nb_point_pena: int = 0
     home_is_forfeit: str = "N"
-    away_but_contre: int = 0
+    away_but_contre: Optional[int] = None
     away_nb_point: Optional[int] = None
     away_nb_tir_but: Optional[int] = None
     away_nb_point_pena: int = 0
@@ -266,62 +210,37 @@ class Match:
     external_updated_at: Optional[str] = None
     
     @classmethod
-    def from_dict(cls, data: dict) -> "Match":
-        """Crée une instance de Match depuis un dictionnaire"""
-        competition = Competition.from_dict(data.get("competition", {}))
-        phase = Phase.from_dict(data.get("phase", {}))
-        poule = Poule.from_dict(data.get("poule", {}))
-        poule_journee = PouleJournee.from_dict(data.get("poule_journee", {}))
-        home = Team.from_dict(data.get("home", {}))
-        away = Team.from_dict(data.get("away", {}))
+    def from_dict(
+        cls,
+        data: dict,
+        lazy: bool = False,
+        context: Optional[IdentityMap] = None
+    ) -> "Match":
+        """Crée une instance de Match depuis un dictionnaire
         
-        terrain = None
-        if data.get("terrain"):
-            terrain = TerrainMatch.from_dict(data["terrain"])
+        Args:
+            data: Dictionnaire contenant les données du match
+            lazy: Si True, retourne un LazyMatch dont les sous-objets (compétition,
+                équipes, terrain, officiels...) ne sont construits qu'au premier accès
+            context: Carte d'identité partageant les sous-entités (compétition,
+                phase, poule, clubs, terrain, officiels) entre les matchs parsés
         
-        match_membres = []
-        if data.get("match_membres"):
-            match_membres = [MatchMembre.from_dict(m) for m in data["match_membres"]]
+        Returns:
+            Instance de Match
+        """
+        if lazy:
+            from .lazy import LazyMatch
+            return LazyMatch.from_raw(data, context)
         
-        return cls(
-            ma_no=data.get("ma_no"),
-            competition=competition,
-            phase=phase,
-            poule=poule,
-            poule_journee=poule_journee,
-            home=home,
-            away=away,
-            season=data.get("season"),
-            status=data.get("status", ""),
-            status_label=data.get("status_label", ""),
-            date=data.get("date", ""),
-            time=data.get("time", ""),
-            home_score=data.get("home_score", 0),
-            away_score=data.get("away_score", 0),
-            home_resu=data.get("home_resu", ""),
-            away_resu=data.get("away_resu", ""),
-            cr_nb_but=data.get("cr_nb_but", 0),
-            terrain=terrain,
-            initial_date=data.get("initial_date"),
-            ma_ar=data.get("ma_ar"),
-            ma_inver=data.get("ma_inver"),
-            ma_arret=data.get("ma_arret"),
-            is_overtime=data.get("is_overtime"),
-            home_but_contre=data.get("home_but_contre", 0),
-            home_nb_point=data.get("home_nb_point"),
-            home_nb_tir_but=data.get("home_nb_tir_but"),
-            home_nb_point_pena=data.get("home_nb_point_pena", 0),
-            home_is_forfeit=data.get("home_is_forfeit", "N"),
-            away_but_contre=data.get("away_but_contre", 0),
-            away_nb_point=data.get("away_nb_point"),
-            away_nb_tir_but=data.get("away_nb_tir_but"),
-            away_nb_point_pena=data.get("away_nb_point_pena", 0),
-            away_is_forfeit=data.get("away_is_forfeit", "N"),
-            seems_postponed=data.get("seems_postponed", ""),
-            match_membres=match_membres,
-            match_feuille=data.get("match_feuille"),
-            external_updated_at=data.get("external_updated_at")
-        )
+        match = schema(cls).parse(cls, data, context)
+        if context is not None:
+            context.intern_fields(match)
+        return match
+    
+    @property
+    def kickoff(self) -> Optional[datetime]:
+        """Coup d'envoi (date et heure, fuseau Europe/Paris), None si la date est inconnue"""
+        return parse_kickoff(self.date, self.time)
     
     def get_score(self) -> str:
         """Retourne le score formaté"""
@@ -340,7 +259,7 @@ class Match:
     
     def is_finished(self) -> bool:
         """Vérifie si le match est terminé"""
-        return self.status == "A"  # A = Arbitré/Terminé
+        return self.status == STATUT_TERMINE
     
     def __repr__(self) -> str:
         return f"Match(ma_no={self.ma_no}, {self.get_match_label()}, score={self.get_score()})"
\ No newline at end of file
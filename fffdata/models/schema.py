@@ -0,0 +1,378 @@
+"""Constructeurs from_dict générés depuis la définition des dataclasses
+
+Plutôt qu'une suite d'appels data.get(...) écrite à la main pour chaque modèle,
+le schéma d'une classe (champs, valeurs par défaut, types imbriqués) est lu une
+fois puis compilé en une fonction Python spécialisée, mise en cache par classe.
+
+Règles de valeur par défaut, identiques aux anciens from_dict écrits à la main :
+
+- champ avec valeur par défaut : data.get(nom, défaut), [] pour les listes ;
+- champ obligatoire : "" pour une chaîne, False pour un booléen, None sinon ;
+  la clé de métadonnée MISSING permet d'imposer une autre valeur ;
+- sous-objet obligatoire (ex: Match.competition) : toujours construit, à
+  partir de {} si la clé est absente ;
+- sous-objet Optional ou liste de sous-objets : construit seulement si la
+  valeur est non vide, None ou [] sinon.
+
+Les sous-objets passent par le contexte d'identité éventuel (voir IdentityMap) ;
+la clé de métadonnée SCOPE fournit alors l'identifiant du parent.
+"""
+
+import typing
+from dataclasses import MISSING as _NO_DEFAULT, fields
+from datetime import datetime
+from collections import namedtuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..dates import parse_datetime
+
+
+# Valeur à utiliser quand la clé est absente, pour un champ obligatoire
+MISSING = "fffdata.missing"
+# Fonction data -> identifiant du parent, pour le contexte d'identité
+SCOPE = "fffdata.scope"
+
+_LITERALS = (str, int, float, bool, type(None))
+
+
+class Schema:
+    """Parseur compilé d'une dataclass du modèle
+
+    Attributes:
+        cls: Classe du modèle
+        parse: Fonction (cls, data, context=None) construisant une instance
+        assign: Fonction (obj, data, intern=None) affectant à obj ses attributs
+            simples, chacun passé par intern s'il est donné
+        nested: Constructeurs (data, context=None) des sous-objets, par attribut
+        to_dict: Fonction instance -> dict au format de l'API
+        to_tuple: Fonction instance -> tuple des valeurs, dans l'ordre des champs
+        from_tuple: Fonction (cls, values) inverse de to_tuple
+        reduce: Implémentation de __reduce__ pour pickle
+        source: Code Python généré, pour le débogage
+    """
+
+    def __init__(self, cls: type):
+        self.cls = cls
+        self._constants: Dict[str, Any] = {}
+        self._scalar_exprs: List[Tuple[str, str]] = []
+        self._nested_exprs: Dict[str, Tuple[str, str]] = {}
+        self._nested_types: Dict[str, Tuple[type, str]] = {}
+        # Valeur par défaut de chaque attribut simple (list : liste vide neuve)
+        self.defaults: Dict[str, Any] = {}
+
+        hints = typing.get_type_hints(cls)
+        for f in fields(cls):
+            nested = _nested_type(hints[f.name])
+            if nested is None:
+                self._scalar_exprs.append((f.name, self._scalar(f, hints[f.name])))
+            else:
+                self._nested_exprs[f.name] = self._nested(f, *nested)
+                self._nested_types[f.name] = nested
+
+        self.source = self._generate() + self._generate_export()
+        namespace = dict(self._constants)
+        exec(compile(self.source, f"<from_dict {cls.__qualname__}>", "exec"), namespace)
+        self.parse: Callable = namespace["parse"]
+        self.assign: Callable = namespace["assign"]
+        self.nested: Dict[str, Callable] = {
+            name: namespace[f"build_{name}"] for name in self._nested_exprs
+        }
+        self.to_dict: Callable[[Any], dict] = namespace["to_dict"]
+        self.to_tuple: Callable[[Any], tuple] = namespace["to_tuple"]
+        self.from_tuple: Callable = namespace["from_tuple"]
+        self.reduce: Callable[[Any], tuple] = namespace["reduce"]
+
+    def _constant(self, value: Any) -> str:
+        """Rend value accessible dans le code généré sous un nom court"""
+        if type(value) in _LITERALS:
+            return repr(value)
+        name = f"_K{len(self._constants)}"
+        self._constants[name] = value
+        return name
+
+    def _scalar(self, f, hint) -> str:
+        if f.default is not _NO_DEFAULT:
+            default = f.default
+        elif f.default_factory is not _NO_DEFAULT:
+            if f.default_factory is not list:
+                raise TypeError(f"{self.cls.__name__}.{f.name} : seul list est géré en default_factory")
+            self.defaults[f.name] = list
+            return f"get({f.name!r}, [])"
+        elif MISSING in f.metadata:
+            default = f.metadata[MISSING]
+        elif hint is str:
+            default = ""
+        elif hint is bool:
+            default = False
+        else:
+            default = None
+
+        self.defaults[f.name] = default
+        if default is None:
+            return f"get({f.name!r})"
+        return f"get({f.name!r}, {self._constant(default)})"
+
+    def _nested(self, f, model: type, kind: str) -> Tuple[str, str]:
+        """Expressions construisant le sous-objet f, sans puis avec contexte"""
+        C = self._constant(model)
+        if _is_generated(model):
+            # Appel direct du parseur généré, sans passer par la méthode de classe
+            P = self._constant(schema(model).parse)
+            prefix = f"{P}({C}, "
+        else:
+            prefix = f"{C}.from_dict("
+        if SCOPE in f.metadata:
+            scope = f"{self._constant(f.metadata[SCOPE])}(data)"
+        else:
+            scope = "()"
+
+        def direct(value: str) -> str:
+            return f"{prefix}{value})"
+
+        def shared(value: str) -> str:
+            return f"context.get({C}, {value}, {scope})"
+
+        exprs = []
+        for build in (direct, shared):
+            if kind == "required":
+                exprs.append(build(f"get({f.name!r}, {{}})"))
+            elif kind == "optional":
+                exprs.append(f"{build('v')} if (v := get({f.name!r})) else None")
+            else:
+                exprs.append(f"[{build('x')} for x in v] if (v := get({f.name!r})) else []")
+        return exprs[0], exprs[1]
+
+    def _arguments(self, shared: bool) -> List[str]:
+        scalars = dict(self._scalar_exprs)
+        return [
+            scalars[f.name] if f.name in scalars else self._nested_exprs[f.name][shared]
+            for f in fields(self.cls)
+        ]
+
+    def _generate(self) -> str:
+        lines = ["def parse(cls, data, context=None):", "    get = data.get"]
+        if self._nested_exprs:
+            lines.append("    if context is None:")
+            lines.append("        return cls(")
+            lines += [f"            {arg}," for arg in self._arguments(False)]
+            lines.append("        )")
+        lines.append("    return cls(")
+        lines += [f"        {arg}," for arg in self._arguments(True)]
+        lines += ["    )", ""]
+
+        lines += ["def assign(obj, data, intern=None):", "    get = data.get", "    if intern is None:"]
+        lines += [f"        obj.{name} = {expr}" for name, expr in self._scalar_exprs]
+        lines += ["        return"]
+        lines += [f"    obj.{name} = intern({expr})" for name, expr in self._scalar_exprs]
+        lines += [""]
+
+        for name, (direct, shared) in self._nested_exprs.items():
+            lines += [
+                f"def build_{name}(data, context=None):",
+                "    get = data.get",
+                "    if context is None:",
+                f"        return {direct}",
+                f"    return {shared}",
+                "",
+            ]
+        return "\n".join(lines)
+
+    def _export(self, name: str, value: str, method: str) -> str:
+        """Expression convertissant l'attribut name (valeur value) avec method"""
+        if name not in self._nested_types:
+            return value
+        model, kind = self._nested_types[name]
+        if model in _SCHEMAS:
+            # Sous-modèle déjà compilé : appel direct de sa fonction générée
+            convert = self._constant(getattr(_SCHEMAS[model], method))
+            x, v = f"{convert}(x)", f"{convert}(v)"
+        else:
+            x, v = f"x.{method}()", f"v.{method}()"
+        if kind == "list":
+            return f"[{x} for x in v] if (v := {value}) is not None else None"
+        return f"{v} if (v := {value}) is not None else None"
+
+    def _import(self, name: str, value: str) -> str:
+        """Expression reconstruisant l'attribut name depuis sa forme to_tuple"""
+        if name not in self._nested_types:
+            return value
+        model, kind = self._nested_types[name]
+        C = self._constant(model)
+        if model in _SCHEMAS:
+            convert = f"{self._constant(_SCHEMAS[model].from_tuple)}({C}, "
+        else:
+            convert = f"{C}.from_tuple("
+        if kind == "list":
+            return f"[{convert}x) for x in {value}] if {value} is not None else None"
+        return f"{convert}{value}) if {value} is not None else None"
+
+    def _generate_export(self) -> str:
+        names = [f.name for f in fields(self.cls)]
+        lines = ["", "def to_dict(self):", "    return {"]
+        lines += [f"        {n!r}: {self._export(n, f'self.{n}', 'to_dict')}," for n in names]
+        lines += ["    }", ""]
+
+        lines += ["def to_tuple(self):", "    return ("]
+        lines += [f"        {self._export(n, f'self.{n}', 'to_tuple')}," for n in names]
+        lines += ["    )", ""]
+
+        lines += ["def from_tuple(cls, values):", f"    ({', '.join(f'f_{n}' for n in names)},) = values"]
+        lines += ["    return cls("]
+        lines += [f"        {self._import(n, f'f_{n}')}," for n in names]
+        lines += ["    )", ""]
+
+        # Les sous-objets sont confiés à pickle tels quels : ils utilisent leur
+        # propre __reduce__ et les objets partagés (IdentityMap) le restent.
+        # Un modèle paresseux est restauré sous sa classe de base, hydraté.
+        lines += ["def reduce(self):", f"    return {self._constant(self.cls)}, ("]
+        lines += [f"        self.{n}," for n in names]
+        lines += ["    )", ""]
+        return "\n".join(lines)
+
+
+def _nested_type(hint) -> Optional[Tuple[type, str]]:
+    """Retourne (classe, "required" | "optional" | "list") pour un sous-objet du modèle"""
+    origin = typing.get_origin(hint)
+    args = typing.get_args(hint)
+    if origin is typing.Union and len(args) == 2 and type(None) in args:
+        inner = args[0] if args[1] is type(None) else args[1]
+        return (inner, "optional") if _is_model(inner) else None
+    if origin is list and args and _is_model(args[0]):
+        return args[0], "list"
+    if _is_model(hint):
+        return hint, "required"
+    return None
+
+
+def _is_model(tp) -> bool:
+    return isinstance(tp, type) and hasattr(tp, "__dataclass_fields__") and hasattr(tp, "from_dict")
+
+
+def _is_generated(cls: type) -> bool:
+    """Indique si cls.from_dict est le parseur généré (appelable directement)"""
+    method = cls.__dict__.get("from_dict")
+    return isinstance(method, classmethod) and method.__func__ is getattr(_SCHEMAS.get(cls), "parse", None)
+
+
+_SCHEMAS: Dict[type, Schema] = {}
+_PROJECTIONS: Dict[Tuple[type, Tuple[str, ...]], Callable[[dict], tuple]] = {}
+
+
+def schema(cls: type) -> Schema:
+    """Retourne le schéma compilé de cls, en le générant au premier appel"""
+    compiled = _SCHEMAS.get(cls)
+    if compiled is None:
+        compiled = _SCHEMAS[cls] = Schema(cls)
+    return compiled
+
+
+def from_schema(cls: type) -> type:
+    """Dote une dataclass des méthodes générées depuis son schéma
+
+    - from_dict(data, context=None), sauf si la classe définit le sien ;
+    - to_dict() : dict au format de l'API, sans copie profonde (les listes de
+      dictionnaires bruts et les chaînes sont partagées), relisible par from_dict ;
+    - to_tuple() / from_tuple(values) : forme positionnelle compacte, utilisée
+      par fffdata.serialization ;
+    - __reduce__ pour pickle, qui reconstruit l'objet par son __init__ ;
+    - updated_at : external_updated_at converti en datetime (heure de Paris),
+      pour les modèles qui ont ce champ.
+
+    À appliquer au-dessus de ``@slotted``::
+
+        @from_schema
+        @slotted
+        @dataclass
+        class Phase:
+            ...
+    """
+    compiled = schema(cls)
+    if "from_dict" not in cls.__dict__:
+        cls.from_dict = classmethod(compiled.parse)
+    cls.from_tuple = classmethod(compiled.from_tuple)
+    cls.to_dict = compiled.to_dict
+    cls.to_tuple = compiled.to_tuple
+    cls.__reduce__ = compiled.reduce
+    if "external_updated_at" in cls.__dataclass_fields__:
+        cls.updated_at = property(_updated_at)
+    return cls
+
+
+def _updated_at(self) -> Optional[datetime]:
+    """Dernière mise à jour côté FFF (fuseau Europe/Paris), None si inconnue"""
+    return parse_datetime(self.external_updated_at)
+
+
+
+def projection(cls: type, names: Sequence[str]) -> Callable[[dict], tuple]:
+    """Retourne un parseur qui n'extrait que certains champs d'un modèle
+
+    Le parseur prend le dictionnaire de l'API et retourne un namedtuple
+    (ex: MatchRecord) avec les seuls champs demandés, avec les mêmes valeurs
+    par défaut que from_dict. Les sous-objets non demandés ne sont pas
+    construits. Un chemin pointé ("home.short_name", "competition.cdg.name")
+    lit un attribut d'un sous-objet sans construire ce dernier ; le champ du
+    namedtuple correspondant est nommé avec des _ ("home_short_name").
+    Le parseur est généré une fois par (classe, champs) et mis en cache.
+
+    Raises:
+        ValueError: Si un champ est inconnu ou traverse une liste de sous-objets
+
+    Example:
+        >>> ticker = projection(Match, ("ma_no", "home_score", "away_score", "status"))
+        >>> ticker(data)
+        MatchRecord(ma_no=28541157, home_score=2, away_score=1, status='A')
+    """
+    key = (cls, tuple(names))
+    project = _PROJECTIONS.get(key)
+    if project is None:
+        project = _PROJECTIONS[key] = _compile_projection(cls, key[1])
+    return project
+
+
+def _compile_projection(cls: type, names: Tuple[str, ...]) -> Callable[[dict], tuple]:
+    if not names:
+        raise ValueError("Aucun champ demandé")
+    constants: Dict[str, Any] = {}
+
+    def constant(value: Any) -> str:
+        if type(value) in _LITERALS:
+            return repr(value)
+        name = f"_K{len(constants)}"
+        constants[name] = value
+        return name
+
+    def expr(model: type, source: str, parts: List[str], path: str) -> str:
+        """Expression lisant parts (chemin pointé) dans le dictionnaire source"""
+        compiled = schema(model)
+        name, rest = parts[0], parts[1:]
+        if name in compiled.defaults:
+            if rest:
+                raise ValueError(f"{model.__name__}.{name} n'a pas de sous-champ ({path})")
+            default = compiled.defaults[name]
+            return f"{source}.get({name!r}, {'[]' if default is list else constant(default)})"
+        if name not in compiled.nested:
+            raise ValueError(f"Champ inconnu pour {model.__name__}: {name} ({path})")
+        if not rest:
+            return f"{constant(compiled.nested[name])}({source})"
+
+        model, kind = compiled._nested_types[name]
+        if kind == "list":
+            raise ValueError(f"{path} : impossible de traverser la liste {name}")
+        if kind == "required":
+            return expr(model, f"{source}.get({name!r}, {{}})", rest, path)
+        # Sous-objet facultatif absent : le champ projeté vaut None
+        v = f"v{len(parts)}"
+        return f"({expr(model, v, rest, path)} if ({v} := {source}.get({name!r})) else None)"
+
+    exprs = [expr(cls, "data", path.split("."), path) for path in names]
+    record = namedtuple(f"{cls.__name__}Record", [n.replace(".", "_") for n in names])
+    constants["_Record"] = record
+    lines = ["def project(data):", "    return _Record("]
+    lines += [f"        {expr}," for expr in exprs]
+    lines += ["    )", ""]
+    namespace = dict(constants)
+    exec(compile("\n".join(lines), f"<projection {cls.__qualname__}>", "exec"), namespace)
+    project = namespace["project"]
+    project.record = record
+    return project
@@ -0,0 +1,173 @@
+"""Limitation du débit des requêtes vers l'API FFF (token bucket)"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from .cache import _Transaction
+from .endpoints import FFFEndpoints
+
+
+GLOBAL = "*"
+
+
+class _MemoryBuckets:
+    """État des seaux en mémoire, partagé par les threads d'un processus"""
+
+    def __init__(self):
+        self._state: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, buckets: Dict[str, Tuple[float, float]]) -> float:
+        with self._lock:
+            now = time.monotonic()
+            attente = 0.0
+            for key, (rate, burst) in buckets.items():
+                tokens, updated = self._state.get(key, (burst, now))
+                tokens, delai = _take(tokens, updated, now, rate, burst)
+                self._state[key] = (tokens, now)
+                attente = max(attente, delai)
+            return attente
+
+
+class _SQLiteBuckets:
+    """État des seaux dans une base SQLite, partagé par les processus d'un hôte"""
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        self._local = threading.local()
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def reserve(self, buckets: Dict[str, Tuple[float, float]]) -> float:
+        with _Transaction(self._connection()) as conn:
+            # Horloge murale : elle est commune à tous les processus
+            now = time.time()
+            attente = 0.0
+            for key, (rate, burst) in buckets.items():
+                row = conn.execute(
+                    "SELECT tokens, updated FROM buckets WHERE key = ?", (key,)
+                ).fetchone()
+                tokens, updated = row if row is not None else (burst, now)
+                tokens, delai = _take(tokens, updated, now, rate, burst)
+                conn.execute(
+                    "INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                    (key, tokens, now)
+                )
+                attente = max(attente, delai)
+            return attente
+
+
+def _take(
+    tokens: float,
+    updated: float,
+    now: float,
+    rate: float,
+    burst: float
+) -> Tuple[float, float]:
+    """Retire un jeton d'un seau après l'avoir rechargé
+
+    Le seau peut passer en négatif : le jeton est alors réservé et le délai
+    retourné est le temps nécessaire pour le rembourser.
+
+    Returns:
+        Tuple (jetons restants, délai d'attente en secondes)
+    """
+    tokens = min(burst, tokens + max(0.0, now - updated) * rate) - 1
+    return tokens, (-tokens / rate if tokens < 0 else 0.0)
+
+
+class RateLimiter:
+    """Limiteur de débit à seaux de jetons, global et par famille de route
+
+    Chaque requête consomme un jeton dans le seau global et dans celui de sa
+    famille de route (voir FFFEndpoints.family) ; elle attend que les deux
+    l'autorisent. Les jetons sont réservés à l'avance, ce qui rend le limiteur
+    équitable : le même objet peut être partagé par plusieurs threads et par des
+    coroutines asyncio (acquire / acquire_async).
+
+    Avec path, l'état des seaux est stocké dans un fichier SQLite : tous les
+    processus de l'hôte qui utilisent ce fichier partagent le même budget.
+
+    Args:
+        rate: Débit global en requêtes par seconde, None pour aucune limite globale
+        burst: Nombre de requêtes pouvant partir d'un coup (par défaut: max(1, rate))
+        family_rates: Débit par famille de route, en requêtes par seconde
+            (ex: {"match_entities": 5, "competitions/calendrier": 1})
+        path: Fichier SQLite pour partager le budget entre processus (par défaut: aucun)
+
+    Example:
+        >>> limiter = RateLimiter(rate=10, family_rates={"clubs": 2}, path="/tmp/fff-rate.db")
+        >>> client = FFFClient(rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        family_rates: Optional[Dict[str, float]] = None,
+        path: Optional[str] = None
+    ):
+        for valeur in [rate, *(family_rates or {}).values()]:
+            if valeur is not None and valeur <= 0:
+                raise ValueError("Les débits doivent être strictement positifs")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate or 1.0)
+        self.family_rates = dict(family_rates or {})
+        self.path = path
+        self._buckets = _SQLiteBuckets(path) if path else _MemoryBuckets()
+
+    def _buckets_for(self, endpoint: str) -> Dict[str, Tuple[float, float]]:
+        buckets = {}
+        if self.rate is not None:
+            buckets[GLOBAL] = (self.rate, self.burst)
+        family = FFFEndpoints.family(endpoint)
+        family_rate = self.family_rates.get(family)
+        if family_rate is not None:
+            buckets[family] = (family_rate, max(1.0, family_rate))
+        return buckets
+
+    def reserve(self, endpoint: str) -> float:
+        """Réserve un jeton pour un endpoint
+
+        Returns:
+            Délai en secondes à attendre avant d'envoyer la requête
+        """
+        buckets = self._buckets_for(endpoint)
+        if not buckets:
+            return 0.0
+        return self._buckets.reserve(buckets)
+
+    def acquire(self, endpoint: str) -> None:
+        """Bloque le thread courant jusqu'à ce que la requête soit autorisée"""
+        delai = self.reserve(endpoint)
+        if delai > 0:
+            time.sleep(delai)
+
+    async def acquire_async(self, endpoint: str) -> None:
+        """Attend (sans bloquer la boucle) que la requête soit autorisée
+
+        Avec path, la réservation (transaction SQLite, qui peut attendre le
+        verrou d'un autre processus) s'exécute dans un thread de la boucle.
+        """
+        if self.path:
+            delai = await asyncio.get_running_loop().run_in_executor(None, self.reserve, endpoint)
+        else:
+            delai = self.reserve(endpoint)
+        if delai > 0:
+            await asyncio.sleep(delai)
@@ -0,0 +1,116 @@
+"""Politique de nouvelles tentatives pour les requêtes vers l'API FFF"""
+
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+
+@dataclass
+class RetryPolicy:
+    """Politique de nouvelles tentatives avec backoff exponentiel
+
+    Le délai avant la tentative n (à partir de 0) est tiré uniformément entre 0 et
+    min(backoff_max, backoff_base * 2 ** n) (« full jitter »). Sur une réponse
+    429 ou 503 portant un en-tête Retry-After, c'est ce délai qui est respecté.
+
+    Seules les méthodes idempotentes sont rejouées. Le budget borne le temps total
+    passé pour une requête (tentatives et attentes comprises) : une fois dépassé,
+    la dernière erreur est levée.
+
+    Args:
+        max_attempts: Nombre total de tentatives, première comprise (par défaut: 3)
+        backoff_base: Délai de base en secondes (par défaut: 0.5)
+        backoff_max: Délai maximum entre deux tentatives (par défaut: 30)
+        budget: Temps total maximum en secondes pour une requête, None pour aucune
+            limite (par défaut: 60)
+        retry_statuses: Codes HTTP à rejouer
+        retry_methods: Méthodes HTTP rejouables (idempotentes)
+        respect_retry_after: Respecte l'en-tête Retry-After (par défaut: True)
+
+    Example:
+        >>> client = FFFClient(retry=RetryPolicy(max_attempts=5, budget=20))
+        >>> client.get_match_entities(28541157, retry=RetryPolicy(max_attempts=1))
+    """
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30
+    budget: Optional[float] = 60
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    retry_methods: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+    respect_retry_after: bool = True
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts doit être au moins 1")
+
+    def is_retryable(self, method: str, status: Optional[int] = None) -> bool:
+        """Indique si une requête échouée peut être rejouée
+
+        Args:
+            method: Méthode HTTP
+            status: Code HTTP reçu, None pour une erreur de connexion ou un timeout
+        """
+        if method.upper() not in self.retry_methods:
+            return False
+        return status is None or status in self.retry_statuses
+
+    def backoff(self, attempt: int) -> float:
+        """Retourne le délai (avec jitter) avant la tentative suivant attempt"""
+        plafond = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, plafond)
+
+    def next_delay(
+        self,
+        attempt: int,
+        elapsed: float,
+        status: Optional[int] = None,
+        retry_after: Optional[str] = None
+    ) -> Optional[float]:
+        """Calcule le délai avant une nouvelle tentative
+
+        Args:
+            attempt: Numéro de la tentative qui vient d'échouer (à partir de 0)
+            elapsed: Temps déjà écoulé depuis la première tentative
+            status: Code HTTP reçu, None pour une erreur de connexion
+            retry_after: Valeur de l'en-tête Retry-After, si présent
+
+        Returns:
+            Délai en secondes, ou None s'il ne faut plus réessayer
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+
+        delay = None
+        if self.respect_retry_after and status in (429, 503) and retry_after:
+            delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = self.backoff(attempt)
+
+        if self.budget is not None and elapsed + delay > self.budget:
+            return None
+        return delay
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """Convertit un en-tête Retry-After en nombre de secondes
+
+    L'en-tête peut être un nombre de secondes ou une date HTTP.
+
+    Returns:
+        Délai en secondes (positif ou nul), ou None si la valeur est invalide
+    """
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date is None:
+        return None
+    return max(0.0, date.timestamp() - time.time())
@@ -0,0 +1,485 @@
+"""Recherche approximative de clubs et d'équipes par nom
+
+Les noms sont normalisés (minuscules, sans accents ni ponctuation, "st" et
+"ste" développés en "saint" et "sainte") puis indexés de trois façons :
+
+- par trigrammes, pour tolérer les fautes de frappe ("st etiene") ;
+- par mots, pour la recherche par préfixe ("saint-et") ;
+- par sigles ("ASSE" pour "AS Saint-Étienne", "OL" pour "Olympique Lyonnais").
+
+Une recherche ne compare la requête qu'aux noms contenant tous ses mots, ou
+des mots proches (trigrammes du vocabulaire). Les listes de noms de chaque mot
+et de chaque sigle sont gardées triées, du nom le plus court au plus long :
+l'intersection part du terme le plus rare et s'arrête après MAX_CANDIDATES
+noms, si bien qu'un mot fréquent ("fc", "stade") ne fait pas comparer la
+requête à des milliers de noms. Le coût d'une recherche est borné, quelle que
+soit la taille de l'index.
+
+Example:
+    >>> index = SearchIndex()
+    >>> index.add_clubs(clubs)
+    >>> index.add_matches(matchs)
+    >>> index.search("AS St Etienne")
+    [(3.0, ('club', 500100)), (3.0, ('team', '500100-1'))]
+    >>> index.search("asse", kind=CLUB)
+"""
+
+import heapq
+import json
+import math
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .table import team_id
+
+
+CLUB = "club"
+TEAM = "team"
+
+Key = Tuple[str, Any]
+
+# Abréviations développées à la normalisation
+ABBREVIATIONS = {"st": "saint", "ste": "sainte"}
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+# Score des correspondances exactes, par sigle et par préfixe ; les
+# correspondances approchées valent leur coefficient de Dice (0 à 1)
+EXACT = 3.0
+ACRONYM = 2.0
+PREFIX = 1.0
+
+# Nombre maximal de mots du vocabulaire complétant un préfixe de requête
+MAX_COMPLETIONS = 256
+
+# Nombre de noms en deçà duquel un mot de la requête suffit à trouver les candidats
+RARE = 64
+
+# Nombre maximal de noms comparés à la requête, les plus courts d'abord
+MAX_CANDIDATES = 100
+
+
+def normalize(text: str) -> str:
+    """Forme normalisée d'un nom : "AS St-Étienne" -> "as saint etienne" """
+    decompose = unicodedata.normalize("NFKD", text)
+    ascii_ = decompose.encode("ascii", "ignore").decode("ascii").lower()
+    mots = _NON_ALNUM.sub(" ", ascii_).split()
+    return " ".join(ABBREVIATIONS.get(mot, mot) for mot in mots)
+
+
+def trigrams(normalized: str) -> Set[str]:
+    """Trigrammes d'un nom normalisé, bordé d'espaces"""
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def acronyms(text: str) -> Set[str]:
+    """Sigles d'un nom : initiales, et variante gardant entiers les mots courts
+
+    "AS Saint-Étienne" donne "ase" et "asse".
+    """
+    mots = normalize(text).split()
+    if len(mots) < 2:
+        return set()
+    initiales = "".join(mot[0] for mot in mots)
+    courts = "".join(mot if len(mot) <= 3 else mot[0] for mot in mots)
+    return {initiales, courts}
+
+
+class SearchIndex:
+    """Index de recherche approximative par nom, avec mises à jour incrémentales
+
+    Chaque entrée a une clé (type, identifiant), ex: ("club", cl_no) ou
+    ("team", "<cl_no>-<numéro>") (voir fffdata.table.team_id), et un ou
+    plusieurs noms.
+
+    Args:
+        min_score: Coefficient de Dice minimal d'une correspondance approchée
+            (par défaut: 0.4)
+    """
+
+    def __init__(self, min_score: float = 0.4):
+        self.min_score = min_score
+        self._entries: Dict[Key, List[str]] = {}
+        # Noms indexés : identifiant -> (clé, forme normalisée, trigrammes)
+        self._names: Dict[int, Tuple[Key, str, Set[str]]] = {}
+        self._next_id = 0
+        self._by_key: Dict[Key, List[int]] = {}
+        # Vocabulaire : mot -> noms, trigramme -> mots, mots triés (préfixes)
+        self._words: Dict[str, Set[int]] = {}
+        self._word_grams: Dict[str, Set[str]] = {}
+        self._sorted_words: List[str] = []
+        self._acronyms: Dict[str, Set[int]] = {}
+        # Forme normalisée -> noms, pour les correspondances exactes
+        self._normalized: Dict[str, Set[int]] = {}
+        # Listes de noms triées (plus court d'abord) par mot et par sigle, calculées à la demande
+        self._ranked_words: Dict[str, List[int]] = {}
+        self._ranked_acronyms: Dict[str, List[int]] = {}
+
+    # ==================== AJOUTS ====================
+
+    def add(self, key: Key, *names: Optional[str]) -> None:
+        """Indexe les noms d'une entrée (remplace ceux déjà indexés pour cette clé)"""
+        key = (key[0], key[1])
+        self.remove(key)
+        noms = list(dict.fromkeys(n for n in names if n))
+        if not noms:
+            return
+        self._entries[key] = noms
+
+        ids = self._by_key[key] = []
+        vus = set()
+        for nom in noms:
+            normalized = normalize(nom)
+            if not normalized or normalized in vus:
+                continue
+            vus.add(normalized)
+            name_id = self._next_id
+            self._next_id += 1
+            grams = trigrams(normalized)
+            self._names[name_id] = (key, normalized, grams)
+            self._normalized.setdefault(normalized, set()).add(name_id)
+            ids.append(name_id)
+
+            for mot in set(normalized.split()):
+                postings = self._words.get(mot)
+                if postings is None:
+                    postings = self._words[mot] = set()
+                    insort(self._sorted_words, mot)
+                    for gram in trigrams(mot):
+                        self._word_grams.setdefault(gram, set()).add(mot)
+                postings.add(name_id)
+                self._ranked_words.pop(mot, None)
+            for sigle in acronyms(nom):
+                self._acronyms.setdefault(sigle, set()).add(name_id)
+                self._ranked_acronyms.pop(sigle, None)
+
+    def remove(self, key: Key) -> bool:
+        """Retire une entrée ; retourne False si elle n'était pas indexée"""
+        ids = self._by_key.pop(key, None)
+        if ids is None:
+            return False
+        noms = self._entries.pop(key)
+        for name_id in ids:
+            _, normalized, _ = self._names.pop(name_id)
+            _discard(self._normalized, normalized, name_id)
+            for mot in set(normalized.split()):
+                self._ranked_words.pop(mot, None)
+                if _discard(self._words, mot, name_id):
+                    del self._sorted_words[bisect_left(self._sorted_words, mot)]
+                    for gram in trigrams(mot):
+                        _discard(self._word_grams, gram, mot)
+        for nom in noms:
+            for sigle in acronyms(nom):
+                self._ranked_acronyms.pop(sigle, None)
+                for name_id in ids:
+                    _discard(self._acronyms, sigle, name_id)
+        return True
+
+    def add_club(self, club: Any) -> None:
+        """Indexe un Club sous ("club", cl_no) : name et short_name"""
+        self.add((CLUB, club.cl_no), club.name, club.short_name)
+
+    def add_clubs(self, clubs: Iterable[Any]) -> None:
+        """Indexe une liste de clubs"""
+        for club in clubs:
+            self.add_club(club)
+
+    def add_team(self, team: Any) -> bool:
+        """Indexe une Team sous ("team", "<cl_no>-<numéro>")
+
+        Returns:
+            False si le club de l'équipe est inconnu
+        """
+        if team.club is None:
+            return False
+        key = (TEAM, team_id(team.club.cl_no, team.number))
+        self.add(key, team.short_name, team.short_name_ligue, team.short_name_federation)
+        return True
+
+    def add_matches(self, matches: Iterable[Any]) -> None:
+        """Indexe les équipes à domicile et à l'extérieur d'une liste de matchs"""
+        for match in matches:
+            self.add_team(match.home)
+            self.add_team(match.away)
+
+    # ==================== RECHERCHES ====================
+
+    def _completions(self, debut: str, limit: Optional[int] = None) -> List[str]:
+        """Mots du vocabulaire commençant par debut, dans l'ordre alphabétique"""
+        mots = []
+        i = bisect_left(self._sorted_words, debut)
+        while i < len(self._sorted_words) and self._sorted_words[i].startswith(debut):
+            mots.append(self._sorted_words[i])
+            if len(mots) == limit:
+                break
+            i += 1
+        return mots
+
+    def _similar_words(self, mot: str) -> List[str]:
+        """Mots du vocabulaire proches de mot (coefficient de Dice des trigrammes),
+        le plus proche d'abord"""
+        grams = trigrams(mot)
+        # Un mot à min_score partage au moins `requis` trigrammes avec mot : il
+        # apparaît forcément dans l'un des len(grams) - requis + 1 plus rares
+        requis = max(1, math.ceil(self.min_score * len(grams) / (2 - self.min_score)))
+        postings = sorted((self._word_grams.get(g, ()) for g in grams), key=len)
+        candidats = set().union(*postings[:len(grams) - requis + 1])
+
+        communs = Counter()
+        for posting in postings:
+            for candidat in candidats.intersection(posting):
+                communs[candidat] += 1
+        proches = [
+            (2 * n / (len(grams) + len(candidat) + 1), candidat) for candidat, n in communs.items()
+        ]
+        proches.sort(key=lambda p: (-p[0], p[1]))
+        return [candidat for dice, candidat in proches if dice >= self.min_score]
+
+    def _rank(self, name_id: int) -> Tuple[int, str, int]:
+        """Ordre des noms candidats : le plus court, puis l'ordre alphabétique"""
+        normalized = self._names[name_id][1]
+        return len(normalized), normalized, name_id
+
+    def _ranked(self, cache: Dict[str, List[int]], index: Dict[str, Set[int]], term: str) -> List[int]:
+        """Noms d'un terme (mot ou sigle) triés par _rank, mis en cache jusqu'au prochain changement"""
+        ranked = cache.get(term)
+        if ranked is None:
+            ranked = cache[term] = sorted(index.get(term, ()), key=self._rank)
+        return ranked
+
+    def _stream(self, mots: List[str], debut: Optional[str] = None) -> Iterator[int]:
+        """Noms contenant tous les mots et, avec debut, un mot qui complète
+        debut (parmi ses MAX_COMPLETIONS premières complétions) ; les plus
+        courts d'abord
+
+        Sans debut, le parcours suit la liste triée du mot le plus rare ; avec
+        debut seul, la fusion des listes triées de ses complétions. Avec les
+        deux, l'intersection est calculée sur les ensembles, puis ordonnée.
+        """
+        if any(m not in self._words for m in mots):
+            return
+        mots = sorted(mots, key=lambda m: len(self._words[m]))
+        autres = [self._words[m] for m in mots[1:]]
+
+        if debut is None:
+            if not mots:
+                return
+            for name_id in self._ranked(self._ranked_words, self._words, mots[0]):
+                if all(name_id in s for s in autres):
+                    yield name_id
+            return
+
+        completions = self._completions(debut, MAX_COMPLETIONS)
+        if not completions:
+            return
+        if not mots:
+            listes = [self._ranked(self._ranked_words, self._words, m) for m in completions]
+            yield from _unique(heapq.merge(*listes, key=self._rank))
+            return
+
+        noms = set().union(*(self._words[m] for m in completions))
+        noms = self._words[mots[0]].intersection(noms, *autres)
+        if len(noms) <= MAX_CANDIDATES:
+            yield from sorted(noms, key=self._rank)
+            return
+        for name_id in self._ranked(self._ranked_words, self._words, mots[0]):
+            if name_id in noms:
+                yield name_id
+
+    def _fuzzy(self, mot: str, filtres: List[Set[int]]) -> List[int]:
+        """Noms contenant un mot proche de mot (faute de frappe) et présents dans
+        tous les filtres, au plus MAX_CANDIDATES ; ceux du mot le plus proche d'abord"""
+        noms: List[int] = []
+        if len(mot) < 4:
+            return noms
+        vus: Set[int] = set()
+        for proche in self._similar_words(mot):
+            for name_id in self._ranked(self._ranked_words, self._words, proche):
+                if name_id not in vus and all(name_id in f for f in filtres):
+                    vus.add(name_id)
+                    noms.append(name_id)
+                    if len(noms) == MAX_CANDIDATES:
+                        return noms
+        return noms
+
+    def _candidates(self, mots: List[str]) -> List[int]:
+        """Noms à comparer à la requête, au plus MAX_CANDIDATES
+
+        Ce sont ceux qui contiennent tous les mots connus de la requête (le
+        dernier pouvant être incomplet) ; à défaut, ceux du mot connu le plus
+        rare. Les mots inconnus de l'index (fautes de frappe) ne sont rapprochés
+        de mots proches que si les mots connus ne suffisent pas à réduire les
+        candidats à RARE noms.
+        """
+        exacts: List[str] = []
+        debut: Optional[str] = None
+        inconnus: List[str] = []
+        for i, mot in enumerate(mots):
+            if i == len(mots) - 1 and self._completions(mot, 1):
+                debut = mot
+            elif mot in self._words:
+                exacts.append(mot)
+            else:
+                inconnus.append(mot)
+
+        connus: List[int] = []
+        if exacts or debut is not None:
+            connus = list(islice(self._stream(exacts, debut), MAX_CANDIDATES))
+            if not connus:
+                # Aucun nom ne contient tous les mots : le terme le plus rare seul
+                termes = [([m], None) for m in exacts] + ([([], debut)] if debut is not None else [])
+                tailles = [
+                    len(self._words[m[0]]) if m else
+                    sum(len(self._words[c]) for c in self._completions(d, MAX_COMPLETIONS))
+                    for m, d in termes
+                ]
+                mots_rares, debut_rare = termes[tailles.index(min(tailles))]
+                connus = list(islice(self._stream(mots_rares, debut_rare), MAX_CANDIDATES))
+        if connus and (len(connus) <= RARE or not inconnus):
+            return connus
+        # Mots proches des mots inconnus, parmi les noms qui contiennent les mots
+        # connus ; à défaut, parmi tous les noms
+        filtres = [self._words[m] for m in exacts]
+        approches = [noms for noms in (self._fuzzy(m, filtres) for m in inconnus) if noms]
+        if not approches and filtres:
+            approches = [noms for noms in (self._fuzzy(m, []) for m in inconnus) if noms]
+        return min(approches + [connus] if connus else approches, key=len, default=[])
+
+    def search(self, query: str, limit: int = 10, kind: Optional[str] = None) -> List[Tuple[float, Key]]:
+        """Entrées dont un nom correspond à la requête, la meilleure en premier
+
+        Une correspondance exacte vaut EXACT, un sigle ACRONYM plus la
+        similarité, un préfixe de nom PREFIX plus la similarité ; sinon le
+        score est le coefficient de Dice des trigrammes (au moins min_score).
+
+        Args:
+            query: Nom, début de nom, sigle ou nom approximatif
+            limit: Nombre maximal de résultats
+            kind: Limite la recherche à un type (CLUB ou TEAM)
+
+        Returns:
+            Liste de (score, clé)
+        """
+        q = normalize(query)
+        if not q:
+            return []
+        grams = trigrams(q)
+        mots = q.split()
+        sigle = "".join(mots)
+
+        scores: Dict[Key, float] = {}
+        sigles = self._acronyms.get(sigle, set())
+        candidats = set(self._normalized.get(q, ()))
+        candidats.update(self._ranked(self._ranked_acronyms, self._acronyms, sigle)[:MAX_CANDIDATES])
+        if sigles and len(mots) == 1:
+            # Sigle connu : pas de rapprochement approché du mot
+            candidats.update(islice(self._stream([], sigle), MAX_CANDIDATES))
+        else:
+            candidats.update(self._candidates(mots))
+
+        for name_id in candidats:
+            key, normalized, name_grams = self._names[name_id]
+            if kind is not None and key[0] != kind:
+                continue
+            dice = 2 * len(grams & name_grams) / (len(grams) + len(name_grams))
+            if normalized == q:
+                score = EXACT
+            elif name_id in sigles:
+                score = ACRONYM + dice
+            elif normalized.startswith(q):
+                score = PREFIX + dice
+            elif dice >= self.min_score:
+                score = dice
+            else:
+                continue
+            if score > scores.get(key, -1.0):
+                scores[key] = score
+
+        return heapq.nsmallest(limit, ((s, k) for k, s in scores.items()), key=lambda r: (-r[0], str(r[1])))
+
+    def prefix(self, query: str, limit: int = 10, kind: Optional[str] = None) -> List[Key]:
+        """Entrées dont un nom contient les mots de la requête, le dernier
+        pouvant être incomplet (autocomplétion)
+
+        Les noms les plus courts viennent en premier, puis l'ordre alphabétique ;
+        le dernier mot est complété par ses MAX_COMPLETIONS premiers mots du
+        vocabulaire.
+        """
+        mots = normalize(query).split()
+        if not mots:
+            return []
+        cles: List[Key] = []
+        vues = set()
+        for name_id in self._stream(mots[:-1], mots[-1]):
+            key = self._names[name_id][0]
+            if key in vues or (kind is not None and key[0] != kind):
+                continue
+            vues.add(key)
+            cles.append(key)
+            if len(cles) == limit:
+                break
+        return cles
+
+    def names(self, key: Key) -> List[str]:
+        """Noms indexés d'une entrée"""
+        return list(self._entries.get(key, ()))
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ==================== PERSISTANCE ====================
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Forme sérialisable (JSON) de l'index : les entrées et leurs noms"""
+        return {
+            "min_score": self.min_score,
+            "entries": [[kind, ident, noms] for (kind, ident), noms in self._entries.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SearchIndex":
+        """Reconstruit un index depuis to_dict()"""
+        index = cls(min_score=data["min_score"])
+        for kind, ident, noms in data["entries"]:
+            index.add((kind, ident), *noms)
+        return index
+
+    def save(self, path: str) -> None:
+        """Enregistre l'index dans un fichier JSON"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> "SearchIndex":
+        """Charge un index enregistré par save()"""
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def _discard(index: Dict[str, Set[Any]], term: str, value: Any) -> bool:
+    """Retire value de la liste d'un terme ; True si le terme n'a plus de valeur"""
+    postings = index.get(term)
+    if postings is None:
+        return False
+    postings.discard(value)
+    if postings:
+        return False
+    del index[term]
+    return True
+
+
+def _unique(name_ids: Iterable[int]) -> Iterator[int]:
+    """Premières occurrences, dans l'ordre (paresseusement)"""
+    vus: Set[int] = set()
+    for name_id in name_ids:
+        if name_id not in vus:
+            vus.add(name_id)
+            yield name_id
@@ -0,0 +1,137 @@
+"""Sérialisation binaire compacte des modèles
+
+Un modèle est encodé sous sa forme positionnelle (to_tuple) : les noms de
+champs ne sont pas répétés, ce qui rend l'encodage bien plus compact et plus
+rapide que to_dict + JSON. Le premier octet indique le format :
+
+- msgpack si installé (pip install fffdata[fast]), portable ;
+- marshal sinon, format de la bibliothèque standard propre à la version de
+  Python : à réserver aux échanges entre processus d'un même environnement
+  (multiprocessing, cache local).
+
+Example:
+    >>> data = dumps(match)
+    >>> loads(data) == match
+    True
+    >>> loads_many(dumps_many(matchs)) == matchs
+    True
+"""
+
+import marshal
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    msgpack = None
+
+from . import models
+
+
+FORMAT_MSGPACK = 1
+FORMAT_MARSHAL = 2
+
+# Modèles sérialisables, par nom de classe
+_MODELS: Dict[str, type] = {
+    name: getattr(models, name)
+    for name in models.__all__
+    if hasattr(getattr(models, name), "to_tuple")
+    and not name.startswith("Lazy")
+}
+
+
+def _model_name(obj: Any) -> str:
+    """Nom du modèle de obj (classe de base pour un modèle paresseux)"""
+    for cls in type(obj).__mro__:
+        if _MODELS.get(cls.__name__) is cls:
+            return cls.__name__
+    raise TypeError(f"Type non sérialisable: {type(obj).__name__}")
+
+
+def _format(name: Optional[str]) -> int:
+    if name is None:
+        return FORMAT_MSGPACK if msgpack is not None else FORMAT_MARSHAL
+    if name == "msgpack":
+        if msgpack is None:
+            raise ImportError("msgpack n'est pas installé (pip install fffdata[fast])")
+        return FORMAT_MSGPACK
+    if name == "marshal":
+        return FORMAT_MARSHAL
+    raise ValueError(f"Format de sérialisation inconnu: {name}")
+
+
+def _encode(payload: Any, format: Optional[str]) -> bytes:
+    tag = _format(format)
+    if tag == FORMAT_MSGPACK:
+        return bytes((tag,)) + msgpack.packb(payload)
+    return bytes((tag,)) + marshal.dumps(payload)
+
+
+def _decode(data: bytes) -> Any:
+    if not data:
+        raise ValueError("Données vides")
+    tag = data[0]
+    body = memoryview(data)[1:]
+    if tag == FORMAT_MSGPACK:
+        if msgpack is None:
+            raise ImportError("msgpack n'est pas installé (pip install fffdata[fast])")
+        return msgpack.unpackb(body)
+    if tag == FORMAT_MARSHAL:
+        return marshal.loads(body)
+    raise ValueError(f"Format de sérialisation inconnu: {tag}")
+
+
+def dumps(obj: Any, format: Optional[str] = None) -> bytes:
+    """Encode un modèle (Match, Club ou sous-modèle)
+
+    Args:
+        obj: Instance d'un modèle de fffdata.models
+        format: "msgpack", "marshal", ou None pour msgpack s'il est installé
+
+    Raises:
+        TypeError: Si obj n'est pas un modèle
+        ImportError: Si msgpack est demandé mais pas installé
+    """
+    return _encode((_model_name(obj), obj.to_tuple()), format)
+
+
+def loads(data: bytes) -> Any:
+    """Décode un modèle encodé par dumps
+
+    Raises:
+        ValueError: Si le format est inconnu ou les données invalides
+    """
+    name, values = _decode(data)
+    return _MODELS[name].from_tuple(values)
+
+
+def dumps_many(objs: Iterable[Any], format: Optional[str] = None) -> bytes:
+    """Encode une liste de modèles du même type
+
+    Un modèle paresseux est encodé sous sa classe de base : des Match et des
+    LazyMatch peuvent être mélangés.
+
+    Raises:
+        TypeError: Si un objet n'est pas un modèle, ou pas du même modèle que le premier
+    """
+    objs = list(objs)
+    name = _model_name(objs[0]) if objs else ""
+    types = {type(objs[0])} if objs else set()
+    values = []
+    for position, obj in enumerate(objs):
+        if type(obj) not in types:
+            autre = _model_name(obj)
+            if autre != name:
+                raise TypeError(f"dumps_many attend des {name} : l'objet {position} est un {autre}")
+            types.add(type(obj))
+        values.append(obj.to_tuple())
+    return _encode((name, values), format)
+
+
+def loads_many(data: bytes) -> List[Any]:
+    """Décode une liste de modèles encodée par dumps_many"""
+    name, values = _decode(data)
+    if not values:
+        return []
+    from_tuple = _MODELS[name].from_tuple
+    return [from_tuple(v) for v in values]
@@ -0,0 +1,73 @@
+"""Regroupement des requêtes identiques concurrentes (single-flight)"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """Appel en cours, attendu par un ou plusieurs threads"""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Exécute une seule fois les appels concurrents portant sur la même clé
+
+    Le premier thread qui demande une clé exécute la fonction ; les threads qui
+    demandent la même clé pendant ce temps attendent et reçoivent le même
+    résultat, ou la même exception. Une fois l'appel terminé, la clé est libérée :
+    rien n'est mis en cache.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> match = flight.do("/api/match_entities/28541157.json", charger_match)
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Exécute fn, ou attend le résultat d'un appel identique déjà en cours
+
+        Args:
+            key: Clé identifiant l'appel (ex: endpoint)
+            fn: Fonction sans argument à exécuter
+
+        Returns:
+            Résultat de fn, partagé entre tous les appelants concurrents
+
+        Raises:
+            Exception levée par fn, propagée à tous les appelants concurrents
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def in_flight(self) -> int:
+        """Retourne le nombre d'appels en cours"""
+        return len(self._calls)
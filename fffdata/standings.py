@@ -0,0 +1,339 @@
+"""Classements calculés localement à partir des résultats
+
+Un classement est tenu à jour match par match : chaque résultat ajoute sa
+contribution (points, buts, victoires...) aux lignes des deux équipes, en temps
+constant. Un résultat corrigé remplace la contribution précédente du même
+match. Le tri n'est refait qu'à la lecture du classement, sur les équipes d'une
+seule poule.
+
+Règles de calcul d'un match terminé, pour chaque équipe :
+
+- points : home_nb_point / away_nb_point quand l'API les donne, sinon barème
+  (PointsSystem) appliqué au score, forfait compris ;
+- points de pénalité (home_nb_point_pena) retranchés du total ;
+- buts contre : home_but_contre / away_but_contre s'ils sont renseignés (0
+  compris), sinon le score de l'adversaire.
+
+Example:
+    >>> book = StandingsBook()
+    >>> book.add_all(matchs)
+    >>> for ligne in book[(423015, 1, 1)].table():
+    >>>     print(ligne.rank, ligne.name, ligne.total, ligne.goal_difference)
+"""
+
+from dataclasses import dataclass
+from itertools import groupby
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .models.match import STATUT_TERMINE
+from .table import team_id
+
+
+FORFAIT = "O"
+
+PouleKey = Tuple[Optional[int], Optional[int], Optional[int]]
+
+
+@dataclass(frozen=True)
+class PointsSystem:
+    """Barème des points (par défaut celui des championnats FFF)"""
+    win: int = 3
+    draw: int = 1
+    loss: int = 0
+    forfeit: int = -1
+
+
+@dataclass
+class Standing:
+    """Ligne de classement d'une équipe
+
+    Attributes:
+        team: Identifiant d'équipe "<cl_no>-<numéro>" (voir fffdata.table.team_id)
+        name: Nom court de l'équipe
+        rank: Rang, renseigné par Standings.table()
+    """
+    team: str
+    name: str = ""
+    played: int = 0
+    won: int = 0
+    drawn: int = 0
+    lost: int = 0
+    forfeits: int = 0
+    goals_for: int = 0
+    goals_against: int = 0
+    points: int = 0
+    penalty_points: int = 0
+    rank: int = 0
+
+    @property
+    def goal_difference(self) -> int:
+        return self.goals_for - self.goals_against
+
+    @property
+    def total(self) -> int:
+        """Points après retrait des points de pénalité"""
+        return self.points - self.penalty_points
+
+    def _apply(self, delta: "_Delta", sign: int) -> None:
+        self.played += sign
+        self.won += sign * delta.won
+        self.drawn += sign * delta.drawn
+        self.lost += sign * delta.lost
+        self.forfeits += sign * delta.forfeit
+        self.goals_for += sign * delta.goals_for
+        self.goals_against += sign * delta.goals_against
+        self.points += sign * delta.points
+        self.penalty_points += sign * delta.penalty
+
+
+@dataclass(frozen=True)
+class _Delta:
+    """Contribution d'un match à la ligne d'une équipe"""
+    team: str
+    won: int
+    drawn: int
+    lost: int
+    forfeit: int
+    goals_for: int
+    goals_against: int
+    points: int
+    penalty: int
+
+
+# Critères de départage : clé de tri décroissante d'une ligne
+TIE_BREAKERS: Dict[str, Callable[[Standing], Any]] = {
+    "points": lambda s: s.total,
+    "goal_difference": lambda s: s.goal_difference,
+    "goals_for": lambda s: s.goals_for,
+    "goals_against": lambda s: -s.goals_against,
+    "won": lambda s: s.won,
+    "forfeits": lambda s: -s.forfeits,
+}
+
+# Confrontations directes : points puis différence de buts dans les matchs
+# joués entre les équipes encore à égalité
+HEAD_TO_HEAD = "head_to_head"
+
+DEFAULT_TIE_BREAKERS = ("points", HEAD_TO_HEAD, "goal_difference", "goals_for")
+
+
+def played(match: Any) -> bool:
+    """Un match compte au classement s'il est terminé ou perdu par forfait"""
+    return (
+        match.status == STATUT_TERMINE
+        or match.home_is_forfeit == FORFAIT
+        or match.away_is_forfeit == FORFAIT
+    )
+
+
+def poule_key(match: Any) -> PouleKey:
+    """Poule d'un match : (cp_no, numéro de phase, numéro de poule)"""
+    return (match.competition.cp_no, match.phase.number, match.poule.stage_number)
+
+
+def _team(equipe: Any) -> str:
+    """Identifiant d'une équipe (son nom court si le club est inconnu)"""
+    club = equipe.club
+    return team_id(club.cl_no if club is not None else None, equipe.number) or equipe.short_name
+
+
+class Standings:
+    """Classement d'une poule, mis à jour incrémentalement
+
+    Args:
+        points: Barème des points quand l'API ne les donne pas
+        tie_breakers: Critères de classement dans l'ordre, parmi TIE_BREAKERS et
+            HEAD_TO_HEAD (par défaut: points, confrontations directes, différence
+            de buts, buts marqués)
+    """
+
+    def __init__(
+        self,
+        points: PointsSystem = PointsSystem(),
+        tie_breakers: Sequence[str] = DEFAULT_TIE_BREAKERS
+    ):
+        for critere in tie_breakers:
+            if critere != HEAD_TO_HEAD and critere not in TIE_BREAKERS:
+                raise ValueError(f"Critère de classement inconnu: {critere}")
+        self.system = points
+        self.tie_breakers = tuple(tie_breakers)
+        self._rows: Dict[str, Standing] = {}
+        self._matches: Dict[int, Tuple[_Delta, _Delta]] = {}
+        self._table: Optional[List[Standing]] = None
+
+    def _points(self, marques: int, encaisses: int, forfait: bool, adverse_forfait: bool) -> int:
+        if forfait:
+            return self.system.forfeit
+        if adverse_forfait or marques > encaisses:
+            return self.system.win
+        return self.system.draw if marques == encaisses else self.system.loss
+
+    def _delta(self, match: Any, home: bool) -> _Delta:
+        if home:
+            equipe, prefixe, autre = match.home, "home_", "away_"
+            marques, encaisses = match.home_score or 0, match.away_score or 0
+        else:
+            equipe, prefixe, autre = match.away, "away_", "home_"
+            marques, encaisses = match.away_score or 0, match.home_score or 0
+
+        forfait = getattr(match, prefixe + "is_forfeit") == FORFAIT
+        adverse_forfait = getattr(match, autre + "is_forfeit") == FORFAIT
+        points = getattr(match, prefixe + "nb_point")
+        if points is None:
+            points = self._points(marques, encaisses, forfait, adverse_forfait)
+        contre = getattr(match, prefixe + "but_contre")
+        if contre is None:
+            contre = encaisses
+
+        # Une équipe forfait perd toujours, y compris en cas de double forfait
+        gagne = not forfait and (adverse_forfait or marques > encaisses)
+        nul = not forfait and not adverse_forfait and marques == encaisses
+        return _Delta(
+            team=_team(equipe),
+            won=int(gagne),
+            drawn=int(nul),
+            lost=int(not gagne and not nul),
+            forfeit=int(forfait),
+            goals_for=marques,
+            goals_against=contre,
+            points=points,
+            penalty=getattr(match, prefixe + "nb_point_pena") or 0,
+        )
+
+    def _row(self, team: str, name: str = "") -> Standing:
+        row = self._rows.get(team)
+        if row is None:
+            row = self._rows[team] = Standing(team, name)
+            self._table = None
+        elif name and not row.name:
+            row.name = name
+        return row
+
+    def add(self, match: Any) -> bool:
+        """Ajoute ou remplace le résultat d'un match, en temps constant
+
+        Un match non joué est ignoré (ou retiré s'il avait été compté, ex: résultat
+        annulé). Les équipes sont inscrites au classement dès leur premier match.
+
+        Returns:
+            True si le classement a changé
+        """
+        self._row(_team(match.home), match.home.short_name)
+        self._row(_team(match.away), match.away.short_name)
+        if not played(match):
+            return self.remove(match.ma_no)
+
+        deltas = (self._delta(match, True), self._delta(match, False))
+        if self._matches.get(match.ma_no) == deltas:
+            return False
+        self.remove(match.ma_no)
+        for delta in deltas:
+            self._rows[delta.team]._apply(delta, 1)
+        self._matches[match.ma_no] = deltas
+        self._table = None
+        return True
+
+    def remove(self, ma_no: int) -> bool:
+        """Retire la contribution d'un match ; retourne False s'il n'était pas compté"""
+        deltas = self._matches.pop(ma_no, None)
+        if deltas is None:
+            return False
+        for delta in deltas:
+            self._rows[delta.team]._apply(delta, -1)
+        self._table = None
+        return True
+
+    def add_all(self, matches: Iterable[Any]) -> None:
+        """Ajoute une liste de matchs"""
+        for match in matches:
+            self.add(match)
+
+    def _head_to_head(self, rows: List[Standing]) -> Callable[[Standing], Any]:
+        """Clé de tri des confrontations directes entre les équipes de rows"""
+        equipes = {row.team for row in rows}
+        mini: Dict[str, List[int]] = {team: [0, 0] for team in equipes}
+        for deltas in self._matches.values():
+            if deltas[0].team in equipes and deltas[1].team in equipes:
+                for delta in deltas:
+                    mini[delta.team][0] += delta.points
+                    mini[delta.team][1] += delta.goals_for - delta.goals_against
+        return lambda row: tuple(mini[row.team])
+
+    def _rank(self, rows: List[Standing], criteres: Tuple[str, ...]) -> List[List[Standing]]:
+        """Groupes d'équipes à égalité, du premier au dernier"""
+        if len(rows) <= 1 or not criteres:
+            return [rows]
+        critere, suivants = criteres[0], criteres[1:]
+        key = self._head_to_head(rows) if critere == HEAD_TO_HEAD else TIE_BREAKERS[critere]
+        groupes = []
+        for _, groupe in groupby(sorted(rows, key=key, reverse=True), key=key):
+            groupes.extend(self._rank(list(groupe), suivants))
+        return groupes
+
+    def table(self) -> List[Standing]:
+        """Classement trié ; les équipes encore à égalité partagent le même rang"""
+        if self._table is None:
+            rows: List[Standing] = []
+            equipes = sorted(self._rows.values(), key=lambda r: r.team)
+            for groupe in self._rank(equipes, self.tie_breakers):
+                rang = len(rows) + 1
+                for row in groupe:
+                    row.rank = rang
+                rows.extend(groupe)
+            self._table = rows
+        return self._table
+
+    def __getitem__(self, team: str) -> Standing:
+        return self._rows[team]
+
+    def __iter__(self) -> Iterator[Standing]:
+        return iter(self.table())
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+class StandingsBook:
+    """Classements de plusieurs poules, chaque match étant rangé dans la sienne
+
+    Args:
+        points: Barème des points de toutes les poules
+        tie_breakers: Critères de classement de toutes les poules
+    """
+
+    def __init__(
+        self,
+        points: PointsSystem = PointsSystem(),
+        tie_breakers: Sequence[str] = DEFAULT_TIE_BREAKERS
+    ):
+        self.system = points
+        self.tie_breakers = tuple(tie_breakers)
+        self._poules: Dict[PouleKey, Standings] = {}
+
+    def add(self, match: Any) -> bool:
+        """Ajoute ou remplace le résultat d'un match dans le classement de sa poule"""
+        key = poule_key(match)
+        standings = self._poules.get(key)
+        if standings is None:
+            standings = self._poules[key] = Standings(self.system, self.tie_breakers)
+        return standings.add(match)
+
+    def add_all(self, matches: Iterable[Any]) -> None:
+        """Ajoute une liste de matchs"""
+        for match in matches:
+            self.add(match)
+
+    def __getitem__(self, key: PouleKey) -> Standings:
+        return self._poules[key]
+
+    def __contains__(self, key: PouleKey) -> bool:
+        return key in self._poules
+
+    def __iter__(self) -> Iterator[PouleKey]:
+        return iter(self._poules)
+
+    def __len__(self) -> int:
+        return len(self._poules)
+
+    def items(self):
+        return self._poules.items()
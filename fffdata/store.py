@@ -0,0 +1,512 @@
+"""Stockage local des entités dans une base SQLite
+
+Les matchs et les clubs sont éclatés en tables normalisées : compétitions,
+CDG, phases, poules, journées, équipes, clubs (infos de match et fiches
+complètes), districts, terrains, officiels, contacts. Chaque sous-entité
+partagée n'est stockée qu'une fois, quel que soit le nombre de matchs qui la
+référencent. Les colonnes de chaque table sont celles des attributs simples du
+modèle (dataclass), les sous-objets devenant des clés étrangères.
+
+Les requêtes s'appuient sur des index (compétition et saison, date, club,
+arbitre) et retournent les modèles de fffdata.models.
+
+Example:
+    >>> store = EntityStore("fffdata.sqlite")
+    >>> store.upsert_matches(matchs)
+    >>> store.matches(club=500100, season=2024)
+    [Match(ma_no=28541157, ...), ...]
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import typing
+from dataclasses import fields
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .cache import _Transaction
+from .dates import PARIS, parse_kickoff
+from .models import (
+    CDG, Club, ClubInfo, Competition, Contact, District, Match, MatchMembre,
+    Phase, Poule, PouleJournee, Team, Terrain,
+)
+from .models.match import TerrainMatch
+from .models.schema import schema
+
+
+DateLike = Union[datetime, date, str]
+
+# Nombre maximal de paramètres d'une requête IN (limite SQLite historique : 999)
+_CHUNK = 500
+
+
+def _columns(cls: type) -> List[Tuple[str, str]]:
+    """Attributs simples d'un modèle et leur type de colonne
+
+    Types : "INTEGER", "REAL", "TEXT", "BOOLEAN" (0/1) ou "JSON" (listes de
+    dictionnaires, stockées en texte).
+    """
+    hints = typing.get_type_hints(cls)
+    nested = schema(cls)._nested_types
+    colonnes = []
+    for f in fields(cls):
+        if f.name in nested:
+            continue
+        hint = hints[f.name]
+        args = [a for a in typing.get_args(hint) if a is not type(None)]
+        if typing.get_origin(hint) is typing.Union and len(args) == 1:
+            hint = args[0]
+        if hint is bool:
+            kind = "BOOLEAN"
+        elif hint is int:
+            kind = "INTEGER"
+        elif hint is float:
+            kind = "REAL"
+        elif hint is str:
+            kind = "TEXT"
+        else:
+            kind = "JSON"
+        colonnes.append((f.name, kind))
+    return colonnes
+
+
+class _Table:
+    """Table d'un modèle : colonnes de portée ou de référence, puis attributs simples"""
+
+    def __init__(self, name: str, model: type, extra: Sequence[Tuple[str, str]], key: Sequence[str]):
+        self.name = name
+        self.model = model
+        self.extra = list(extra)
+        self.key = tuple(key)
+        self.fields = _columns(model)
+        self.booleans = [n for n, kind in self.fields if kind == "BOOLEAN"]
+        self.json = [n for n, kind in self.fields if kind == "JSON"]
+
+    def ddl(self) -> str:
+        colonnes = [f"{n} {kind}" for n, kind in self.extra]
+        colonnes += [f"{n} {'INTEGER' if kind == 'BOOLEAN' else 'TEXT' if kind == 'JSON' else kind}"
+                     for n, kind in self.fields]
+        colonnes.append(f"PRIMARY KEY ({', '.join(self.key)})")
+        return f"CREATE TABLE IF NOT EXISTS {self.name} (\n    " + ",\n    ".join(colonnes) + "\n)"
+
+    def upsert_sql(self, columns: Sequence[str]) -> str:
+        """INSERT ... ON CONFLICT DO UPDATE des seules colonnes données"""
+        mises_a_jour = [c for c in columns if c not in self.key]
+        action = (
+            "DO UPDATE SET " + ", ".join(f"{c} = excluded.{c}" for c in mises_a_jour)
+            if mises_a_jour else "DO NOTHING"
+        )
+        return (
+            f"INSERT INTO {self.name} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)}) "
+            f"ON CONFLICT ({', '.join(self.key)}) {action}"
+        )
+
+    def values(self, obj: Any, names: Sequence[str]) -> List[Any]:
+        """Valeurs des attributs simples names de obj, converties pour SQLite"""
+        valeurs = []
+        for name in names:
+            value = getattr(obj, name)
+            if name in self.json:
+                value = json.dumps(value, ensure_ascii=False)
+            valeurs.append(value)
+        return valeurs
+
+    def decode(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Reconvertit une ligne lue en valeurs du modèle"""
+        for name in self.booleans:
+            if data.get(name) is not None:
+                data[name] = bool(data[name])
+        for name in self.json:
+            if data.get(name) is not None:
+                data[name] = json.loads(data[name])
+        return data
+
+
+_COMPETITION = (("cp_no", "INTEGER"), ("season", "INTEGER"))
+# code varie d'un match à l'autre pour une même équipe : il fait partie de la clé
+_TEAM_KEY = ("cl_no", "category_code", "number", "code")
+
+TABLES: Dict[str, _Table] = {
+    t.name: t for t in (
+        _Table("cdgs", CDG, (), ("cg_no",)),
+        _Table("competitions", Competition, (("cg_no", "INTEGER"),), ("cp_no", "season")),
+        _Table("phases", Phase, _COMPETITION, ("cp_no", "season", "number")),
+        _Table("poules", Poule, _COMPETITION + (("phase", "INTEGER"),),
+               ("cp_no", "season", "phase", "stage_number")),
+        _Table("journees", PouleJournee, _COMPETITION + (("phase", "INTEGER"), ("poule", "INTEGER")),
+               ("cp_no", "season", "phase", "poule", "number")),
+        _Table("club_infos", ClubInfo, (), ("cl_no",)),
+        _Table("teams", Team, (("cl_no", "INTEGER"),), _TEAM_KEY),
+        _Table("terrains", Terrain, (), ("te_no",)),
+        _Table("matches", Match, (
+            ("cp_no", "INTEGER"), ("phase", "INTEGER"), ("poule", "INTEGER"), ("journee", "INTEGER"),
+            ("home_cl_no", "INTEGER"), ("home_category_code", "TEXT"), ("home_number", "INTEGER"),
+            ("home_code", "INTEGER"),
+            ("away_cl_no", "INTEGER"), ("away_category_code", "TEXT"), ("away_number", "INTEGER"),
+            ("away_code", "INTEGER"),
+            ("te_no", "INTEGER"), ("kickoff", "INTEGER"),
+        ), ("ma_no",)),
+        _Table("match_membres", MatchMembre, (("ma_no", "INTEGER"),), ("ma_no", "po_cod", "position_ordre")),
+        _Table("districts", District, (), ("cg_no",)),
+        _Table("clubs", Club, (("district_cg_no", "INTEGER"),), ("cl_no",)),
+        _Table("contacts", Contact, (("cl_no", "INTEGER"), ("position", "INTEGER")), ("cl_no", "position")),
+    )
+}
+
+_INDEXES = """
+    CREATE INDEX IF NOT EXISTS matches_competition ON matches (cp_no, season);
+    CREATE INDEX IF NOT EXISTS matches_season_kickoff ON matches (season, kickoff);
+    CREATE INDEX IF NOT EXISTS matches_kickoff ON matches (kickoff);
+    CREATE INDEX IF NOT EXISTS matches_home_club ON matches (home_cl_no, season);
+    CREATE INDEX IF NOT EXISTS matches_away_club ON matches (away_cl_no, season);
+    CREATE INDEX IF NOT EXISTS matches_terrain ON matches (te_no);
+    CREATE INDEX IF NOT EXISTS match_membres_mm_no ON match_membres (mm_no);
+    CREATE INDEX IF NOT EXISTS competitions_season ON competitions (season);
+    CREATE INDEX IF NOT EXISTS clubs_district ON clubs (district_cg_no);
+    CREATE TABLE IF NOT EXISTS club_terrains (
+        cl_no INTEGER,
+        position INTEGER,
+        te_no INTEGER,
+        PRIMARY KEY (cl_no, position)
+    );
+    CREATE INDEX IF NOT EXISTS club_terrains_te_no ON club_terrains (te_no);
+"""
+
+# Colonnes de TerrainMatch : un terrain vu dans un match ne remplace pas les
+# coordonnées connues par la fiche du club
+_TERRAIN_MATCH = [name for name, _ in _columns(TerrainMatch)]
+
+
+def _timestamp(value: DateLike, end: bool = False) -> int:
+    """Horodatage Unix d'une borne de date (heure de Paris si non précisée)"""
+    if isinstance(value, str):
+        value = date.fromisoformat(value) if len(value) == 10 else datetime.fromisoformat(value)
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day, 23, 59, 59) if end else \
+            datetime(value.year, value.month, value.day)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=PARIS)
+    return int(value.timestamp())
+
+
+class EntityStore:
+    """Base SQLite locale des matchs et des clubs
+
+    Même mode d'accès que DiskCache : base en mode WAL, une connexion par
+    thread (et par processus), écritures en transactions immédiates.
+
+    Args:
+        path: Chemin du fichier SQLite (":memory:" pour une base en mémoire,
+            alors propre au thread qui l'utilise)
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path) if path != ":memory:" else path
+        self._local = threading.local()
+        self._connection().executescript(
+            ";\n".join(table.ddl() for table in TABLES.values()) + ";\n" + _INDEXES
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Retourne la connexion du thread courant"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    # ==================== ÉCRITURE ====================
+
+    def _upsert(self, conn: sqlite3.Connection, table: str, obj: Any,
+                extra: Dict[str, Any], names: Optional[Sequence[str]] = None) -> None:
+        t = TABLES[table]
+        names = [n for n, _ in t.fields] if names is None else names
+        colonnes = list(extra) + list(names)
+        conn.execute(t.upsert_sql(colonnes), list(extra.values()) + t.values(obj, names))
+
+    def _upsert_team(self, conn: sqlite3.Connection, team: Team) -> Dict[str, Any]:
+        """Enregistre une équipe et l'info de son club ; retourne sa clé"""
+        cl_no = team.club.cl_no if team.club is not None else None
+        if team.club is not None:
+            self._upsert(conn, "club_infos", team.club, {})
+        self._upsert(conn, "teams", team, {"cl_no": cl_no})
+        return {"cl_no": cl_no, "category_code": team.category_code, "number": team.number, "code": team.code}
+
+    def _upsert_match(self, conn: sqlite3.Connection, match: Match) -> None:
+        competition = match.competition
+        portee = {"cp_no": competition.cp_no, "season": competition.season}
+        if competition.cdg is not None:
+            self._upsert(conn, "cdgs", competition.cdg, {})
+        self._upsert(conn, "competitions", competition,
+                     {"cg_no": competition.cdg.cg_no if competition.cdg is not None else None})
+        self._upsert(conn, "phases", match.phase, portee)
+        self._upsert(conn, "poules", match.poule, dict(portee, phase=match.phase.number))
+        self._upsert(conn, "journees", match.poule_journee,
+                     dict(portee, phase=match.phase.number, poule=match.poule.stage_number))
+        home = self._upsert_team(conn, match.home)
+        away = self._upsert_team(conn, match.away)
+        if match.terrain is not None:
+            self._upsert(conn, "terrains", match.terrain, {}, _TERRAIN_MATCH)
+
+        kickoff = parse_kickoff(match.date, match.time)
+        self._upsert(conn, "matches", match, {
+            "cp_no": competition.cp_no,
+            "phase": match.phase.number,
+            "poule": match.poule.stage_number,
+            "journee": match.poule_journee.number,
+            "home_cl_no": home["cl_no"],
+            "home_category_code": home["category_code"],
+            "home_number": home["number"],
+            "home_code": home["code"],
+            "away_cl_no": away["cl_no"],
+            "away_category_code": away["category_code"],
+            "away_number": away["number"],
+            "away_code": away["code"],
+            "te_no": match.terrain.te_no if match.terrain is not None else None,
+            "kickoff": int(kickoff.timestamp()) if kickoff is not None else None,
+        })
+
+        conn.execute("DELETE FROM match_membres WHERE ma_no = ?", (match.ma_no,))
+        for membre in match.match_membres:
+            self._upsert(conn, "match_membres", membre, {"ma_no": match.ma_no})
+
+    def _upsert_club(self, conn: sqlite3.Connection, club: Club) -> None:
+        if club.district is not None:
+            self._upsert(conn, "districts", club.district, {})
+        self._upsert(conn, "clubs", club,
+                     {"district_cg_no": club.district.cg_no if club.district is not None else None})
+
+        conn.execute("DELETE FROM contacts WHERE cl_no = ?", (club.cl_no,))
+        for position, contact in enumerate(club.contacts):
+            self._upsert(conn, "contacts", contact, {"cl_no": club.cl_no, "position": position})
+
+        conn.execute("DELETE FROM club_terrains WHERE cl_no = ?", (club.cl_no,))
+        for position, terrain in enumerate(club.terrains):
+            self._upsert(conn, "terrains", terrain, {})
+            conn.execute(
+                "INSERT INTO club_terrains (cl_no, position, te_no) VALUES (?, ?, ?)",
+                (club.cl_no, position, terrain.te_no)
+            )
+
+    def upsert_matches(self, matches: Iterable[Match]) -> int:
+        """Enregistre (ou met à jour) des matchs et leurs sous-entités, en une transaction
+
+        Returns:
+            Nombre de matchs enregistrés
+        """
+        n = 0
+        with _Transaction(self._connection()) as conn:
+            for match in matches:
+                self._upsert_match(conn, match)
+                n += 1
+        return n
+
+    def upsert_clubs(self, clubs: Iterable[Club]) -> int:
+        """Enregistre (ou met à jour) des clubs, leurs contacts et terrains, en une transaction
+
+        Returns:
+            Nombre de clubs enregistrés
+        """
+        n = 0
+        with _Transaction(self._connection()) as conn:
+            for club in clubs:
+                self._upsert_club(conn, club)
+                n += 1
+        return n
+
+    def delete_match(self, ma_no: int) -> bool:
+        """Supprime un match et ses officiels (les entités partagées sont conservées)"""
+        with _Transaction(self._connection()) as conn:
+            conn.execute("DELETE FROM match_membres WHERE ma_no = ?", (ma_no,))
+            return conn.execute("DELETE FROM matches WHERE ma_no = ?", (ma_no,)).rowcount > 0
+
+    # ==================== LECTURE ====================
+
+    def _rows(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        cursor = self._connection().execute(sql, params)
+        noms = [d[0] for d in cursor.description]
+        return [dict(zip(noms, row)) for row in cursor]
+
+    def _row(self, table: str, key: Sequence[Any], cache: Dict) -> Optional[Dict[str, Any]]:
+        """Ligne d'une table par clé primaire, décodée, mémorisée le temps d'une requête"""
+        cle = (table,) + tuple(key)
+        if cle not in cache:
+            t = TABLES[table]
+            lignes = self._rows(
+                f"SELECT * FROM {table} WHERE " + " AND ".join(f"{k} IS ?" for k in t.key), key
+            )
+            cache[cle] = t.decode(lignes[0]) if lignes else None
+        return cache[cle]
+
+    def _team(self, prefixe: str, row: Dict[str, Any], cache: Dict) -> Dict[str, Any]:
+        cl_no = row[prefixe + "cl_no"]
+        cle = (cl_no,) + tuple(row[prefixe + k] for k in _TEAM_KEY[1:])
+        team = dict(self._row("teams", cle, cache) or {})
+        team["club"] = self._row("club_infos", (cl_no,), cache) if cl_no is not None else None
+        return team
+
+    def _build_matches(self, rows: List[Dict[str, Any]]) -> List[Match]:
+        """Reconstruit des Match à partir de lignes de la table matches"""
+        cache: Dict = {}
+        membres: Dict[int, List[Dict[str, Any]]] = {}
+        numeros = [row["ma_no"] for row in rows]
+        for i in range(0, len(numeros), _CHUNK):
+            lot = numeros[i:i + _CHUNK]
+            for membre in self._rows(
+                f"SELECT * FROM match_membres WHERE ma_no IN ({', '.join('?' for _ in lot)}) "
+                "ORDER BY ma_no, position_ordre", lot
+            ):
+                membres.setdefault(membre.pop("ma_no"), []).append(membre)
+
+        t = TABLES["matches"]
+        matchs = []
+        for row in rows:
+            data = t.decode(dict(row))
+            portee = (row["cp_no"], row["season"])
+            competition = dict(self._row("competitions", portee, cache) or {})
+            cg_no = competition.pop("cg_no", None)
+            competition["cdg"] = self._row("cdgs", (cg_no,), cache) if cg_no is not None else None
+            data["competition"] = competition
+            data["phase"] = self._row("phases", portee + (row["phase"],), cache)
+            data["poule"] = self._row("poules", portee + (row["phase"], row["poule"]), cache)
+            data["poule_journee"] = self._row(
+                "journees", portee + (row["phase"], row["poule"], row["journee"]), cache
+            )
+            data["home"] = self._team("home_", row, cache)
+            data["away"] = self._team("away_", row, cache)
+            terrain = self._row("terrains", (row["te_no"],), cache) if row["te_no"] is not None else None
+            data["terrain"] = {k: terrain[k] for k in _TERRAIN_MATCH} if terrain else None
+            data["match_membres"] = membres.get(row["ma_no"], [])
+            matchs.append(Match.from_dict(data))
+        return matchs
+
+    def get_match(self, ma_no: int) -> Optional[Match]:
+        """Match enregistré, ou None"""
+        matchs = self._build_matches(self._rows("SELECT * FROM matches WHERE ma_no = ?", (ma_no,)))
+        return matchs[0] if matchs else None
+
+    def matches(
+        self,
+        cp_no: Optional[int] = None,
+        season: Optional[int] = None,
+        club: Optional[int] = None,
+        referee: Optional[int] = None,
+        since: Optional[DateLike] = None,
+        until: Optional[DateLike] = None,
+        phase: Optional[int] = None,
+        poule: Optional[int] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Match]:
+        """Matchs enregistrés, par coup d'envoi croissant
+
+        Args:
+            cp_no: Compétition
+            season: Saison (ex: 2024)
+            club: Club (cl_no) à domicile ou à l'extérieur
+            referee: Officiel (mm_no) du match
+            since, until: Bornes incluses du coup d'envoi (date, datetime ou ISO ;
+                heure de Paris si sans fuseau)
+            phase, poule: Phase et poule (avec cp_no)
+            status: Statut (ex: "A" pour les matchs terminés)
+            limit: Nombre maximal de matchs
+
+        Example:
+            >>> store.matches(club=500100, season=2024)
+        """
+        conditions = []
+        params: List[Any] = []
+        # Avec un club, la saison est filtrée par les index (club, saison) de la sous-requête
+        for colonne, valeur in (("cp_no", cp_no), ("season", None if club is not None else season),
+                                ("phase", phase), ("poule", poule), ("status", status)):
+            if valeur is not None:
+                conditions.append(f"{colonne} = ?")
+                params.append(valeur)
+        if club is not None:
+            # Une sous-requête par côté : chacune utilise son index (club, saison)
+            saison = " AND season = ?" if season is not None else ""
+            conditions.append(
+                f"ma_no IN (SELECT ma_no FROM matches WHERE home_cl_no = ?{saison} "
+                f"UNION ALL SELECT ma_no FROM matches WHERE away_cl_no = ?{saison})"
+            )
+            params += [club, season, club, season] if season is not None else [club, club]
+        if referee is not None:
+            conditions.append("ma_no IN (SELECT ma_no FROM match_membres WHERE mm_no = ?)")
+            params.append(referee)
+        if since is not None:
+            conditions.append("kickoff >= ?")
+            params.append(_timestamp(since))
+        if until is not None:
+            conditions.append("kickoff <= ?")
+            params.append(_timestamp(until, end=True))
+
+        sql = "SELECT * FROM matches"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY kickoff IS NULL, kickoff, ma_no"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return self._build_matches(self._rows(sql, params))
+
+    def get_club(self, cl_no: int) -> Optional[Club]:
+        """Fiche de club enregistrée (avec district, contacts et terrains), ou None"""
+        cache: Dict = {}
+        data = self._row("clubs", (cl_no,), cache)
+        if data is None:
+            return None
+        data = dict(data)
+        cg_no = data.pop("district_cg_no")
+        data["district"] = self._row("districts", (cg_no,), cache) if cg_no is not None else None
+        data["contacts"] = [
+            TABLES["contacts"].decode(c) for c in self._rows(
+                "SELECT type, type_label, value FROM contacts WHERE cl_no = ? ORDER BY position", (cl_no,)
+            )
+        ]
+        data["terrains"] = [
+            TABLES["terrains"].decode(t) for t in self._rows(
+                "SELECT terrains.* FROM club_terrains JOIN terrains USING (te_no) "
+                "WHERE club_terrains.cl_no = ? ORDER BY position", (cl_no,)
+            )
+        ]
+        return Club.from_dict(data)
+
+    def competitions(self, season: Optional[int] = None) -> List[Competition]:
+        """Compétitions enregistrées, éventuellement d'une saison"""
+        sql = "SELECT * FROM competitions"
+        params: List[Any] = []
+        if season is not None:
+            sql += " WHERE season = ?"
+            params.append(season)
+        cache: Dict = {}
+        resultats = []
+        for row in self._rows(sql + " ORDER BY cp_no, season", params):
+            data = TABLES["competitions"].decode(row)
+            cg_no = data.pop("cg_no")
+            data["cdg"] = self._row("cdgs", (cg_no,), cache) if cg_no is not None else None
+            resultats.append(Competition.from_dict(data))
+        return resultats
+
+    def count(self, table: str = "matches") -> int:
+        """Nombre de lignes d'une table (ex: "matches", "clubs", "terrains")"""
+        if table not in TABLES and table != "club_terrains":
+            raise ValueError(f"Table inconnue: {table}")
+        return self._connection().execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def close(self) -> None:
+        """Ferme la connexion du thread courant"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
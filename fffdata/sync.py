@@ -0,0 +1,244 @@
+"""Synchronisation incrémentale des compétitions
+
+Plutôt que de recharger une saison entière, DeltaSync ne relit que les
+calendriers (une requête par poule) et compare chaque entrée à la marque
+enregistrée lors de la synchronisation précédente : horodatage
+external_updated_at, statut, date, heure, score et forfaits. Seuls les matchs
+dont la marque a changé (ou qui sont nouveaux) sont récupérés en entier, et
+chacun d'eux figure dans le ChangeSet : un score corrigé ou un match reporté
+est une modification, même si external_updated_at et le statut n'ont pas bougé.
+Un match relu dont l'empreinte (hash de to_tuple()) n'a pas changé est compté
+comme inchangé.
+
+Seuls les endpoints de découverte (compétition, poules, calendriers) des
+compétitions demandées sont oubliés des caches du client, juste avant d'être
+relus, dès la première synchronisation.
+
+Les marques sont conservées dans une base SQLite (SyncState).
+
+Example:
+    >>> with FFFClient(pool_maxsize=16) as client:
+    >>>     sync = DeltaSync(client, SyncState("~/.cache/fffdata-sync.sqlite"))
+    >>>     changes = sync.sync(423015, 423016)
+    >>>     for match in changes.added + changes.updated:
+    >>>         print(match.get_score())
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .cache import _Transaction
+from .client import FFFClient
+from .crawler import CALENDRIER, CompetitionCrawler, WorkItem, _items
+from .endpoints import FFFEndpoints
+from .models import Match
+
+
+# Champs d'une entrée de calendrier dont le changement justifie de relire le match
+LISTING_FIELDS = (
+    "external_updated_at", "status", "date", "time",
+    "home_score", "away_score", "home_is_forfeit", "away_is_forfeit",
+)
+
+
+def listing_mark(entry: dict) -> str:
+    """Marque d'une entrée de calendrier (JSON des champs LISTING_FIELDS)"""
+    return json.dumps([entry.get(name) for name in LISTING_FIELDS], separators=(",", ":"))
+
+
+def fingerprint(match: Match) -> str:
+    """Empreinte d'un match (hash de to_tuple()) : change avec n'importe quel champ"""
+    return hashlib.blake2b(repr(match.to_tuple()).encode(), digest_size=16).hexdigest()
+
+
+@dataclass
+class MatchMark:
+    """Marque enregistrée pour un match lors de la dernière synchronisation"""
+    cp_no: int
+    listing: str
+    fingerprint: str
+
+
+@dataclass
+class ChangeSet:
+    """Résultat d'une synchronisation
+
+    Attributes:
+        added: Matchs apparus depuis la dernière synchronisation
+        updated: Matchs connus relus dont le contenu a changé
+        removed: Numéros des matchs disparus des calendriers (ou devenus 404)
+        skipped: Nombre de matchs inchangés : entrées de calendrier identiques
+            (non relues), ou matchs relus identiques à la version enregistrée
+        errors: Exceptions par endpoint ; les matchs concernés seront relus à
+            la prochaine synchronisation
+    """
+    added: List[Match] = field(default_factory=list)
+    updated: List[Match] = field(default_factory=list)
+    removed: List[int] = field(default_factory=list)
+    skipped: int = 0
+    errors: Dict[str, Exception] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+
+class SyncState:
+    """Marques de synchronisation, stockées dans une base SQLite
+
+    Args:
+        path: Chemin du fichier SQLite
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS matches (
+            ma_no INTEGER PRIMARY KEY,
+            cp_no INTEGER NOT NULL,
+            listing TEXT NOT NULL,
+            fingerprint TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS matches_cp_no ON matches (cp_no);
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        self.conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self._SCHEMA)
+        colonnes = {row[1] for row in self.conn.execute("PRAGMA table_info(matches)")}
+        if "fingerprint" not in colonnes:
+            # Base d'une version précédente : les matchs seront relus une fois
+            self.conn.execute("ALTER TABLE matches ADD COLUMN fingerprint TEXT NOT NULL DEFAULT ''")
+
+    def marks(self, numeros_competition: Iterable[int]) -> Dict[int, MatchMark]:
+        """Marques des matchs connus des compétitions données, par numéro de match"""
+        marks = {}
+        for cp_no in numeros_competition:
+            for ma_no, listing, empreinte in self.conn.execute(
+                "SELECT ma_no, listing, fingerprint FROM matches WHERE cp_no = ?", (cp_no,)
+            ):
+                marks[ma_no] = MatchMark(cp_no, listing, empreinte)
+        return marks
+
+    def store(self, marks: Dict[int, MatchMark]) -> None:
+        """Enregistre des marques (remplace celles des mêmes matchs)"""
+        with _Transaction(self.conn) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO matches (ma_no, cp_no, listing, fingerprint) VALUES (?, ?, ?, ?)",
+                [(ma_no, m.cp_no, m.listing, m.fingerprint) for ma_no, m in marks.items()]
+            )
+
+    def remove(self, numeros_match: Iterable[int]) -> None:
+        """Oublie des matchs"""
+        with _Transaction(self.conn) as conn:
+            conn.executemany("DELETE FROM matches WHERE ma_no = ?", [(n,) for n in numeros_match])
+
+    def close(self) -> None:
+        """Ferme la base"""
+        self.conn.close()
+
+
+class _FreshCrawler(CompetitionCrawler):
+    """Crawler qui oublie chaque endpoint des caches du client avant de le lire"""
+
+    def _fetch(self, item: WorkItem) -> Any:
+        self.client.invalidate(item.endpoint)
+        return super()._fetch(item)
+
+
+class DeltaSync:
+    """Synchronise des compétitions en ne relisant que les matchs modifiés
+
+    Les endpoints de découverte des compétitions demandées et les matchs relus
+    sont oubliés des caches du client (disque, entités, validateurs) juste
+    avant d'être lus, pour obtenir l'état courant de l'API.
+
+    Args:
+        client: Client utilisé pour toutes les requêtes
+        state: Marques de la synchronisation précédente
+        max_workers: Nombre de threads pour la découverte et les matchs (par défaut: 8)
+    """
+
+    def __init__(self, client: FFFClient, state: SyncState, max_workers: int = 8):
+        self.client = client
+        self.state = state
+        self.max_workers = max_workers
+
+    def _listings(self, numeros_competition: Tuple[int, ...], changes: ChangeSet) -> Tuple[Dict[int, Tuple[int, str]], set]:
+        """Entrées des calendriers : {ma_no: (cp_no, marque)} et compétitions lues en entier"""
+        listings: Dict[int, Tuple[int, str]] = {}
+        incompletes = set()
+        crawler = _FreshCrawler(self.client, max_workers=self.max_workers, matches=False)
+        for item, resultat in crawler.crawl(*numeros_competition):
+            cp_no = item.args[0]
+            if isinstance(resultat, Exception):
+                changes.errors[item.endpoint] = resultat
+                incompletes.add(cp_no)
+                continue
+            if item.kind != CALENDRIER:
+                continue
+            for entry in _items(resultat):
+                ma_no = entry.get("ma_no") if isinstance(entry, dict) else None
+                if isinstance(ma_no, int) and ma_no > 0:
+                    listings[ma_no] = (cp_no, listing_mark(entry))
+        return listings, set(numeros_competition) - incompletes
+
+    def sync(self, *numeros_competition: int) -> ChangeSet:
+        """Synchronise des compétitions et retourne les changements
+
+        Args:
+            *numeros_competition: Numéros des compétitions (cp_no)
+
+        Returns:
+            ChangeSet des matchs ajoutés, modifiés et supprimés. Les marques ne
+            sont mises à jour que pour les matchs relus sans erreur.
+        """
+        changes = ChangeSet()
+        listings, completes = self._listings(numeros_competition, changes)
+        known = self.state.marks(numeros_competition)
+
+        stale = [
+            ma_no for ma_no, (_, listing) in listings.items()
+            if ma_no not in known or known[ma_no].listing != listing
+        ]
+        changes.skipped = len(listings) - len(stale)
+
+        for ma_no in stale:
+            self.client.invalidate(FFFEndpoints.match_entities(ma_no))
+
+        marks = {}
+        disparus = []
+        for ma_no, resultat in self.client.get_matches_bulk(stale, max_workers=self.max_workers):
+            if isinstance(resultat, Exception):
+                changes.errors[FFFEndpoints.match_entities(ma_no)] = resultat
+                continue
+            if resultat is None:
+                disparus.append(ma_no)
+                continue
+
+            cp_no, listing = listings[ma_no]
+            marks[ma_no] = MatchMark(cp_no, listing, fingerprint(resultat))
+            # Un match connu relu à l'identique (seul l'horodatage de
+            # l'entrée a bougé, par exemple) n'est pas une modification
+            if ma_no in known:
+                if known[ma_no].fingerprint == marks[ma_no].fingerprint:
+                    changes.skipped += 1
+                else:
+                    changes.updated.append(resultat)
+            else:
+                changes.added.append(resultat)
+
+        # Un match absent de tous les calendriers d'une compétition lue en entier a disparu
+        disparus.extend(
+            ma_no for ma_no, mark in known.items()
+            if mark.cp_no in completes and ma_no not in listings
+        )
+        changes.removed = [ma_no for ma_no in disparus if ma_no in known]
+
+        self.state.store(marks)
+        self.state.remove(disparus)
+        return changes
@@ -0,0 +1,420 @@
+"""Table colonnaire de matchs pour l'analyse vectorisée
+
+Une MatchTable range une liste de matchs colonne par colonne dans des tableaux
+numpy : entiers pour les numéros et les scores, datetime64 pour le coup d'envoi,
+codes catégoriels pour le statut et les équipes. Filtres et agrégations
+s'appliquent alors à toute une saison en une seule opération vectorisée.
+
+Nécessite numpy (pip install fffdata[analytics]) ; l'export vers pandas ou
+Arrow nécessite en plus la bibliothèque correspondante.
+"""
+
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    np = None
+
+from .dates import PARIS, datetime_array, kickoff_array
+from .models.match import STATUT_TERMINE, Match
+
+
+# Valeur des colonnes entières quand la donnée est absente (score d'un match
+# non joué, club inconnu...)
+ABSENT = -1
+
+# Colonnes numériques et leur type numpy
+NUMERIC_COLUMNS = {
+    "ma_no": "int64",
+    "season": "int32",
+    "cp_no": "int64",
+    "phase": "int32",
+    "poule": "int32",
+    "journee": "int32",
+    "home_club": "int64",
+    "away_club": "int64",
+    "home_score": "int16",
+    "away_score": "int16",
+}
+
+# Colonnes catégorielles et le jeu de catégories qu'elles utilisent (les
+# équipes à domicile et à l'extérieur partagent les mêmes codes)
+CATEGORICAL_COLUMNS = {
+    "status": "status",
+    "home_team": "team",
+    "away_team": "team",
+}
+
+_AGGREGATIONS = ("count", "sum", "mean", "min", "max")
+
+DateLike = Union[datetime, date, str]
+
+
+def team_id(cl_no: Optional[int], number: Optional[int]) -> Optional[str]:
+    """Identifiant d'équipe utilisé par MatchTable : "<cl_no>-<numéro d'équipe>" """
+    if cl_no is None:
+        return None
+    return f"{cl_no}-{number or 1}"
+
+
+def _payload_row(data: dict) -> tuple:
+    competition = data.get("competition") or {}
+    home = data.get("home") or {}
+    away = data.get("away") or {}
+    home_club = (home.get("club") or {}).get("cl_no")
+    away_club = (away.get("club") or {}).get("cl_no")
+    return (
+        data.get("ma_no"),
+        data.get("season"),
+        competition.get("cp_no"),
+        (data.get("phase") or {}).get("number"),
+        (data.get("poule") or {}).get("stage_number"),
+        (data.get("poule_journee") or {}).get("number"),
+        home_club,
+        away_club,
+        # Comme Match.from_dict : score 0 si la clé manque, ABSENT s'il est null
+        data.get("home_score", 0),
+        data.get("away_score", 0),
+        data.get("date"),
+        data.get("time"),
+        data.get("external_updated_at"),
+        data.get("status", ""),
+        team_id(home_club, home.get("number")),
+        team_id(away_club, away.get("number")),
+    )
+
+
+def _match_row(match: Match) -> tuple:
+    home_club = match.home.club.cl_no if match.home.club else None
+    away_club = match.away.club.cl_no if match.away.club else None
+    return (
+        match.ma_no,
+        match.season,
+        match.competition.cp_no,
+        match.phase.number,
+        match.poule.stage_number,
+        match.poule_journee.number,
+        home_club,
+        away_club,
+        match.home_score,
+        match.away_score,
+        match.date,
+        match.time,
+        match.external_updated_at,
+        match.status,
+        team_id(home_club, match.home.number),
+        team_id(away_club, match.away.number),
+    )
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("numpy n'est pas installé (pip install fffdata[analytics])")
+
+
+def _to_datetime64(value: DateLike) -> "np.datetime64":
+    """Convertit une borne de date en instant UTC (heure de Paris si sans fuseau)"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=PARIS)
+    return np.datetime64(int(value.timestamp()), "s")
+
+
+class MatchTable:
+    """Matchs stockés colonne par colonne (tableaux numpy)
+
+    Colonnes numériques (voir NUMERIC_COLUMNS) : ma_no, season, cp_no, phase,
+    poule, journee, home_club, away_club, home_score, away_score. Une donnée
+    absente vaut ABSENT (-1), par exemple un score null ; une clé de score
+    manquante vaut 0, comme dans Match. from_payloads et from_matches
+    construisent la même table.
+
+    kickoff, updated_at : coup d'envoi et dernière mise à jour côté FFF, en
+    datetime64[s] UTC (NaT si inconnus).
+
+    Colonnes catégorielles : status, home_team, away_team. table["status"]
+    retourne les codes (int32, -1 si absent), table.categories("status") les
+    valeurs correspondantes et table.decode("status") les valeurs par match.
+    Une équipe est identifiée par team_id(cl_no, numéro) (ex: "500100-1").
+
+    Les filtres retournent une nouvelle table et partagent les catégories.
+
+    Example:
+        >>> table = MatchTable.from_payloads(payloads)
+        >>> saison = table.competition(423015).finished()
+        >>> buts = saison.groupby("journee", buts=("home_score", "sum"))
+        >>> df = saison.to_pandas()
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, "np.ndarray"],
+        categories: Dict[str, List[Any]]
+    ):
+        _require_numpy()
+        self._columns = columns
+        self._categories = categories
+
+    @classmethod
+    def from_payloads(cls, payloads: Iterable[dict]) -> "MatchTable":
+        """Construit une table depuis des réponses match_entities (dictionnaires JSON)"""
+        return cls._from_rows(map(_payload_row, payloads))
+
+    @classmethod
+    def from_matches(cls, matches: Iterable[Match]) -> "MatchTable":
+        """Construit une table depuis des Match (ou LazyMatch)"""
+        return cls._from_rows(map(_match_row, matches))
+
+    @classmethod
+    def _from_rows(cls, rows: Iterable[tuple]) -> "MatchTable":
+        _require_numpy()
+        rows = list(rows)
+        n_numeric = len(NUMERIC_COLUMNS)
+        colonnes = list(zip(*rows)) if rows else [()] * (n_numeric + 3 + len(CATEGORICAL_COLUMNS))
+
+        columns = {}
+        for (name, dtype), values in zip(NUMERIC_COLUMNS.items(), colonnes):
+            columns[name] = np.array(
+                [ABSENT if v is None else v for v in values], dtype=dtype
+            )
+
+        dates, times, updated = colonnes[n_numeric:n_numeric + 3]
+        columns["kickoff"] = kickoff_array(dates, times)
+        columns["updated_at"] = datetime_array(updated)
+
+        codes: Dict[str, Dict[Any, int]] = {}
+        for (name, group), values in zip(CATEGORICAL_COLUMNS.items(), colonnes[n_numeric + 3:]):
+            mapping = codes.setdefault(group, {})
+            columns[name] = np.array(
+                [ABSENT if v is None else mapping.setdefault(v, len(mapping)) for v in values],
+                dtype="int32"
+            )
+        categories = {group: list(mapping) for group, mapping in codes.items()}
+        return cls(columns, categories)
+
+    # Accès aux colonnes
+
+    @property
+    def columns(self) -> List[str]:
+        """Noms des colonnes"""
+        return list(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns["ma_no"])
+
+    def __getitem__(self, name: str) -> "np.ndarray":
+        """Retourne une colonne (codes pour les colonnes catégorielles)"""
+        return self._columns[name]
+
+    def __repr__(self) -> str:
+        return f"MatchTable({len(self)} matchs)"
+
+    def categories(self, name: str) -> List[Any]:
+        """Retourne les catégories d'une colonne catégorielle, dans l'ordre des codes"""
+        return self._categories.get(CATEGORICAL_COLUMNS[name], [])
+
+    def code(self, name: str, value: Any) -> int:
+        """Retourne le code d'une valeur dans une colonne catégorielle (ABSENT si inconnue)"""
+        try:
+            return self.categories(name).index(value)
+        except ValueError:
+            return ABSENT
+
+    def decode(self, name: str) -> "np.ndarray":
+        """Retourne les valeurs (et non les codes) d'une colonne catégorielle"""
+        return self._decode(name, self._columns[name])
+
+    def _decode(self, name: str, codes: "np.ndarray") -> "np.ndarray":
+        valeurs = np.empty(len(self.categories(name)) + 1, dtype=object)
+        valeurs[:-1] = self.categories(name)
+        # Le code ABSENT (-1) désigne la dernière case : None
+        valeurs[-1] = None
+        return valeurs[codes]
+
+    # Filtres
+
+    def where(self, mask: "np.ndarray") -> "MatchTable":
+        """Retourne les matchs sélectionnés par un masque booléen ou des indices"""
+        if mask.dtype == bool:
+            # Indexer par positions est plus rapide qu'un masque répété par colonne
+            mask = np.flatnonzero(mask)
+        return MatchTable(
+            {name: column[mask] for name, column in self._columns.items()},
+            self._categories
+        )
+
+    def competition(self, *cp_nos: int) -> "MatchTable":
+        """Matchs d'une ou plusieurs compétitions"""
+        return self.where(np.isin(self._columns["cp_no"], cp_nos))
+
+    def between(
+        self,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None
+    ) -> "MatchTable":
+        """Matchs dont le coup d'envoi est dans [start, end[
+
+        Les dates sans fuseau sont interprétées en heure de Paris ; une date
+        seule désigne minuit. Les matchs sans date sont exclus.
+        """
+        kickoff = self._columns["kickoff"]
+        mask = ~np.isnat(kickoff)
+        if start is not None:
+            mask &= kickoff >= _to_datetime64(start)
+        if end is not None:
+            mask &= kickoff < _to_datetime64(end)
+        return self.where(mask)
+
+    def team(self, cl_no: int, number: Optional[int] = None) -> "MatchTable":
+        """Matchs d'un club (à domicile ou à l'extérieur), ou d'une de ses équipes"""
+        if number is None:
+            mask = (self._columns["home_club"] == cl_no) | (self._columns["away_club"] == cl_no)
+        else:
+            code = self.code("home_team", team_id(cl_no, number))
+            if code == ABSENT:
+                mask = np.zeros(len(self), dtype=bool)
+            else:
+                mask = (self._columns["home_team"] == code) | (self._columns["away_team"] == code)
+        return self.where(mask)
+
+    def status(self, *statuses: str) -> "MatchTable":
+        """Matchs ayant l'un des statuts donnés (un statut inconnu ne sélectionne rien)"""
+        # ABSENT est aussi le code d'un statut null : l'écarter
+        codes = [c for c in (self.code("status", s) for s in statuses) if c != ABSENT]
+        return self.where(np.isin(self._columns["status"], codes))
+
+    def finished(self) -> "MatchTable":
+        """Matchs terminés ayant un score"""
+        code = self.code("status", STATUT_TERMINE)
+        if code == ABSENT:
+            return self.where(np.zeros(len(self), dtype=bool))
+        mask = (
+            (self._columns["status"] == code)
+            & (self._columns["home_score"] != ABSENT)
+            & (self._columns["away_score"] != ABSENT)
+        )
+        return self.where(mask)
+
+    def sort(self, by: str = "kickoff", descending: bool = False) -> "MatchTable":
+        """Trie les matchs selon une colonne (tri stable)"""
+        order = np.argsort(self._columns[by], kind="stable")
+        return self.where(order[::-1] if descending else order)
+
+    # Agrégations
+
+    def groupby(
+        self,
+        keys: Union[str, Sequence[str]],
+        **aggregations: Tuple[str, str]
+    ) -> Dict[str, "np.ndarray"]:
+        """Agrège les matchs par clé
+
+        Args:
+            keys: Colonne(s) de regroupement
+            **aggregations: nom=(colonne, fonction), fonction parmi count, sum,
+                mean, min, max. Les valeurs ABSENT ne sont pas exclues : filtrer
+                avec finished() avant d'agréger des scores.
+
+        Returns:
+            Dictionnaire de colonnes : une par clé (valeurs décodées pour les
+            colonnes catégorielles) et une par agrégation, une ligne par groupe
+
+        Example:
+            >>> table.finished().groupby(
+            ...     "home_team", matchs=("ma_no", "count"), buts=("home_score", "sum")
+            ... )
+        """
+        if isinstance(keys, str):
+            keys = [keys]
+        for name, (column, func) in aggregations.items():
+            if func not in _AGGREGATIONS:
+                raise ValueError(f"Agrégation inconnue pour {name}: {func}")
+
+        # Code de groupe : combinaison des codes de chaque clé
+        uniques, inverses = zip(*(
+            np.unique(self._columns[k], return_inverse=True) for k in keys
+        ))
+        dims = tuple(max(len(u), 1) for u in uniques)
+        combined = np.ravel_multi_index([i.reshape(-1) for i in inverses], dims)
+        groupes, inverse = np.unique(combined, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        counts = np.bincount(inverse, minlength=len(groupes))
+
+        result: Dict[str, np.ndarray] = {}
+        for key, values, index in zip(keys, uniques, np.unravel_index(groupes, dims)):
+            values = values[index]
+            result[key] = self._decode(key, values) if key in CATEGORICAL_COLUMNS else values
+
+        order = starts = None
+        for name, (column, func) in aggregations.items():
+            values = self._columns[column]
+            if func == "count":
+                result[name] = counts
+            elif func in ("sum", "mean"):
+                sums = np.bincount(inverse, weights=values, minlength=len(groupes))
+                result[name] = sums / counts if func == "mean" else sums.astype("int64")
+            else:
+                if order is None:
+                    order = np.argsort(inverse, kind="stable")
+                    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+                ufunc = np.minimum if func == "min" else np.maximum
+                result[name] = ufunc.reduceat(values[order], starts) if len(order) else values[:0]
+        return result
+
+    # Export
+
+    def to_pandas(self):
+        """Exporte la table en DataFrame pandas, sans copier les colonnes numériques
+
+        Les colonnes catégorielles deviennent des pandas.Categorical et les
+        dates des colonnes datetime avec le fuseau Europe/Paris.
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("pandas n'est pas installé (pip install pandas)")
+
+        data = {}
+        for name, column in self._columns.items():
+            if name in CATEGORICAL_COLUMNS:
+                data[name] = pd.Categorical.from_codes(
+                    column, categories=pd.Index(self.categories(name), dtype=object)
+                )
+            elif column.dtype.kind == "M":
+                data[name] = pd.Series(column).dt.tz_localize("UTC").dt.tz_convert(PARIS.key)
+            else:
+                data[name] = column
+        return pd.DataFrame(data, copy=False)
+
+    def to_arrow(self):
+        """Exporte la table en pyarrow.Table, sans copier les colonnes numériques
+
+        Les colonnes catégorielles deviennent des DictionaryArray, les dates
+        des timestamp("s", tz="Europe/Paris").
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow n'est pas installé (pip install pyarrow)")
+
+        arrays = {}
+        for name, column in self._columns.items():
+            if name in CATEGORICAL_COLUMNS:
+                arrays[name] = pa.DictionaryArray.from_arrays(
+                    pa.array(column, mask=column < 0),
+                    pa.array(self.categories(name), type=pa.string())
+                )
+            elif column.dtype.kind == "M":
+                arrays[name] = pa.array(
+                    column.view("int64"),
+                    type=pa.timestamp("s", tz=PARIS.key),
+                    mask=np.isnat(column)
+                )
+            else:
+                arrays[name] = pa.array(column)
+        return pa.table(arrays)
@@ -6,5 +6,11 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests>=2.28.0",
+        "backports.zoneinfo; python_version < '3.9'",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.8"],
+        "fast": ["orjson>=3.6", "msgpack>=1.0"],
+        "analytics": ["numpy>=1.20"],
+    },
 )
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""Outils partagés par les tests"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+import requests.adapters
+
+# Permet de lancer les tests depuis la racine du dépôt sans installation
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from fffdata.models import Match  # noqa: E402
+
+
+@pytest.fixture
+def match_payload():
+    """Fabrique de corps match_entities (copie modifiable d'une réponse enregistrée)"""
+    with open(ROOT / "benchmarks" / "data" / "match_entities.jsonl", "rb") as f:
+        modele = f.readline()
+
+    def fabrique(**champs):
+        data = json.loads(modele)
+        data.update(champs)
+        return data
+
+    return fabrique
+
+
+@pytest.fixture
+def make_match(match_payload):
+    """Fabrique de Match à partir de match_payload"""
+    return lambda **champs: Match.from_dict(match_payload(**champs))
+
+
+class FakeTransport(requests.adapters.BaseAdapter):
+    """Adaptateur requests qui rejoue des réponses préparées, sans réseau"""
+
+    def __init__(self):
+        super().__init__()
+        self.responses = []
+        self.requests = []
+
+    def reply(self, status=200, body=None, headers=None):
+        """Prépare la prochaine réponse"""
+        self.responses.append((status, body, headers or {}))
+
+    def fail(self, error):
+        """Prépare une erreur de transport (ex: requests.ConnectionError)"""
+        self.responses.append(error)
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        reponse = self.responses.pop(0)
+        if isinstance(reponse, Exception):
+            raise reponse
+        status, body, headers = reponse
+        response = requests.Response()
+        response.status_code = status
+        response._content = b"" if body is None else json.dumps(body).encode()
+        response.headers.update(headers)
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def transport():
+    """Faux transport HTTP, à monter avec client.session.mount("https://", transport)"""
+    return FakeTransport()
@@ -0,0 +1,96 @@
+"""AsyncFFFClient contre un serveur HTTP local"""
+
+import asyncio
+import re
+
+import pytest
+
+from fffdata.async_client import AsyncFFFClient
+from fffdata.exceptions import FFFAPIError
+from fffdata.models import Match
+from fffdata.retry import RetryPolicy
+
+web = pytest.importorskip("aiohttp.web")
+
+
+class Serveur:
+    """Sert des match_entities et mesure le nombre de requêtes simultanées"""
+
+    def __init__(self, match_payload):
+        self.match_payload = match_payload
+        self.en_cours = self.max_en_cours = 0
+        self.echecs = {}  # ma_no -> statuts à renvoyer avant de répondre
+
+    async def handler(self, request):
+        self.en_cours += 1
+        self.max_en_cours = max(self.max_en_cours, self.en_cours)
+        try:
+            await asyncio.sleep(0.01)
+            ma_no = int(re.search(r"(\d+)\.json$", request.path).group(1))
+            if self.echecs.get(ma_no):
+                return web.Response(status=self.echecs[ma_no].pop(0), headers={"Retry-After": "0"})
+            if ma_no == 404:
+                return web.Response(status=404)
+            return web.json_response(self.match_payload(ma_no=ma_no))
+        finally:
+            self.en_cours -= 1
+
+
+def _run(serveur, scenario, **options):
+    async def main():
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", serveur.handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            async with AsyncFFFClient(base_url=f"http://127.0.0.1:{port}", **options) as client:
+                return await scenario(client)
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+@pytest.fixture
+def serveur(match_payload):
+    return Serveur(match_payload)
+
+
+def test_concurrency_is_bounded(serveur):
+    async def scenario(client):
+        return await asyncio.gather(*(client.get_match_entities(n) for n in range(1, 41)))
+
+    matchs = _run(serveur, scenario, max_concurrency=5)
+    assert [m.ma_no for m in matchs] == list(range(1, 41))
+    assert all(isinstance(m, Match) for m in matchs)
+    assert serveur.max_en_cours <= 5
+
+
+def test_not_found_projection_and_retry(serveur):
+    serveur.echecs[7] = [503, 503]
+    serveur.echecs[8] = [500]
+
+    async def scenario(client):
+        absent = await client.get_match_entities(404)
+        record = await client.get_match_entities(3, fields=("ma_no", "home.short_name"))
+        rejoue = await client.get_match_entities(7)
+        with pytest.raises(FFFAPIError):
+            await client.get_match_entities(8, retry=RetryPolicy(max_attempts=1))
+        return absent, record, rejoue
+
+    absent, record, rejoue = _run(serveur, scenario, retry=RetryPolicy(max_attempts=3, backoff_base=0.01))
+    assert absent is None
+    assert tuple(record) == (3, "AS Saint Etienne")
+    assert rejoue.ma_no == 7
+
+
+def test_lazy_models_and_invalid_arguments(serveur):
+    async def scenario(client):
+        return await client.get_match_entities(5)
+
+    assert type(_run(serveur, scenario, lazy=True)).__name__ == "LazyMatch"
+    with pytest.raises(ValueError):
+        AsyncFFFClient(max_concurrency=0)
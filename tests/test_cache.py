@@ -0,0 +1,18 @@
+"""Durées de vie de CachePolicy"""
+
+from fffdata.cache import CachePolicy
+from fffdata.endpoints import FFFEndpoints
+
+
+def test_match_ttl_depends_on_status():
+    policy = CachePolicy()
+    endpoint = FFFEndpoints.match_entities(28541157)
+    assert policy.ttl_for(endpoint, {"status": "A"}) is None
+    assert policy.ttl_for(endpoint, {"status": "E"}) == policy.live_match_ttl
+
+
+def test_feuille_uses_its_family_ttl():
+    policy = CachePolicy()
+    assert policy.ttl_for(FFFEndpoints.match_feuille(28541157), {"id": 1}) is None
+    policy = CachePolicy(ttls={"match_feuilles": 600})
+    assert policy.ttl_for(FFFEndpoints.match_feuille(28541157), {"id": 1}) == 600
@@ -0,0 +1,45 @@
+"""Sessions par thread et lots de FFFClient"""
+
+import gc
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fffdata import FFFClient
+
+
+def test_thread_sessions_are_released_with_their_thread():
+    client = FFFClient(session_per_thread=True)
+    for _ in range(5):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            sessions = list(executor.map(lambda _: client._get_session(), range(16)))
+        assert all(session is not client.session for session in sessions)
+        del sessions
+    gc.collect()
+
+    # Seule la session principale reste ; le pool partagé est intact
+    assert list(client._sessions) == [client.session]
+    assert client.session.get_adapter("https://") is client.adapter
+    client.close()
+
+
+def test_bulk_arguments_are_checked_at_call_time():
+    client = FFFClient()
+    # Aucune requête : les erreurs sont levées avant la première itération
+    with pytest.raises(ValueError):
+        client.get_matches_bulk([1, 2], max_workers=0)
+    with pytest.raises(ValueError):
+        client.get_clubs_bulk([1, 2], max_workers=-1)
+    with pytest.raises(ValueError):
+        client.get_matches_bulk([1, 2], fields=("inconnu",))
+    with pytest.raises(TypeError):
+        client.get_clubs_bulk(None)
+    client.close()
+
+
+def test_bulk_yields_every_result(monkeypatch):
+    client = FFFClient()
+    monkeypatch.setattr(client, "get_match_entities", lambda n, fields=None: None if n == 3 else n * 10)
+    resultats = dict(client.get_matches_bulk(iter(range(1, 50)), max_workers=4))
+    assert resultats == {n: None if n == 3 else n * 10 for n in range(1, 50)}
+    client.close()
@@ -0,0 +1,114 @@
+"""Parcours et reprise de CompetitionCrawler"""
+
+import threading
+
+import pytest
+
+from fffdata.crawler import MATCH, MAX_PROBED_PHASES, CompetitionCrawler, SQLiteFrontier
+
+
+class StubClient:
+    """Une compétition, une phase, deux poules de trois matchs"""
+
+    def __init__(self, make_match):
+        self.make_match = make_match
+        self.listed = True  # La compétition liste ses phases
+        self.phases = lambda phase: phase == 1  # Phases qui ont des poules
+        self.errors = set()
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def _hit(self, *args):
+        with self._lock:
+            self.requests.append(args)
+
+    def get_competition(self, cp_no):
+        self._hit("competition", cp_no)
+        return {"cp_no": cp_no, "phases": [{"number": 1}] if self.listed else []}
+
+    def get_competition_poules(self, cp_no, phase=1):
+        self._hit("poules", cp_no, phase)
+        return [{"stage_number": 1}, {"stage_number": 2}] if self.phases(phase) else None
+
+    def get_competition_calendrier(self, cp_no, phase=1, poule=1):
+        self._hit("calendrier", cp_no, phase, poule)
+        return [{"ma_no": poule * 10 + i} for i in (1, 2, 3)]
+
+    def get_match_entities(self, ma_no, fields=None):
+        self._hit("match", ma_no)
+        if ma_no in self.errors:
+            raise RuntimeError(f"match {ma_no}")
+        return self.make_match(ma_no=ma_no)
+
+
+MATCHS = {11, 12, 13, 21, 22, 23}
+
+
+@pytest.fixture
+def client(make_match):
+    return StubClient(make_match)
+
+
+def _matchs(resultats):
+    return {item.args[0] for item, resultat in resultats if item.kind == MATCH and not isinstance(resultat, Exception)}
+
+
+def test_crawl_yields_every_match(client):
+    resultats = list(CompetitionCrawler(client, max_workers=2).crawl(423015))
+    assert _matchs(resultats) == MATCHS
+    # Phases listées par la compétition : aucune phase n'est devinée
+    assert [r for r in client.requests if r[0] == "poules"] == [("poules", 423015, 1)]
+
+
+def test_unlisted_phases_are_probed(client):
+    client.listed = False
+    list(CompetitionCrawler(client, max_workers=2).crawl(423015))
+    assert [r for r in client.requests if r[0] == "poules"] == [("poules", 423015, 1), ("poules", 423015, 2)]
+
+
+def test_phase_probing_is_capped(client):
+    client.listed = False
+    client.phases = lambda phase: True
+    list(CompetitionCrawler(client, max_workers=2).crawl(423015))
+    phases = sorted(r[2] for r in client.requests if r[0] == "poules")
+    assert phases == list(range(1, MAX_PROBED_PHASES + 1))
+
+
+def test_resume_after_consumer_exception(client, tmp_path):
+    chemin = str(tmp_path / "frontier.sqlite")
+    crawler = CompetitionCrawler(client, max_workers=2)
+
+    frontier = SQLiteFrontier(chemin, checkpoint_every=1)
+    parcours = crawler.crawl(423015, frontier=frontier)
+    vus = []
+    with pytest.raises(RuntimeError):
+        for item, resultat in parcours:
+            vus.append((item, resultat))
+            if item.kind == MATCH:
+                echec = item
+                raise RuntimeError("traitement interrompu")
+    parcours.close()
+    frontier.close()
+
+    # Le match dont le traitement a échoué n'est pas marqué terminé
+    with SQLiteFrontier(chemin) as frontier:
+        reprise = list(crawler.crawl(frontier=frontier))
+    assert echec in [item for item, _ in reprise]
+    assert _matchs(vus[:-1]) | _matchs(reprise) == MATCHS
+    assert not _matchs(vus[:-1]) & _matchs(reprise)
+
+    with SQLiteFrontier(chemin) as frontier:
+        assert list(crawler.crawl(423015, frontier=frontier)) == []
+
+
+def test_failed_fetch_is_retried_on_resume(client, tmp_path):
+    chemin = str(tmp_path / "frontier.sqlite")
+    crawler = CompetitionCrawler(client, max_workers=2)
+    client.errors.add(22)
+
+    with SQLiteFrontier(chemin) as frontier:
+        assert _matchs(crawler.crawl(423015, frontier=frontier)) == MATCHS - {22}
+
+    client.errors.clear()
+    with SQLiteFrontier(chemin) as frontier:
+        assert [item.args for item, _ in crawler.crawl(frontier=frontier)] == [(22,)]
@@ -0,0 +1,53 @@
+"""Conversions de dates de l'API"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from fffdata.dates import (
+    PARIS, datetime_array, kickoff_array, parse_datetime, parse_kickoff, sort_by_kickoff,
+)
+
+
+def test_parse_kickoff():
+    assert parse_kickoff("2024-03-17T00:00:00+00:00", "15H00") == datetime(2024, 3, 17, 15, 0, tzinfo=PARIS)
+    assert parse_kickoff("2024-03-17", "20h45") == datetime(2024, 3, 17, 20, 45, tzinfo=PARIS)
+    # Heure absente ou invalide : minuit
+    for heure in (None, "", "25H00", "15H75", "XX"):
+        assert parse_kickoff("2024-03-17", heure) == datetime(2024, 3, 17, tzinfo=PARIS)
+    assert parse_kickoff(None, "15H00") is None
+    assert parse_kickoff("17/03/2024", "15H00") is None
+
+
+def test_parse_datetime():
+    moment = parse_datetime("2024-03-12T09:41:17+00:00")
+    assert moment.tzinfo is PARIS and moment.hour == 10
+    assert parse_datetime("2024-07-01T12:00:00Z") == datetime(2024, 7, 1, 12, tzinfo=timezone.utc)
+    assert parse_datetime("2024-03-12T09:41:17") == datetime(2024, 3, 12, 9, 41, 17, tzinfo=PARIS)
+    assert parse_datetime("") is None and parse_datetime("hier") is None
+
+
+def test_match_accessors(make_match):
+    match = make_match(external_updated_at="2024-03-12T09:41:17+00:00")
+    assert match.kickoff == datetime(2024, 3, 17, 15, 0, tzinfo=PARIS)
+    assert match.updated_at == datetime(2024, 3, 12, 9, 41, 17, tzinfo=timezone.utc)
+
+
+def test_sort_by_kickoff(make_match):
+    matchs = [
+        make_match(ma_no=1, date="2024-03-24T00:00:00+00:00"),
+        make_match(ma_no=2, date=None),
+        make_match(ma_no=3, date="2024-03-10T00:00:00+00:00"),
+    ]
+    assert [m.ma_no for m in sort_by_kickoff(matchs)] == [3, 1, 2]
+    assert [m.ma_no for m in sort_by_kickoff(matchs, reverse=True)] == [1, 3, 2]
+
+
+def test_arrays():
+    np = pytest.importorskip("numpy")
+    kickoffs = kickoff_array(["2024-03-17", None, "2024-03-17"], ["15H00", "15H00", "15H00"])
+    assert kickoffs.dtype == np.dtype("datetime64[s]")
+    # 15h00 à Paris, heure d'hiver : 14h00 UTC
+    assert kickoffs[0] == np.datetime64("2024-03-17T14:00:00") == kickoffs[2]
+    assert np.isnat(kickoffs[1])
+    assert datetime_array(["2024-03-12T09:41:17+00:00"])[0] == np.datetime64("2024-03-12T09:41:17")
@@ -0,0 +1,82 @@
+"""Recherches de GeoIndex, comparées à un parcours linéaire"""
+
+import random
+import time
+
+import pytest
+
+from fffdata.geo import CLUB, TERRAIN, GeoIndex, haversine
+
+
+def _points(n=600, graine=0):
+    rng = random.Random(graine)
+    points = []
+    for numero in range(n):
+        lat, lon = rng.uniform(-90, 90), rng.uniform(-180, 180)
+        if numero % 4 == 0:
+            lat, lon = rng.uniform(42, 51), rng.uniform(-5, 8)  # France métropolitaine
+        elif numero % 4 == 1:
+            lon = rng.choice((-1, 1)) * rng.uniform(179, 180)  # Antiméridien
+        points.append(((CLUB if numero % 2 else TERRAIN, numero), lat, lon))
+    return points
+
+
+def _brute(points, lat, lon, kind=None):
+    return sorted(
+        (haversine(lat, lon, a, b), key) for key, a, b in points
+        if kind is None or key[0] == kind
+    )
+
+
+@pytest.mark.parametrize("cell_km", [10, 200])
+def test_within_and_nearest_match_brute_force(cell_km):
+    points = _points()
+    index = GeoIndex(cell_km=cell_km)
+    for key, lat, lon in points:
+        index.add(key, lat, lon)
+
+    rng = random.Random(1)
+    for q in range(60):
+        lat, lon = rng.uniform(-90, 90), rng.uniform(-180, 180)
+        if q % 3 == 0:
+            lon = rng.choice((-1, 1)) * rng.uniform(179.5, 180)
+        rayon = rng.choice((20, 300, 3000))
+        k = rng.choice((1, 5, 20))
+        kind = rng.choice((None, CLUB))
+        attendu = _brute(points, lat, lon, kind)
+
+        assert index.within(lat, lon, rayon, kind) == [r for r in attendu if r[0] <= rayon]
+        assert index.nearest(lat, lon, k, kind) == attendu[:k]
+        assert index.nearest(lat, lon, k, kind, max_km=rayon) == [r for r in attendu if r[0] <= rayon][:k]
+
+
+def test_within_crosses_the_antimeridian():
+    index = GeoIndex()
+    index.add((TERRAIN, 1), -17.0, -179.95)
+    assert [key for _, key in index.within(-17.0, 179.95, 20)] == [(TERRAIN, 1)]
+
+
+def test_sparse_far_apart_points_stay_fast():
+    index = GeoIndex()
+    index.add((CLUB, 1), 48.85, 2.35)    # Paris
+    index.add((CLUB, 2), 43.30, 5.37)    # Marseille
+    index.add((TERRAIN, 3), -21.1, 55.5)  # La Réunion
+
+    debut = time.perf_counter()
+    assert [key for _, key in index.nearest(48.85, 2.35, k=2, kind=CLUB)] == [(CLUB, 1), (CLUB, 2)]
+    assert len(index.nearest(48.85, 2.35, k=5)) == 3
+    assert len(index.within(48.85, 2.35, 20000)) == 3
+    assert time.perf_counter() - debut < 0.05
+
+
+def test_remove_and_save_load(tmp_path):
+    index = GeoIndex(cell_km=5)
+    index.add((CLUB, 1), 45.44, 4.39)
+    index.add((CLUB, 2), 45.46, 4.40)
+    assert index.remove((CLUB, 2)) and not index.remove((CLUB, 2))
+
+    chemin = str(tmp_path / "geo.json")
+    index.save(chemin)
+    charge = GeoIndex.load(chemin)
+    assert charge.cell_km == 5 and len(charge) == 1
+    assert charge.nearest(45.44, 4.39, 5) == index.nearest(45.44, 4.39, 5)
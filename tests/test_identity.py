@@ -0,0 +1,46 @@
+"""Partage des sous-entités par IdentityMap"""
+
+from fffdata.models import IdentityMap, Match
+
+
+def test_shared_sub_entities(match_payload):
+    identites = IdentityMap()
+    a = Match.from_dict(match_payload(), context=identites)
+    b = Match.from_dict(match_payload(ma_no=2), context=identites)
+
+    assert a.competition is b.competition and a.competition.cdg is b.competition.cdg
+    assert a.phase is b.phase and a.poule is b.poule
+    assert a.home.club is b.home.club
+    assert identites.hits > 0
+    # Les chaînes répétées sont internées
+    assert a.status_label is b.status_label
+    assert a == Match.from_dict(match_payload())
+
+
+def test_versions_and_scopes_are_not_confused(match_payload):
+    identites = IdentityMap()
+    a = Match.from_dict(match_payload(), context=identites)
+
+    autre_version = match_payload(ma_no=2)
+    autre_version["competition"]["external_updated_at"] = "2024-04-01T00:00:00+00:00"
+    assert Match.from_dict(autre_version, context=identites).competition is not a.competition
+
+    # Même numéro de phase dans une autre compétition : une autre Phase
+    autre_competition = match_payload(ma_no=3)
+    autre_competition["competition"]["cp_no"] = 1
+    assert Match.from_dict(autre_competition, context=identites).phase is not a.phase
+
+    # Sans identifiant, une entité n'est pas partagée
+    sans_id = match_payload(ma_no=4)
+    sans_id["competition"] = {"name": "Régional 1"}
+    assert Match.from_dict(sans_id, context=identites).competition is not a.competition
+
+
+def test_lazy_models_share_through_context(match_payload):
+    identites = IdentityMap()
+    a = Match.from_dict(match_payload(), lazy=True, context=identites)
+    b = Match.from_dict(match_payload(ma_no=2), lazy=True, context=identites)
+    assert a.competition is b.competition
+
+    identites.clear()
+    assert len(identites) == 0
@@ -0,0 +1,35 @@
+"""Hydratation paresseuse de LazyMatch"""
+
+from fffdata.models import IdentityMap, LazyMatch, Match
+from fffdata.models.schema import schema
+
+
+def test_scalars_first_then_cached_sub_objects(match_payload):
+    match = Match.from_dict(match_payload(), lazy=True)
+    assert isinstance(match, LazyMatch) and isinstance(match, Match)
+    assert (match.ma_no, match.home_score, match.away_score) == (28541157, 2, 1)
+
+    home = match.home
+    assert home.short_name == "AS Saint Etienne"
+    assert match.home is home
+    assert match._raw is not None
+
+
+def test_raw_data_released_once_fully_hydrated(match_payload):
+    match = Match.from_dict(match_payload(), lazy=True, context=IdentityMap())
+    noms = list(schema(Match).nested)
+    for nom in noms[:-1]:
+        getattr(match, nom)
+    assert match._raw is not None
+    # Un sous-objet affecté compte comme construit
+    setattr(match, noms[-1], getattr(Match.from_dict(match_payload()), noms[-1]))
+    assert match._raw is None and match._context is None
+
+    assert match == Match.from_dict(match_payload())
+    match.home = None
+    assert match.home is None
+
+
+def test_equal_to_eager_model(match_payload):
+    assert Match.from_dict(match_payload(), lazy=True) == Match.from_dict(match_payload())
+    assert Match.from_dict(match_payload(ma_no=1), lazy=True) != Match.from_dict(match_payload())
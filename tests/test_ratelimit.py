@@ -0,0 +1,26 @@
+"""RateLimiter partagé entre asyncio et SQLite"""
+
+import asyncio
+import threading
+
+from fffdata.ratelimit import RateLimiter
+
+
+def test_sqlite_reservation_runs_off_the_event_loop(tmp_path):
+    limiter = RateLimiter(rate=1000, path=str(tmp_path / "rate.sqlite"))
+    threads = []
+    reserve = limiter._buckets.reserve
+
+    def espion(buckets):
+        threads.append(threading.get_ident())
+        return reserve(buckets)
+
+    limiter._buckets.reserve = espion
+
+    async def main():
+        await asyncio.gather(*(limiter.acquire_async("/api/clubs/1.json") for _ in range(4)))
+        return threading.get_ident()
+
+    boucle = asyncio.run(main())
+    assert len(threads) == 4
+    assert boucle not in threads
@@ -0,0 +1,88 @@
+"""Nouvelles tentatives de RetryPolicy et de FFFClient"""
+
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+from fffdata import FFFClient
+from fffdata.exceptions import APIConnectionError, FFFAPIError
+from fffdata.retry import RetryPolicy, parse_retry_after
+
+
+def test_backoff_is_bounded_full_jitter():
+    random.seed(0)
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=4)
+    for attempt in range(8):
+        delais = [policy.backoff(attempt) for _ in range(200)]
+        plafond = min(4, 0.5 * 2 ** attempt)
+        assert all(0 <= d <= plafond for d in delais)
+        assert max(delais) > plafond / 2
+
+
+def test_next_delay_attempts_budget_and_retry_after():
+    policy = RetryPolicy(max_attempts=3, budget=10)
+    assert policy.next_delay(0, 0, 503, "2") == 2.0
+    assert policy.next_delay(1, 0, 429, "3") == 3.0
+    assert policy.next_delay(2, 0, 503, "2") is None       # Tentatives épuisées
+    assert policy.next_delay(0, 9, 503, "2") is None       # Budget dépassé
+    assert policy.next_delay(0, 0, 500, "9999") <= 0.5     # Retry-After ignoré hors 429/503
+    assert RetryPolicy(respect_retry_after=False).next_delay(0, 0, 503, "20") <= 0.5
+
+    assert policy.is_retryable("get", 502) and policy.is_retryable("GET", None)
+    assert not policy.is_retryable("POST", 503) and not policy.is_retryable("GET", 400)
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(" 120 ") == 120.0
+    assert parse_retry_after("-5") == 0.0
+    dans_une_minute = datetime.now(timezone.utc) + timedelta(seconds=60)
+    assert 55 < parse_retry_after(format_datetime(dans_une_minute, usegmt=True)) <= 60
+    assert parse_retry_after("bientôt") is None
+
+
+@pytest.fixture
+def client(transport, monkeypatch):
+    client = FFFClient(retry=RetryPolicy(max_attempts=3, budget=None))
+    client.session.mount("https://", transport)
+    client.sleeps = []
+    monkeypatch.setattr("fffdata.client.time.sleep", client.sleeps.append)
+    yield client
+    client.close()
+
+
+def test_client_retries_transient_errors(client, transport):
+    transport.reply(503, headers={"Retry-After": "7"})
+    transport.fail(requests.exceptions.ConnectionError())
+    transport.reply(200, {"cp_no": 423015})
+    assert client.get_competition(423015) == {"cp_no": 423015}
+    assert len(transport.requests) == 3
+    assert client.sleeps[0] == 7.0 and len(client.sleeps) == 2
+
+
+def test_client_gives_up_after_max_attempts(client, transport):
+    for _ in range(3):
+        transport.reply(500)
+    with pytest.raises(FFFAPIError):
+        client.get_competition(423015)
+    assert len(transport.requests) == 3
+
+    # Politique propre à l'appel : aucune nouvelle tentative
+    transport.fail(requests.exceptions.Timeout())
+    with pytest.raises(APIConnectionError):
+        client._request("GET", "/api/competitions/423015.json", retry=RetryPolicy(max_attempts=1))
+    assert len(transport.requests) == 4
+
+
+def test_non_retryable_errors_are_raised_at_once(client, transport):
+    transport.reply(400)
+    with pytest.raises(FFFAPIError):
+        client.get_competition(423015)
+    transport.reply(503)
+    with pytest.raises(FFFAPIError):
+        client._request("POST", "/api/competitions/423015.json")
+    assert len(transport.requests) == 2 and client.sleeps == []
@@ -0,0 +1,61 @@
+"""from_dict générés et projections"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from fffdata.models import Club, Match, projection
+from fffdata.models.schema import schema
+
+BENCHMARKS = Path(__file__).resolve().parents[1] / "benchmarks"
+sys.path.insert(0, str(BENCHMARKS))
+
+import legacy_parsers  # noqa: E402
+
+
+def _payloads():
+    with open(BENCHMARKS / "data" / "match_entities.jsonl", "rb") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_generated_from_dict_matches_handwritten_parsers():
+    for data in _payloads():
+        assert Match.from_dict(data) == legacy_parsers.match(data)
+    # Clés absentes : mêmes valeurs par défaut
+    assert Match.from_dict({}) == legacy_parsers.match({})
+    assert Club.from_dict({}) == legacy_parsers.club({})
+    partiel = {"ma_no": 1, "home": {}, "terrain": {}, "match_membres": []}
+    assert Match.from_dict(partiel) == legacy_parsers.match(partiel)
+
+
+def test_default_rules():
+    match = Match.from_dict({})
+    assert match.home_score == 0 and match.status == "" and match.home_nb_point is None
+    # Sous-objet obligatoire construit à partir de {}, facultatif absent : None
+    assert match.competition.cp_no is None and match.terrain is None
+    assert match.match_membres == []
+    assert "def parse(cls, data, context=None):" in schema(Match).source
+
+
+def test_projection(match_payload):
+    data = match_payload()
+    ticker = projection(Match, ("ma_no", "home_score", "home.short_name", "competition.cdg.name", "terrain"))
+    record = ticker(data)
+    match = Match.from_dict(data)
+    assert type(record).__name__ == "MatchRecord"
+    assert record == (match.ma_no, match.home_score, match.home.short_name,
+                      match.competition.cdg.name, match.terrain)
+    assert record.home_short_name == "AS Saint Etienne"
+    assert projection(Match, ("ma_no", "home_score", "home.short_name", "competition.cdg.name", "terrain")) is ticker
+
+    # Sous-objet facultatif absent sur le chemin : None
+    assert projection(Match, ("terrain.name",))({}) == (None,)
+    assert projection(Match, ("competition.name",))({}) == ("",)
+
+
+@pytest.mark.parametrize("champs", [(), ("inconnu",), ("ma_no.x",), ("match_membres.po_cod",)])
+def test_invalid_projection(champs):
+    with pytest.raises(ValueError):
+        projection(Match, champs)
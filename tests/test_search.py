@@ -0,0 +1,57 @@
+"""Recherche par nom de SearchIndex"""
+
+import random
+import time
+
+from fffdata.search import CLUB, MAX_CANDIDATES, SearchIndex
+
+
+def _index(n=0, graine=0):
+    index = SearchIndex()
+    index.add((CLUB, 500100), "Association Sportive de Saint-Étienne", "AS Saint-Étienne")
+    index.add((CLUB, 500200), "Olympique Lyonnais", "OL")
+    rng = random.Random(graine)
+    syllabes = ["mont", "ville", "saint", "bourg", "la", "val", "ber", "cha", "teau", "ro", "mar", "sur"]
+    for cl_no in range(1, n + 1):
+        ville = "".join(rng.choice(syllabes) for _ in range(rng.randint(2, 4)))
+        index.add((CLUB, cl_no), f"{rng.choice(['AS', 'FC', 'Stade', 'US'])} {ville}")
+    return index
+
+
+def test_exact_acronym_and_typo():
+    index = _index(2000)
+    for requete in ("AS St Etienne", "ASSE", "AS Saint Etiene", "as saint-eti"):
+        assert index.search(requete)[0][1] == (CLUB, 500100), requete
+    assert index.search("Olympique Lyonais")[0][1] == (CLUB, 500200)
+
+
+def test_prefix_autocompletion():
+    index = _index()
+    assert index.prefix("olymp") == [(CLUB, 500200)]
+    assert index.prefix("as saint") == [(CLUB, 500100)]
+    assert index.prefix("zzz") == []
+
+
+def test_common_words_stay_bounded():
+    index = _index(15000)
+    debut = time.perf_counter()
+    for requete in ("as", "stade", "fc mont", "a"):
+        resultats = index.search(requete)
+        assert 0 < len(resultats) <= 10
+    assert len(index.prefix("s", limit=MAX_CANDIDATES + 50)) == MAX_CANDIDATES + 50
+    # Quelques millisecondes au plus, contre plusieurs dizaines sans borne
+    assert time.perf_counter() - debut < 0.25
+
+
+def test_remove_and_save_load(tmp_path):
+    index = _index(200)
+    assert index.remove((CLUB, 500200)) and not index.remove((CLUB, 500200))
+    assert (CLUB, 500200) not in index
+    assert all(key != (CLUB, 500200) for _, key in index.search("Olympique Lyonnais"))
+
+    chemin = str(tmp_path / "search.json")
+    index.save(chemin)
+    charge = SearchIndex.load(chemin)
+    assert len(charge) == len(index)
+    for requete in ("ASSE", "AS Saint Etiene", "stade mont"):
+        assert charge.search(requete) == index.search(requete)
@@ -0,0 +1,39 @@
+"""Encodage binaire, pickle et to_dict des modèles"""
+
+import pickle
+
+import pytest
+
+from fffdata.models import LazyMatch, Match
+from fffdata.serialization import dumps, dumps_many, loads, loads_many, msgpack
+
+FORMATS = ["marshal"] + (["msgpack"] if msgpack is not None else [])
+
+
+@pytest.mark.parametrize("format", FORMATS)
+def test_round_trip(make_match, format):
+    match = make_match()
+    assert loads(dumps(match, format)) == match
+    assert loads_many(dumps_many([match, make_match(ma_no=2)], format)) == [match, make_match(ma_no=2)]
+    assert loads_many(dumps_many([], format)) == []
+
+
+def test_pickle_and_to_dict(make_match, match_payload):
+    match = make_match()
+    assert pickle.loads(pickle.dumps(match)) == match
+    assert Match.from_dict(match.to_dict()) == match
+    # Un modèle paresseux est restauré sous sa classe de base, hydraté
+    lazy = LazyMatch.from_raw(match_payload())
+    restaure = pickle.loads(pickle.dumps(lazy))
+    assert type(restaure) is Match and restaure == match
+
+
+def test_dumps_many_checks_every_type(make_match, match_payload):
+    lazy = LazyMatch.from_raw(match_payload(ma_no=2))
+    assert loads_many(dumps_many([make_match(), lazy])) == [make_match(), make_match(ma_no=2)]
+
+    match = make_match()
+    with pytest.raises(TypeError, match="objet 1 est un Competition"):
+        dumps_many([match, match.competition])
+    with pytest.raises(TypeError):
+        dumps_many([match, {"ma_no": 1}])
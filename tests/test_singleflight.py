@@ -0,0 +1,59 @@
+"""Regroupement des appels concurrents de SingleFlight"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fffdata.singleflight import SingleFlight
+
+
+def _concurrent(flight, key, fn, n=8):
+    """Lance n appels de la même clé pendant que le premier est bloqué"""
+    libere = threading.Event()
+    appels = []
+
+    def lent():
+        appels.append(1)
+        libere.wait(5)
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=n) as executor:
+        futures = [executor.submit(flight.do, key, lent) for _ in range(n)]
+        while flight.in_flight() == 0:
+            time.sleep(0.001)
+        # Laisse aux autres appelants le temps de rejoindre l'appel en cours
+        time.sleep(0.1)
+        libere.set()
+        return appels, [f.exception() or f.result() for f in futures]
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    resultat = object()
+    appels, resultats = _concurrent(flight, "cle", lambda: resultat)
+    assert len(appels) == 1
+    assert all(r is resultat for r in resultats)
+    assert flight.in_flight() == 0
+
+
+def test_exception_is_shared_then_key_released():
+    flight = SingleFlight()
+    erreur = RuntimeError("boom")
+
+    def echoue():
+        raise erreur
+
+    appels, resultats = _concurrent(flight, "cle", echoue)
+    assert len(appels) == 1 and all(r is erreur for r in resultats)
+
+    # Rien n'est mis en cache : l'appel suivant s'exécute à nouveau
+    assert flight.do("cle", lambda: 42) == 42
+    with pytest.raises(RuntimeError):
+        flight.do("cle", echoue)
+
+
+def test_different_keys_run_separately():
+    flight = SingleFlight()
+    assert [flight.do(k, lambda k=k: k * 2) for k in (1, 2, 3)] == [2, 4, 6]
@@ -0,0 +1,27 @@
+"""Modèles à __slots__"""
+
+import weakref
+
+import pytest
+
+from fffdata.models import Club, LazyMatch, Match, Terrain
+
+
+def test_no_instance_dict_but_weak_references(make_match, match_payload):
+    match = make_match()
+    lazy = LazyMatch.from_raw(match_payload())
+    terrain = Terrain(te_no=1, name="Stade")
+    for obj in (match, match.home, lazy, terrain):
+        assert not hasattr(obj, "__dict__")
+        assert weakref.ref(obj)() is obj
+
+    cache = weakref.WeakValueDictionary({match.ma_no: match})
+    del match
+    assert 28541157 not in cache
+
+
+def test_slots_keep_defaults_and_reject_unknown_attributes():
+    club = Club(cl_no=1, name="AS Test", short_name="AST", location="Test", affiliation_number=1)
+    assert club.contacts == [] and club.district is None
+    with pytest.raises(AttributeError):
+        club.inconnu = 1
@@ -0,0 +1,90 @@
+"""Forfaits et départages de Standings"""
+
+import pytest
+
+from fffdata.models import Match
+from fffdata.standings import Standings
+
+
+@pytest.fixture
+def result(match_payload):
+    """Fabrique de résultats terminés entre clubs (points et buts contre déduits du score)"""
+    numeros = iter(range(1, 1000))
+
+    def fabrique(home, away, home_score, away_score, home_forfeit="N", away_forfeit="N", ma_no=None, **champs):
+        data = match_payload(
+            ma_no=ma_no or next(numeros),
+            status="A",
+            home_score=home_score,
+            away_score=away_score,
+            home_nb_point=None,
+            away_nb_point=None,
+            home_but_contre=None,
+            away_but_contre=None,
+            home_is_forfeit=home_forfeit,
+            away_is_forfeit=away_forfeit,
+        )
+        data.update(champs)
+        for cote, cl_no in (("home", home), ("away", away)):
+            data[cote]["club"]["cl_no"] = cl_no
+            data[cote]["number"] = 1
+            data[cote]["short_name"] = f"Club {cl_no}"
+        return Match.from_dict(data)
+
+    return fabrique
+
+
+def test_single_forfeit(result):
+    standings = Standings()
+    standings.add(result(1, 2, 0, 0, away_forfeit="O"))
+
+    home, away = standings["1-1"], standings["2-1"]
+    assert (home.won, home.drawn, home.lost, home.forfeits, home.points) == (1, 0, 0, 0, 3)
+    assert (away.won, away.drawn, away.lost, away.forfeits, away.points) == (0, 0, 1, 1, -1)
+
+
+def test_double_forfeit_is_a_loss_for_both(result):
+    standings = Standings()
+    standings.add(result(1, 2, 0, 0, home_forfeit="O", away_forfeit="O"))
+
+    for team in ("1-1", "2-1"):
+        row = standings[team]
+        assert (row.won, row.drawn, row.lost, row.forfeits, row.points) == (0, 0, 1, 1, -1)
+
+
+def test_head_to_head_before_goal_difference(result):
+    matchs = [result(1, 2, 1, 0), result(2, 3, 6, 0)]
+
+    standings = Standings()
+    standings.add_all(matchs)
+    assert [row.team for row in standings.table()] == ["1-1", "2-1", "3-1"]
+
+    standings = Standings(tie_breakers=("points", "goal_difference"))
+    standings.add_all(matchs)
+    assert [row.team for row in standings.table()] == ["2-1", "1-1", "3-1"]
+
+
+def test_unresolved_tie_shares_rank(result):
+    standings = Standings()
+    standings.add(result(1, 2, 1, 1))
+    assert [row.rank for row in standings.table()] == [1, 1]
+
+
+def test_corrected_result_replaces_previous(result):
+    standings = Standings()
+    standings.add(result(1, 2, 1, 0, ma_no=7))
+    standings.add(result(1, 2, 0, 2, ma_no=7))
+
+    home = standings["1-1"]
+    assert (home.played, home.won, home.lost, home.goals_for, home.goals_against) == (1, 0, 1, 0, 2)
+    assert standings.table()[0].team == "2-1"
+
+
+def test_goals_against_from_but_contre(result):
+    standings = Standings()
+    # but_contre fourni par l'API, y compris 0 (ex: buts annulés sur tapis vert)
+    standings.add(result(1, 2, 0, 3, home_but_contre=0, away_but_contre=None))
+    assert standings["1-1"].goals_against == 0
+    assert standings["2-1"].goals_against == 0
+    standings.add(result(1, 2, 1, 2, ma_no=8, home_but_contre=5))
+    assert standings["1-1"].goals_against == 5
@@ -0,0 +1,61 @@
+"""Aller-retour et requêtes d'EntityStore"""
+
+import pytest
+
+from fffdata.models import Club, Match
+from fffdata.store import EntityStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = EntityStore(str(tmp_path / "store.sqlite"))
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def matchs(make_match):
+    return [
+        make_match(),
+        make_match(ma_no=2, date="2024-03-24T00:00:00+00:00", status="E", home_score=None, away_score=None),
+        make_match(ma_no=3, date="2024-03-10T00:00:00+00:00"),
+    ]
+
+
+def test_match_round_trip(store, matchs):
+    assert store.upsert_matches(matchs) == 3
+    for match in matchs:
+        assert store.get_match(match.ma_no) == match
+    assert store.get_match(404) is None
+
+    # Un upsert remplace le match sans dupliquer les entités partagées
+    corrige = Match.from_dict({**matchs[0].to_dict(), "home_score": 4})
+    store.upsert_matches([corrige])
+    assert store.get_match(corrige.ma_no).home_score == 4
+    assert (store.count("matches"), store.count("club_infos"), store.count("competitions")) == (3, 2, 1)
+
+
+def test_match_queries(store, matchs):
+    store.upsert_matches(matchs)
+    assert [m.ma_no for m in store.matches(club=500100, season=2024)] == [3, 28541157, 2]
+    assert [m.ma_no for m in store.matches(club=500200, status="A")] == [3, 28541157]
+    assert [m.ma_no for m in store.matches(cp_no=423015, since="2024-03-17", until="2024-03-24")] == [28541157, 2]
+    assert [m.ma_no for m in store.matches(club=500100, limit=1)] == [3]
+    assert store.matches(club=1) == [] and store.matches(season=2023) == []
+    assert [c.cp_no for c in store.competitions(2024)] == [423015]
+
+    assert store.delete_match(2) and not store.delete_match(2)
+    assert store.get_match(2) is None
+
+
+def test_club_round_trip(store):
+    club = Club.from_dict({
+        "cl_no": 500100, "name": "Association Sportive de Saint-Étienne", "short_name": "AS Saint-Étienne",
+        "location": "Saint-Étienne", "affiliation_number": 500100, "latitude": 45.46, "longitude": 4.39,
+        "district": {"cg_no": 42, "name": "District de la Loire", "short_name": "Loire", "type_label": "District"},
+        "contacts": [{"type": "tel", "type_label": "Téléphone", "value": "04 77 00 00 00"}],
+        "terrains": [{"te_no": 1, "name": "Stade Geoffroy-Guichard", "latitude": 45.46, "longitude": 4.39}],
+    })
+    assert store.upsert_clubs([club]) == 1
+    assert store.get_club(500100) == club
+    assert store.get_club(1) is None
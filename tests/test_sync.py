@@ -0,0 +1,165 @@
+"""Classement des changements de DeltaSync"""
+
+import sqlite3
+
+import pytest
+
+from fffdata.endpoints import FFFEndpoints
+from fffdata.sync import DeltaSync, SyncState
+
+
+class StubClient:
+    """Client minimal : une compétition, une phase, une poule"""
+
+    def __init__(self, make_match):
+        self.make_match = make_match
+        self.entries = {}
+        self.matches = {}
+        self.errors = set()
+        self.fetched = []
+        self.invalidated = []
+
+    def publish(self, ma_no, **champs):
+        champs.setdefault("status", "E")
+        champs.setdefault("external_updated_at", "2024-03-17T10:00:00+00:00")
+        self.entries[ma_no] = dict(champs, ma_no=ma_no)
+        self.matches[ma_no] = self.make_match(ma_no=ma_no, **champs)
+
+    def unpublish(self, ma_no):
+        del self.entries[ma_no]
+        del self.matches[ma_no]
+
+    def invalidate(self, endpoint):
+        self.invalidated.append(endpoint)
+
+    def get_competition(self, cp_no):
+        return {"cp_no": cp_no, "phases": [{"number": 1}]}
+
+    def get_competition_poules(self, cp_no, phase=1):
+        return [{"stage_number": 1}] if phase == 1 else None
+
+    def get_competition_calendrier(self, cp_no, phase=1, poule=1):
+        return list(self.entries.values()) if cp_no == 423015 else []
+
+    def get_matches_bulk(self, numeros, max_workers=8):
+        for ma_no in numeros:
+            self.fetched.append(ma_no)
+            if ma_no in self.errors:
+                yield ma_no, RuntimeError("boom")
+            else:
+                yield ma_no, self.matches.get(ma_no)
+
+
+@pytest.fixture
+def client(make_match):
+    client = StubClient(make_match)
+    for ma_no in (1, 2, 3):
+        client.publish(ma_no, home_score=1, away_score=0)
+    return client
+
+
+@pytest.fixture
+def sync(client, tmp_path):
+    state = SyncState(str(tmp_path / "sync.sqlite"))
+    yield DeltaSync(client, state, max_workers=2)
+    state.close()
+
+
+def test_first_sync_adds_everything_then_skips(client, sync):
+    changes = sync.sync(423015)
+    assert sorted(m.ma_no for m in changes.added) == [1, 2, 3]
+    assert not changes.updated and not changes.removed
+
+    client.fetched.clear()
+    changes = sync.sync(423015)
+    assert not changes
+    assert changes.skipped == 3
+    assert client.fetched == []
+
+
+def test_corrected_score_is_an_update(client, sync):
+    sync.sync(423015)
+    # Même horodatage et même statut : seul le score change
+    client.publish(2, home_score=5, away_score=0)
+
+    changes = sync.sync(423015)
+    assert [m.ma_no for m in changes.updated] == [2]
+    assert changes.updated[0].home_score == 5
+    assert not changes.added and changes.skipped == 2
+
+    assert not sync.sync(423015)
+
+
+def test_rescheduled_match_is_an_update(client, sync):
+    sync.sync(423015)
+    client.publish(3, home_score=1, away_score=0, date="2024-04-21T00:00:00+00:00")
+
+    changes = sync.sync(423015)
+    assert [m.ma_no for m in changes.updated] == [3]
+
+
+def test_removed_and_new_matches(client, sync):
+    sync.sync(423015)
+    client.unpublish(1)
+    client.publish(4)
+
+    changes = sync.sync(423015)
+    assert changes.removed == [1]
+    assert [m.ma_no for m in changes.added] == [4]
+
+
+def test_failed_fetch_is_retried_next_time(client, sync):
+    client.errors.add(2)
+    changes = sync.sync(423015)
+    assert sorted(m.ma_no for m in changes.added) == [1, 3]
+    assert len(changes.errors) == 1
+
+    client.errors.clear()
+    changes = sync.sync(423015)
+    assert [m.ma_no for m in changes.added] == [2]
+
+
+def test_refetched_identical_match_is_skipped(client, sync):
+    sync.sync(423015)
+    # L'entrée de calendrier change, pas le match
+    client.entries[1]["external_updated_at"] = "2024-03-18T08:00:00+00:00"
+
+    client.fetched.clear()
+    changes = sync.sync(423015)
+    assert client.fetched == [1]
+    assert not changes and changes.skipped == 3
+
+
+def test_only_requested_routes_are_invalidated(client, sync):
+    routes = [
+        FFFEndpoints.competition(423015),
+        FFFEndpoints.competition_poules(423015, 1),
+        FFFEndpoints.competition_calendrier(423015, 1, 1),
+    ]
+    # Dès la première synchronisation
+    sync.sync(423015)
+    assert [e for e in client.invalidated if e in routes] == routes
+
+    client.invalidated.clear()
+    sync.sync(423016)
+    assert not set(routes) & set(client.invalidated)
+    assert FFFEndpoints.competition_calendrier(423016, 1, 1) in client.invalidated
+
+
+def test_state_from_previous_version_is_migrated(client, tmp_path):
+    chemin = str(tmp_path / "sync.sqlite")
+    ancienne = sqlite3.connect(chemin)
+    ancienne.executescript("""
+        CREATE TABLE matches (ma_no INTEGER PRIMARY KEY, cp_no INTEGER NOT NULL,
+                              listing TEXT NOT NULL, updated_at TEXT, status TEXT);
+        INSERT INTO matches VALUES (1, 423015, '[]', NULL, 'E');
+    """)
+    ancienne.close()
+
+    state = SyncState(chemin)
+    try:
+        changes = DeltaSync(client, state).sync(423015)
+        assert [m.ma_no for m in changes.updated] == [1]
+        assert not DeltaSync(client, state).sync(423015)
+    finally:
+        state.close()
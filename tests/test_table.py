@@ -0,0 +1,36 @@
+"""Filtres et construction de MatchTable"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fffdata.models import Match  # noqa: E402
+from fffdata.table import MatchTable  # noqa: E402
+
+
+@pytest.fixture
+def payloads(match_payload):
+    sans_score = match_payload(ma_no=2, status="E")
+    del sans_score["home_score"], sans_score["away_score"]
+    return [
+        match_payload(ma_no=1, status=None),
+        sans_score,
+        match_payload(ma_no=3, status="E", home_score=None, away_score=None),
+    ]
+
+
+def test_unknown_status_selects_nothing(payloads):
+    table = MatchTable.from_payloads(payloads)
+    assert len(table.status("ZZ")) == 0
+    assert list(table.status("E", "ZZ")["ma_no"]) == [2, 3]
+    # Aucun match terminé ("A") : le statut null ne doit pas être pris pour lui
+    assert len(table.finished()) == 0
+
+
+def test_payloads_and_matches_build_the_same_table(payloads):
+    depuis_json = MatchTable.from_payloads(payloads)
+    depuis_modeles = MatchTable.from_matches(Match.from_dict(p) for p in payloads)
+    assert depuis_json.columns == depuis_modeles.columns
+    for name in depuis_json.columns:
+        np.testing.assert_array_equal(depuis_json[name], depuis_modeles[name])
+    assert list(depuis_json["home_score"]) == [2, 0, -1]
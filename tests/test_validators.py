@@ -0,0 +1,62 @@
+"""Revalidation ETag / Last-Modified de FFFClient"""
+
+import pytest
+
+from fffdata import FFFClient
+from fffdata.cache import ValidatorCache
+from fffdata.endpoints import FFFEndpoints
+
+
+@pytest.fixture
+def client(transport):
+    client = FFFClient(revalidate=True)
+    client.session.mount("https://", transport)
+    yield client
+    client.close()
+
+
+def test_not_modified_returns_the_parsed_model(client, transport, match_payload):
+    transport.reply(200, match_payload(), {"ETag": '"v1"', "Last-Modified": "Tue, 12 Mar 2024 09:41:17 GMT"})
+    match = client.get_match_entities(28541157)
+    assert "If-None-Match" not in transport.requests[0].headers
+
+    transport.reply(304)
+    assert client.get_match_entities(28541157) is match
+    conditionnelle = transport.requests[1].headers
+    assert conditionnelle["If-None-Match"] == '"v1"'
+    assert conditionnelle["If-Modified-Since"] == "Tue, 12 Mar 2024 09:41:17 GMT"
+
+    # Nouvelle version : nouveaux validateurs et nouveau modèle
+    transport.reply(200, match_payload(home_score=5), {"ETag": '"v2"'})
+    assert client.get_match_entities(28541157).home_score == 5
+    transport.reply(304)
+    assert client.get_match_entities(28541157).home_score == 5
+    assert transport.requests[3].headers["If-None-Match"] == '"v2"'
+
+
+def test_missing_validators_and_404_forget_the_resource(client, transport, match_payload):
+    url = client.base_url + FFFEndpoints.match_entities(28541157)
+    transport.reply(200, match_payload(), {"ETag": '"v1"'})
+    client.get_match_entities(28541157)
+    assert client.validators.get(url) is not None
+
+    transport.reply(404)
+    assert client.get_match_entities(28541157) is None
+    assert client.validators.get(url) is None
+
+    transport.reply(200, match_payload())
+    client.get_match_entities(28541157)
+    transport.reply(200, match_payload())
+    client.get_match_entities(28541157)
+    assert "If-None-Match" not in transport.requests[-1].headers
+
+
+def test_validator_cache_is_lru_bounded():
+    cache = ValidatorCache(maxsize=2)
+    for url in ("a", "b"):
+        cache.store(url, {"ETag": url}, url)
+    cache.get("a")
+    cache.store("c", {"ETag": "c"}, "c")
+    assert len(cache) == 2 and cache.get("b") is None
+    assert cache.get("a").value == "a"
+    assert cache.get("c").conditional_headers() == {"If-None-Match": "c"}